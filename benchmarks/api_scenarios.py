@@ -0,0 +1,349 @@
+"""
+Benchmark the planets API with scripted scenarios on a synthetic catalogue.
+
+A throwaway test database is created from ``--settings`` and seeded with
+``--planets`` planets (names, populations and a realistic climate/terrain
+fan-out drawn from ``--seed``), then every scenario sends ``--requests``
+requests through Django's in-process test client. Throughput, latency
+percentiles and SQL queries per request are printed as JSON, so two runs
+can be diffed, e.g.::
+
+    python benchmarks/api_scenarios.py --planets 100000 > before.json
+    python benchmarks/api_scenarios.py --planets 100000 > after.json
+    diff before.json after.json
+
+Scenarios run in the order given (reads first by default, as the write
+scenarios change the catalogue).
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+CLIMATES = [
+    "arid",
+    "temperate",
+    "tropical",
+    "frozen",
+    "murky",
+    "windy",
+    "hot",
+    "frigid",
+    "humid",
+    "moist",
+    "polluted",
+    "superheated",
+    "subarctic",
+    "artificial temperate",
+    "rocky",
+]
+TERRAINS = [
+    "desert",
+    "grasslands",
+    "mountains",
+    "jungle",
+    "rainforests",
+    "tundra",
+    "ice caves",
+    "swamp",
+    "gas giant",
+    "forests",
+    "lakes",
+    "cityscape",
+    "ocean",
+    "rock",
+    "barren",
+    "volcanoes",
+    "plains",
+    "savanna",
+    "canyons",
+    "sinkholes",
+    "caves",
+    "islands",
+    "reefs",
+    "urban",
+    "fields",
+]
+SYLLABLES = [
+    "ta",
+    "too",
+    "ine",
+    "al",
+    "de",
+    "ran",
+    "ya",
+    "vin",
+    "hoth",
+    "da",
+    "go",
+    "bah",
+    "bes",
+    "pin",
+    "en",
+    "dor",
+    "na",
+    "boo",
+    "kas",
+    "shyyk",
+    "mus",
+    "fer",
+    "kes",
+    "sel",
+    "jak",
+    "ku",
+    "cor",
+    "us",
+    "cant",
+]
+# Number of climates / terrains per planet and their weights.
+CLIMATE_FAN_OUT = ([1, 2, 3], [6, 3, 1])
+TERRAIN_FAN_OUT = ([1, 2, 3, 4], [3, 4, 2, 1])
+BULK_SIZE = 100
+
+
+def planet_name(rng, index):
+    words = [
+        "".join(rng.choices(SYLLABLES, k=rng.randint(2, 3))).capitalize()
+        for _ in range(rng.randint(1, 2))
+    ]
+    return f"{' '.join(words)} {index}"
+
+
+def synthetic_planet(rng, index):
+    """A SWAPI-shaped planet payload."""
+    population = None
+    if rng.random() > 0.1:
+        population = str(int(10 ** rng.uniform(3, 12)))
+    return {
+        "name": planet_name(rng, index),
+        "population": population,
+        "climates": rng.sample(CLIMATES, rng.choices(*CLIMATE_FAN_OUT)[0]),
+        "terrains": rng.sample(TERRAINS, rng.choices(*TERRAIN_FAN_OUT)[0]),
+    }
+
+
+def seed_catalogue(size, seed):
+    from planets.services import sync_planets
+
+    rng = random.Random(seed)
+    return sync_planets(synthetic_planet(rng, i) for i in range(size))
+
+
+class Scenarios:
+    """
+    Scripted requests. Each scenario returns ``(method, path, data)`` for
+    request number ``i``.
+    """
+
+    def __init__(self, rng, planet_ids, names, page_size):
+        self.rng = rng
+        self.planet_ids = planet_ids
+        self.names = names
+        self.words = sorted({word for name in names for word in name.split()[:-1]})
+        self.page_size = page_size
+        self.pages = max(1, -(-len(planet_ids) // page_size))
+        self.next_index = len(planet_ids)
+
+    def list(self, i):
+        page = self.rng.randint(1, min(10, self.pages))
+        return "get", f"/api/planets/?page={page}&page_size={self.page_size}", None
+
+    def deep_page(self, i):
+        page = self.rng.randint(max(1, self.pages - 10), self.pages)
+        return "get", f"/api/planets/?page={page}&page_size={self.page_size}", None
+
+    def cursor_page(self, i):
+        return (
+            "get",
+            f"/api/planets/?pagination=cursor&page_size={self.page_size}",
+            None,
+        )
+
+    def search(self, i):
+        word = self.rng.choice(self.words)
+        return "get", f"/api/planets/?search={word[:4]}", None
+
+    def detail(self, i):
+        return "get", f"/api/planets/{self.rng.choice(self.planet_ids)}/", None
+
+    def create(self, i):
+        self.next_index += 1
+        return "post", "/api/planets/", synthetic_planet(self.rng, self.next_index)
+
+    def bulk_sync(self, i):
+        planets = []
+        for name in self.rng.sample(self.names, min(BULK_SIZE, len(self.names))):
+            planet = synthetic_planet(self.rng, 0)
+            planet["name"] = name
+            planets.append(planet)
+        return "post", "/api/planets/bulk/", planets
+
+
+SCENARIOS = [
+    "list",
+    "deep_page",
+    "cursor_page",
+    "search",
+    "detail",
+    "create",
+    "bulk_sync",
+]
+
+
+def summarize(latencies, queries, errors, elapsed, sizes=None):
+    latencies = sorted(latencies)
+
+    def percentile(p):
+        return round(latencies[int(p * (len(latencies) - 1))] * 1000, 3)
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies) * 1000, 3),
+            "p50": percentile(0.50),
+            "p95": percentile(0.95),
+            "p99": percentile(0.99),
+        },
+        "queries_per_request": {
+            "mean": round(statistics.fmean(queries), 2),
+            "max": max(queries),
+        },
+        **({"bytes_per_request": round(statistics.fmean(sizes))} if sizes else {}),
+    }
+
+
+def send(client, method, path, data, headers):
+    if method == "get":
+        return client.get(path, headers=headers)
+    return getattr(client, method)(path, data, format="json", headers=headers)
+
+
+def run_scenario(client, scenario, requests, warmup, headers):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    for i in range(warmup):
+        send(client, *scenario(i), headers)
+
+    latencies, queries, sizes, errors = [], [], [], 0
+    with CaptureQueriesContext(connection) as captured:
+        started = time.perf_counter()
+        for i in range(requests):
+            request = scenario(i)
+            before = len(captured)
+            request_started = time.perf_counter()
+            response = send(client, *request, headers)
+            latencies.append(time.perf_counter() - request_started)
+            queries.append(len(captured) - before)
+            sizes.append(len(response.content))
+            if response.status_code >= 400:
+                errors += 1
+        elapsed = time.perf_counter() - started
+    return summarize(latencies, queries, errors, elapsed, sizes)
+
+
+def run(args):
+    from django.conf import settings
+    from django.contrib.auth.models import User
+    from django.core.cache import cache
+    from django.db import connection
+    from django.test.utils import override_settings
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    from planets.models import Planet
+
+    started = time.perf_counter()
+    seeded = seed_catalogue(args.planets, args.seed)
+    seed_seconds = time.perf_counter() - started
+
+    user = User.objects.create_user(username="benchmark", password="benchmark")
+    token = RefreshToken.for_user(user).access_token
+    headers = {"Accept": args.accept, "Authorization": f"Bearer {token}"}
+    if args.accept_encoding:
+        headers["Accept-Encoding"] = args.accept_encoding
+
+    planets = Planet.objects.order_by("pk").values_list("pk", "name")
+    scenarios = Scenarios(
+        random.Random(args.seed),
+        [pk for pk, _ in planets],
+        [name for _, name in planets],
+        args.page_size,
+    )
+    results = {
+        "planets": args.planets,
+        "seed": args.seed,
+        "database": connection.vendor,
+        "settings": settings.SETTINGS_MODULE,
+        "response_cache": args.response_cache,
+        "requests": args.requests,
+        "page_size": args.page_size,
+        "accept": args.accept,
+        "accept_encoding": args.accept_encoding,
+        "seed_seconds": round(seed_seconds, 2),
+        "seeded": seeded.as_dict(),
+        "scenarios": {},
+    }
+    client = APIClient()
+    with override_settings(RESPONSE_CACHE_ENABLED=args.response_cache):
+        for name in args.scenarios:
+            cache.clear()
+            results["scenarios"][name] = run_scenario(
+                client, getattr(scenarios, name), args.requests, args.warmup, headers
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--planets", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--page-size", type=int, default=30)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument(
+        "--response-cache",
+        action="store_true",
+        help="Keep the response cache on (off by default, so repeated "
+        "requests measure the views rather than cache hits).",
+    )
+    parser.add_argument(
+        "--accept",
+        default="application/json",
+        help="Response format, e.g. application/vnd.planets.compact+json or "
+        "application/msgpack.",
+    )
+    parser.add_argument("--accept-encoding", default="", help="e.g. gzip or br.")
+    parser.add_argument("--settings", default="core.dev_settings")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ["DJANGO_SETTINGS_MODULE"] = args.settings
+
+    import django
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    django.setup()
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, serialize=False)
+    try:
+        results = run(args)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Compare concurrent-connection throughput of the WSGI and ASGI deployments.
+
+Each server is started in turn on a free local port against the configured
+database, then ``--connections`` keep-alive clients request ``--path`` for
+``--duration`` seconds while ``--slow-clients`` connections trickle their
+request headers in, holding a connection open the way slow clients and
+long-polling consumers do. The results are printed as JSON.
+
+Requires gunicorn and uvicorn (``pip install gunicorn uvicorn``) and a
+migrated, seeded database, e.g.::
+
+    python manage.py import_planets planets.ndjson
+    python benchmarks/asgi_vs_wsgi.py --connections 200 --slow-clients 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+SERVERS = {
+    "wsgi": [
+        "gunicorn",
+        "core.wsgi:application",
+        "--workers={workers}",
+        "--threads={threads}",
+        "--bind=127.0.0.1:{port}",
+    ],
+    "asgi": [
+        "uvicorn",
+        "core.asgi:application",
+        "--workers={workers}",
+        "--host=127.0.0.1",
+        "--port={port}",
+        "--no-access-log",
+    ],
+}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server did not start on port {port}")
+
+
+async def read_response(reader):
+    """Read one HTTP/1.1 response with a Content-Length. Returns its status."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split()[1])
+    length = 0
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def client(port, request, deadline, latencies, errors):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status = await read_response(reader)
+            if status == 200:
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors.append(status)
+    except (OSError, asyncio.IncompleteReadError) as e:
+        errors.append(type(e).__name__)
+    finally:
+        writer.close()
+
+
+async def slow_client(port, request, deadline):
+    """Send the request one byte at a time, holding the connection open."""
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    except OSError:
+        return
+    try:
+        for byte in request:
+            if time.monotonic() >= deadline:
+                break
+            writer.write(bytes([byte]))
+            await writer.drain()
+            await asyncio.sleep(0.5)
+    except OSError:
+        pass
+    finally:
+        writer.close()
+
+
+async def run_load(port, path, connections, slow_clients, duration):
+    request = (
+        f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nAccept: application/json\r\n\r\n"
+    ).encode()
+    deadline = time.monotonic() + duration
+    latencies, errors = [], []
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(slow_client(port, request, deadline) for _ in range(slow_clients)),
+        *(
+            client(port, request, deadline, latencies, errors)
+            for _ in range(connections)
+        ),
+    )
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+
+    def percentile(p):
+        if not latencies:
+            return None
+        return round(latencies[int(p * (len(latencies) - 1))] * 1000, 2)
+
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            "mean": (
+                round(statistics.fmean(latencies) * 1000, 2) if latencies else None
+            ),
+            "p50": percentile(0.50),
+            "p95": percentile(0.95),
+            "p99": percentile(0.99),
+        },
+    }
+
+
+def benchmark(kind, args):
+    port = free_port()
+    command = [
+        part.format(port=port, workers=args.workers, threads=args.threads)
+        for part in SERVERS[kind]
+    ]
+    env = {
+        "DJANGO_ALLOWED_HOSTS": "127.0.0.1",
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": args.settings,
+    }
+    server = subprocess.Popen(command, cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL)
+    try:
+        wait_for_port(port)
+        return asyncio.run(
+            run_load(
+                port, args.path, args.connections, args.slow_clients, args.duration
+            )
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--path", default="/api/planets/?page_size=30")
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--slow-clients", type=int, default=0)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument(
+        "--threads", type=int, default=4, help="Threads per WSGI worker."
+    )
+    parser.add_argument("--settings", default="core.prod_settings")
+    parser.add_argument(
+        "--servers", nargs="+", choices=sorted(SERVERS), default=sorted(SERVERS)
+    )
+    args = parser.parse_args()
+
+    results = {
+        "path": args.path,
+        "connections": args.connections,
+        "slow_clients": args.slow_clients,
+        "duration": args.duration,
+        "workers": args.workers,
+    }
+    for kind in args.servers:
+        results[kind] = benchmark(kind, args)
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Measure the per-request cost of JWT authentication.
+
+Every authentication class is timed twice on a throwaway test database:
+``authenticate()`` alone on a request carrying a valid access token, and a
+full ``POST /api/climates/`` served through the in-process client with the
+class installed on the viewset. An anonymous ``GET /api/climates/`` is the
+baseline. Time and SQL queries per request are printed as JSON::
+
+    python benchmarks/auth_overhead.py --requests 2000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from api_scenarios import summarize
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+AUTHENTICATION_CLASSES = {
+    "jwt": "rest_framework_simplejwt.authentication.JWTAuthentication",
+    "cached_jwt": "core.utils.authentication.CachedJWTAuthentication",
+}
+
+
+def measure(call, requests, warmup):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    for i in range(warmup):
+        call(i)
+    latencies, queries, errors = [], [], 0
+    with CaptureQueriesContext(connection) as captured:
+        started = time.perf_counter()
+        for i in range(requests):
+            before = len(captured)
+            request_started = time.perf_counter()
+            if not call(warmup + i):
+                errors += 1
+            latencies.append(time.perf_counter() - request_started)
+            queries.append(len(captured) - before)
+        elapsed = time.perf_counter() - started
+    return summarize(latencies, queries, errors, elapsed)
+
+
+def run(args):
+    from django.contrib.auth.models import User
+    from django.core.cache import cache
+    from django.test import RequestFactory
+    from django.utils.module_loading import import_string
+    from rest_framework.request import Request
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    from planets.views import ClimateViewSet
+
+    user = User.objects.create_user(username="benchmark", password="benchmark")
+    token = str(RefreshToken.for_user(user).access_token)
+    headers = {"Accept": "application/json", "Authorization": f"Bearer {token}"}
+    factory = RequestFactory()
+    client = APIClient()
+
+    def anonymous(i):
+        response = client.get("/api/climates/", headers={"Accept": "application/json"})
+        return response.status_code == 200
+
+    results = {
+        "requests": args.requests,
+        "anonymous_list": measure(anonymous, args.requests, args.warmup),
+    }
+    original = ClimateViewSet.authentication_classes
+    try:
+        for name, path in AUTHENTICATION_CLASSES.items():
+            authentication_class = import_string(path)
+            cache.clear()
+
+            def authenticate(i):
+                request = Request(
+                    factory.get("/", HTTP_AUTHORIZATION=headers["Authorization"]),
+                    authenticators=[authentication_class()],
+                )
+                return request.user.is_authenticated
+
+            def create(i, name=name):
+                response = client.post(
+                    "/api/climates/",
+                    {"name": f"{name} {i}"},
+                    format="json",
+                    headers=headers,
+                )
+                return response.status_code == 201
+
+            ClimateViewSet.authentication_classes = [authentication_class]
+            results[name] = {
+                "authenticate": measure(authenticate, args.requests, args.warmup),
+                "create": measure(create, args.requests, args.warmup),
+            }
+    finally:
+        ClimateViewSet.authentication_classes = original
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--settings", default="core.dev_settings")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ["DJANGO_SETTINGS_MODULE"] = args.settings
+
+    import django
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    django.setup()
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, serialize=False)
+    try:
+        results = run(args)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,8 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "star_wars_planets.settings")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.prod_settings")
+# Under ASGI, list and detail reads are served by the async views.
+os.environ.setdefault("ASYNC_READ_VIEWS", "true")
 
 application = get_asgi_application()
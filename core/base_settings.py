@@ -1,5 +1,6 @@
 import os
 from datetime import timedelta
+from importlib.util import find_spec
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -20,6 +21,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.utils.metrics.MetricsMiddleware",
+    "core.utils.replicas.ReplicaPinningMiddleware",
+    "core.utils.compression.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -27,11 +31,18 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "django_currentuser.middleware.ThreadLocalUserMiddleware",
+    "core.utils.audit.AuditUserMiddleware",
 ]
 
 ROOT_URLCONF = "core.urls"
 
+# Read replicas are configured by the dev/prod settings (DATABASE_REPLICAS).
+DATABASE_ROUTERS = ["core.utils.replicas.ReplicaRouter"]
+DATABASE_REPLICAS = []
+REPLICATED_APPS = {"planets"}
+# Seconds a client keeps reading from the primary after a write.
+DATABASE_REPLICA_PIN_SECONDS = int(os.getenv("DATABASE_REPLICA_PIN_SECONDS", "5"))
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -59,9 +70,23 @@ STATIC_URL = "/static/"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION", "star-wars-planets"),
+    }
+}
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "core.utils.authentication.CachedJWTAuthentication",
+    ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "core.utils.renderers.FastJSONRenderer",
+        "core.utils.renderers.CompactJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
     ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 30,
@@ -72,9 +97,56 @@ REST_FRAMEWORK = {
     ],
 }
 
+# MessagePack is offered when the optional msgpack package is installed.
+if find_spec("msgpack"):
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].insert(
+        2, "core.utils.renderers.MessagePackRenderer"
+    )
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=10),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
 }
+# Seconds an authenticated user is cached per process (user changes
+# invalidate it at once); 0 queries the user on every request.
+JWT_USER_CACHE_TIMEOUT = int(os.getenv("JWT_USER_CACHE_TIMEOUT", "60"))
+
+SWAPI_SYNC_BATCH_SIZE = int(os.getenv("SWAPI_SYNC_BATCH_SIZE", "1000"))
+SWAPI_STREAM_CHUNK_SIZE = int(os.getenv("SWAPI_STREAM_CHUNK_SIZE", "65536"))
+PLANET_BULK_MAX_ITEMS = int(os.getenv("PLANET_BULK_MAX_ITEMS", "10000"))
+PLANET_EXPORT_CHUNK_SIZE = int(os.getenv("PLANET_EXPORT_CHUNK_SIZE", "500"))
+NAME_INTERN_CACHE_SIZE = int(os.getenv("NAME_INTERN_CACHE_SIZE", "10000"))
+NAME_INTERN_CACHE_TIMEOUT = int(os.getenv("NAME_INTERN_CACHE_TIMEOUT", "60"))
+SYNC_JOB_RUNNER = os.getenv("SYNC_JOB_RUNNER", "thread")
+SYNC_WORKER_IDLE_TIMEOUT = float(os.getenv("SYNC_WORKER_IDLE_TIMEOUT", "5"))
+SYNC_JOB_STALE_TIMEOUT = int(os.getenv("SYNC_JOB_STALE_TIMEOUT", "600"))
+SWAPI_FETCH_CONCURRENCY = int(os.getenv("SWAPI_FETCH_CONCURRENCY", "4"))
+SWAPI_FETCH_TIMEOUT = float(os.getenv("SWAPI_FETCH_TIMEOUT", "30"))
+SWAPI_FETCH_RETRIES = int(os.getenv("SWAPI_FETCH_RETRIES", "3"))
+SWAPI_FETCH_BACKOFF = float(os.getenv("SWAPI_FETCH_BACKOFF", "0.5"))
+
+# Pagination count strategy: "exact", "cached" or "approximate". Override per
+# viewset class name, e.g. {"PlanetViewSet": "cached"}.
+PAGINATION_COUNT_MODE = os.getenv("PAGINATION_COUNT_MODE", "exact")
+PAGINATION_COUNT_MODES = {}
+PAGINATION_COUNT_CACHE_TIMEOUT = int(os.getenv("PAGINATION_COUNT_CACHE_TIMEOUT", "300"))
+PAGINATION_APPROXIMATE_COUNT_THRESHOLD = int(
+    os.getenv("PAGINATION_APPROXIMATE_COUNT_THRESHOLD", "100000")
+)
+
+# "trigram" uses the planets_searchtrigram index, "icontains" plain scans.
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "trigram")
+
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+RESPONSE_CACHE_TIMEOUT = int(os.getenv("RESPONSE_CACHE_TIMEOUT", "300"))
+PLANET_STATS_CACHE_TIMEOUT = int(os.getenv("PLANET_STATS_CACHE_TIMEOUT", "3600"))
+
+# Serve list/detail reads with async views; enabled by default by core/asgi.py.
+ASYNC_READ_VIEWS = os.getenv("ASYNC_READ_VIEWS", "false").lower() == "true"
+
+# Per-route request metrics, scraped from /api/metrics/ (admin only).
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+# Log requests slower than this with their slowest queries; 0 disables.
+SLOW_REQUEST_THRESHOLD_MS = int(os.getenv("SLOW_REQUEST_THRESHOLD_MS", "0"))
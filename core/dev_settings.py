@@ -1,15 +1,17 @@
-from .base_settings import *
+from pathlib import Path
 
-DEBUG = True
-ALLOWED_HOSTS = ["*"]
+from dotenv import load_dotenv
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
-}
+# Before any setting (including the base and database settings) reads it.
+load_dotenv(Path(__file__).resolve().parent.parent / ".env")
 
-from dotenv import load_dotenv
+from core.utils.database import database_settings, replica_settings  # noqa: E402
+
+from .base_settings import *  # noqa: E402
+
+DEBUG = True
+ALLOWED_HOSTS = ["*"]
 
-load_dotenv(BASE_DIR / ".env")
+DATABASES = {"default": database_settings(BASE_DIR / "db.sqlite3")}
+DATABASES.update(replica_settings(DATABASES["default"]))
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
@@ -1,21 +1,70 @@
+from django.conf import settings
 from django.db import models
 from django.utils.timezone import now
-from django_currentuser.db.models import CurrentUserField
+
+from core.utils.audit import get_acting_user_id
+
+
+class AuditQuerySet(models.QuerySet):
+    """
+    Stamp the acting user on ``bulk_create`` and ``bulk_update``, which
+    bypass ``save()``. The user is resolved once per call; like ``save()``
+    with ``update_fields``, ``bulk_update`` only writes ``updated_by`` when
+    it is one of the fields.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        user_id = get_acting_user_id()
+        for obj in objs:
+            if obj._state.adding and obj.created_by_id is None:
+                obj.created_by_id = user_id
+            obj.updated_by_id = user_id
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        if "updated_by" in fields:
+            user_id = get_acting_user_id()
+            for obj in objs:
+                obj.updated_by_id = user_id
+        return super().bulk_update(objs, fields, *args, **kwargs)
 
 
 class AuditModel(models.Model):
     created_at = models.DateTimeField(default=now, editable=False)
     updated_at = models.DateTimeField(default=now)
-    created_by = CurrentUserField(
-        on_update=False,
+    # Plain, unindexed foreign keys stamped from the acting user
+    # (core.utils.audit), so no lookup is done per row.
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=False,
         related_name="created_%(class)ss",
         related_query_name="created_%(class)s",
     )
-    updated_by = CurrentUserField(
-        on_update=True,
+    updated_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=False,
         related_name="updated_%(class)ss",
         related_query_name="updated_%(class)s",
     )
 
+    objects = AuditQuerySet.as_manager()
+
     class Meta:
         abstract = True
+
+    def save(self, *args, **kwargs):
+        user_id = get_acting_user_id()
+        if self._state.adding and self.created_by_id is None:
+            self.created_by_id = user_id
+        self.updated_by_id = user_id
+        super().save(*args, **kwargs)
@@ -1,13 +1,12 @@
+from core.utils.database import database_settings, replica_settings
+
 from .base_settings import *
 
 DEBUG = False
 ALLOWED_HOSTS = os.getenv("DJANGO_ALLOWED_HOSTS", "").split(",")
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
-}
+DATABASES = {"default": database_settings(BASE_DIR / "db.sqlite3")}
+DATABASES.update(replica_settings(DATABASES["default"]))
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != "default"]
 
 STATIC_ROOT = BASE_DIR / "staticfiles"
@@ -2,9 +2,12 @@ from django.contrib import admin
 from django.urls import include, path
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+from core.views import MetricsView
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/login/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path("api/metrics/", MetricsView.as_view(), name="metrics"),
     path("api/", include("planets.urls")),
 ]
@@ -0,0 +1,61 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+# A callable returning the acting user, so the request user is read after
+# DRF has authenticated the request.
+_acting_user = ContextVar("acting_user", default=None)
+
+
+def get_acting_user_id():
+    """Primary key of the authenticated user the current writes are made by."""
+    resolve = _acting_user.get()
+    user = resolve() if resolve is not None else None
+    if user is None or not user.is_authenticated:
+        return None
+    return user.pk
+
+
+@contextmanager
+def acting_user(user):
+    """Attribute the writes made inside the block (a batch, a job) to ``user``."""
+    token = _acting_user.set(lambda: user)
+    try:
+        yield
+    finally:
+        _acting_user.reset(token)
+
+
+class AuditUserMiddleware:
+    """
+    Make the request user the acting user of the writes done by the request.
+
+    A context variable is used instead of a thread-local, so the user follows
+    the request into ``sync_to_async`` threads under ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        token = _acting_user.set(lambda: getattr(request, "user", None))
+        try:
+            return self.get_response(request)
+        finally:
+            _acting_user.reset(token)
+
+    async def __acall__(self, request):
+        token = _acting_user.set(lambda: getattr(request, "user", None))
+        try:
+            return await self.get_response(request)
+        finally:
+            _acting_user.reset(token)
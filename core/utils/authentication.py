@@ -0,0 +1,92 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from core.utils.versioning import get_model_version
+
+USER_CACHE_SIZE = 1024
+
+
+class UserCache:
+    """
+    Process-wide ``user id -> user`` cache.
+
+    Entries are tagged with the user model's data version, which is bumped on
+    every user save or delete, and expire after ``JWT_USER_CACHE_TIMEOUT``
+    seconds, bounding staleness when the version cache is not shared between
+    processes.
+    """
+
+    def __init__(self, max_size=USER_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+
+    def get(self, user_id, version):
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+                return None
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            user, expires = entry
+            if expires < time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return user
+
+    def store(self, user_id, user, version):
+        expires = time.monotonic() + settings.JWT_USER_CACHE_TIMEOUT
+        with self._lock:
+            if version != self._version:
+                return
+            self._entries[user_id] = (user, expires)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+user_cache = UserCache()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication resolving the token's user from :data:`user_cache`,
+    so authenticated requests do not query the user table each time.
+
+    The cached user is shared between requests and must be treated as
+    read-only.
+    """
+
+    def get_user(self, validated_token):
+        if not settings.JWT_USER_CACHE_TIMEOUT:
+            return super().get_user(validated_token)
+
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        version = get_model_version(self.user_model)
+        user = user_cache.get(user_id, version)
+        if user is None:
+            user = super().get_user(validated_token)
+            user_cache.store(user_id, user, version)
+        elif api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."), code="password_changed"
+            )
+        return user
@@ -0,0 +1,117 @@
+import hashlib
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import cache
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+from core.utils.versioning import get_model_version
+
+PROCESS_LOCAL_CACHE_BACKENDS = {"django.core.cache.backends.locmem.LocMemCache"}
+
+
+@checks.register(checks.Tags.caches, deploy=True)
+def check_shared_cache(app_configs=None, **kwargs):
+    """
+    Data versions live in the default cache. A process-local backend only
+    sees the writes of its own process, so the other workers keep serving
+    cached responses until ``RESPONSE_CACHE_TIMEOUT`` expires.
+    """
+    backend = settings.CACHES["default"]["BACKEND"]
+    if (
+        not settings.RESPONSE_CACHE_ENABLED
+        or backend not in PROCESS_LOCAL_CACHE_BACKENDS
+    ):
+        return []
+    return [
+        checks.Warning(
+            f"The default cache ({backend}) is local to each process, so a write "
+            "only invalidates the cached data of the worker that made it; other "
+            "workers serve stale responses for up to RESPONSE_CACHE_TIMEOUT "
+            f"({settings.RESPONSE_CACHE_TIMEOUT}) seconds.",
+            hint="Set DJANGO_CACHE_BACKEND to a shared backend such as Redis or "
+            "Memcached, run a single worker, or set RESPONSE_CACHE_ENABLED=false.",
+            id="core.W001",
+        )
+    ]
+
+
+def response_cache_key(request, versions):
+    """
+    Key of a cached response: host, path, sorted query params, ``Accept``
+    header and the data ``versions`` the response depends on.
+    """
+    params = sorted(
+        (key, value) for key in request.GET for value in request.GET.getlist(key)
+    )
+    parts = [
+        request.get_host(),
+        request.path,
+        repr(params),
+        request.META.get("HTTP_ACCEPT", ""),
+        *(str(version) for version in versions),
+    ]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+def response_etag(key):
+    return f'"{key[:32]}"'
+
+
+def etag_matches(request, etag):
+    # Weak comparison: compressed responses carry the ETag as W/"...".
+    etags = parse_etags(request.META.get("HTTP_IF_NONE_MATCH", ""))
+    return etag in {tag.removeprefix("W/") for tag in etags}
+
+
+class CachedResponseMixin:
+    """
+    Cache ``list`` and ``retrieve`` responses of a viewset by data version.
+
+    The cache key combines the host, path, sorted query params, ``Accept``
+    header and the current version of every model in ``cache_models``, so
+    any write to those models (which bumps their version) invalidates the
+    cached responses without having to find them. The key hash is sent as a
+    strong ``ETag``; a matching ``If-None-Match`` is answered with 304 from
+    the version counters alone, without touching the database.
+    """
+
+    cache_models = ()
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(request, super().retrieve, *args, **kwargs)
+
+    def get_cache_models(self):
+        return self.cache_models or (self.get_queryset().model,)
+
+    def get_response_cache_key(self, request):
+        return response_cache_key(
+            request, [get_model_version(model) for model in self.get_cache_models()]
+        )
+
+    def cached_response(self, request, handler, *args, **kwargs):
+        if not settings.RESPONSE_CACHE_ENABLED:
+            return handler(request, *args, **kwargs)
+
+        key = self.get_response_cache_key(request)
+        etag = response_etag(key)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        cache_key = f"response:{key}"
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data, headers=headers)
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(cache_key, response.data, settings.RESPONSE_CACHE_TIMEOUT)
+            for header, value in headers.items():
+                response[header] = value
+        return response
@@ -0,0 +1,96 @@
+import os
+
+# Applied by Django on every new SQLite connection. WAL lets readers run while
+# a sync transaction writes; NORMAL is durable in WAL mode except for the last
+# transactions on power loss.
+SQLITE_INIT_COMMAND = ";".join(
+    [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA mmap_size={mmap_size}",
+        "PRAGMA cache_size=-{cache_kib}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+)
+
+
+def env_flag(name, default):
+    return os.getenv(name, default).lower() == "true"
+
+
+def sqlite_database(name):
+    """SQLite settings tuned for concurrent readers and a single writer."""
+    return {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": name,
+        "OPTIONS": {
+            # Seconds a connection waits for a lock before "database is locked".
+            "timeout": float(os.getenv("SQLITE_BUSY_TIMEOUT", "20")),
+            # Take the write lock when a transaction starts, so two writers
+            # queue on the busy timeout instead of failing to upgrade.
+            "transaction_mode": "IMMEDIATE",
+            "init_command": SQLITE_INIT_COMMAND.format(
+                mmap_size=int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+                cache_kib=int(os.getenv("SQLITE_CACHE_KIB", "65536")),
+            ),
+        },
+    }
+
+
+def postgresql_database():
+    """
+    PostgreSQL settings with persistent connections and health checks, or a
+    psycopg connection pool when ``DATABASE_POOL`` is enabled.
+    """
+    database = {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": os.getenv("DATABASE_NAME", "star_wars_planets"),
+        "USER": os.getenv("DATABASE_USER", "postgres"),
+        "PASSWORD": os.getenv("DATABASE_PASSWORD", ""),
+        "HOST": os.getenv("DATABASE_HOST", "localhost"),
+        "PORT": os.getenv("DATABASE_PORT", "5432"),
+        "CONN_MAX_AGE": int(os.getenv("DATABASE_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {},
+    }
+    if env_flag("DATABASE_POOL", "false"):
+        # Pooled connections are returned to the pool at the end of each
+        # request, so they must not be persistent as well.
+        database["CONN_MAX_AGE"] = 0
+        database["OPTIONS"]["pool"] = {
+            "min_size": int(os.getenv("DATABASE_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DATABASE_POOL_MAX_SIZE", "10")),
+            "timeout": float(os.getenv("DATABASE_POOL_TIMEOUT", "10")),
+        }
+    return database
+
+
+def database_settings(sqlite_name):
+    """
+    The ``default`` database selected by ``DATABASE_ENGINE``: ``sqlite``
+    (stored at ``sqlite_name``) or ``postgresql``.
+    """
+    engine = os.getenv("DATABASE_ENGINE", "sqlite")
+    if engine == "sqlite":
+        return sqlite_database(sqlite_name)
+    if engine == "postgresql":
+        return postgresql_database()
+    raise ValueError(f"Unsupported DATABASE_ENGINE: {engine!r}")
+
+
+def replica_settings(primary):
+    """
+    Read replicas of ``primary`` from ``DATABASE_REPLICAS``: comma-separated
+    SQLite file paths, or PostgreSQL hosts sharing the primary's credentials.
+    Tests use the primary in their place.
+    """
+    replicas = {}
+    entries = [e.strip() for e in os.getenv("DATABASE_REPLICAS", "").split(",")]
+    for number, entry in enumerate(filter(None, entries), start=1):
+        key = "NAME" if primary["ENGINE"].endswith("sqlite3") else "HOST"
+        replicas[f"replica_{number}"] = {
+            **primary,
+            key: entry,
+            "TEST": {"MIRROR": "default"},
+        }
+    return replicas
@@ -0,0 +1,28 @@
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+
+_EXHAUSTED = object()
+
+
+def chunked(iterable, size):
+    """Yield lists of at most ``size`` items from ``iterable``."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+async def aiter_sync(iterable):
+    """
+    Iterate a synchronous ``iterable`` from async code, pulling one item at a
+    time with ``sync_to_async`` rather than reading it all into memory first.
+    The iterator is closed in the same thread when iteration stops early.
+    """
+    iterator = iter(iterable)
+    pull = sync_to_async(next)
+    try:
+        while (item := await pull(iterator, _EXHAUSTED)) is not _EXHAUSTED:
+            yield item
+    finally:
+        if hasattr(iterator, "close"):
+            await sync_to_async(iterator.close)()
@@ -0,0 +1,148 @@
+import codecs
+import json
+
+WHITESPACE = " \t\n\r"
+
+_decoder = json.JSONDecoder()
+
+
+class JSONStreamReader:
+    """
+    Incremental reader over a JSON document delivered in chunks.
+
+    Only the part of the document that has not been consumed yet is kept in
+    memory, so reading an array item by item needs memory proportional to the
+    largest item instead of the whole document.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.exhausted = False
+
+    def _fill(self):
+        """Append the next chunk to the buffer. Returns False at end of stream."""
+        if self.exhausted:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self.exhausted = True
+            text = self._utf8.decode(b"", final=True)
+        else:
+            text = self._utf8.decode(chunk) if isinstance(chunk, bytes) else chunk
+        self.buffer = self.buffer[self.pos :] + text
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON stream")
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON stream, found {found!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode and consume the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number ending exactly at the buffer end may continue in the
+            # next chunk.
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def _skip_separator(reader):
+    if reader.peek() == ",":
+        reader.expect(",")
+
+
+def iter_json_array(chunks, *paths, meta=None):
+    """
+    Yield the items of the JSON array found at one of ``paths`` one at a time.
+
+    Args:
+        chunks: Iterable of ``bytes`` or ``str`` fragments of the document
+        paths: Sequences of object keys leading to the array; the first one
+            found in the document is used. An empty path matches a document
+            that is itself an array.
+        meta: Optional dict that receives the scalar top-level values of the
+            document (e.g. a pagination ``next`` link). When given, the rest
+            of the document is read after the array so it is complete once
+            the generator is exhausted.
+
+    Missing keys or ``null`` values along the path yield no items.
+    """
+    reader = JSONStreamReader(chunks)
+    candidates = [tuple(path) for path in paths]
+    depth = 0
+    found = () in candidates and reader.peek() == "["
+    candidates = [path for path in candidates if path]
+    while not found:
+        if reader.peek() != "{":
+            return
+        reader.expect("{")
+        while True:
+            if reader.peek() == "}":
+                return
+            name = reader.value()
+            reader.expect(":")
+            matching = [path for path in candidates if path[depth] == name]
+            if matching:
+                candidates = matching
+                depth += 1
+                found = any(len(path) == depth for path in matching)
+                break
+            value = reader.value()
+            if depth == 0 and meta is not None and not isinstance(value, (dict, list)):
+                meta[name] = value
+            _skip_separator(reader)
+
+    if reader.peek() == "[":
+        reader.expect("[")
+        if reader.peek() == "]":
+            reader.expect("]")
+        else:
+            while True:
+                yield reader.value()
+                separator = reader.peek()
+                reader.pos += 1
+                if separator == "]":
+                    break
+                if separator != ",":
+                    raise ValueError(
+                        f"Expected ',' or ']' in JSON array, found {separator!r}"
+                    )
+    else:
+        reader.value()
+
+    if meta is None:
+        return
+    for level in reversed(range(depth)):
+        while reader.peek() == ",":
+            reader.expect(",")
+            name = reader.value()
+            reader.expect(":")
+            value = reader.value()
+            if level == 0 and not isinstance(value, (dict, list)):
+                meta[name] = value
+        reader.expect("}")
@@ -0,0 +1,292 @@
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict, deque
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework import serializers
+
+logger = logging.getLogger("core.metrics")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUANTILES = (0.5, 0.95, 0.99)
+QUANTILE_WINDOW = 1024
+SLOW_QUERIES_LOGGED = 10
+
+_current = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    """Counters of the request being served, shared with its worker threads."""
+
+    __slots__ = ("queries", "sql_seconds", "serializer_seconds", "captured")
+
+    def __init__(self, capture_sql=False):
+        self.queries = 0
+        self.sql_seconds = 0.0
+        self.serializer_seconds = 0.0
+        self.captured = [] if capture_sql else None
+
+
+def record_sql(execute, sql, params, many, context):
+    """Database execute wrapper feeding the metrics of the current request."""
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - started
+        metrics.queries += 1
+        metrics.sql_seconds += elapsed
+        if metrics.captured is not None:
+            metrics.captured.append((elapsed, sql))
+
+
+def install_sql_wrapper(connection, **kwargs):
+    """
+    Install :func:`record_sql` on a database connection.
+
+    The wrapper stays installed and reads the request metrics from a context
+    variable, so queries run by ``sync_to_async`` threads (the async ORM) are
+    attributed to the request as well.
+    """
+    if record_sql not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_sql)
+
+
+connection_created.connect(install_sql_wrapper)
+
+
+class TimedSerializerMixin:
+    """Adds the time spent building ``serializer.data`` to the request metrics."""
+
+    @property
+    def data(self):
+        metrics = _current.get()
+        if metrics is None:
+            return super().data
+        started = time.perf_counter()
+        try:
+            return super().data
+        finally:
+            metrics.serializer_seconds += time.perf_counter() - started
+
+
+class TimedListSerializer(TimedSerializerMixin, serializers.ListSerializer):
+    pass
+
+
+class RouteStats:
+    def __init__(self):
+        self.requests = defaultdict(int)
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.latency_sum = 0.0
+        self.count = 0
+        self.recent = deque(maxlen=QUANTILE_WINDOW)
+        self.sql_queries = 0
+        self.sql_seconds = 0.0
+        self.serializer_seconds = 0.0
+
+
+class MetricsRegistry:
+    """
+    In-process per-route request metrics, rendered in Prometheus text format.
+
+    Recording is a few additions under a lock; the latency quantiles are
+    computed from a sliding window of recent requests at scrape time only.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.routes = defaultdict(RouteStats)
+
+    def record(self, method, route, status, seconds, metrics):
+        with self.lock:
+            stats = self.routes[(method, route)]
+            stats.requests[f"{status // 100}xx"] += 1
+            bucket = bisect_left(LATENCY_BUCKETS, seconds)
+            if bucket < len(LATENCY_BUCKETS):
+                stats.buckets[bucket] += 1
+            stats.latency_sum += seconds
+            stats.count += 1
+            stats.recent.append(seconds)
+            stats.sql_queries += metrics.queries
+            stats.sql_seconds += metrics.sql_seconds
+            stats.serializer_seconds += metrics.serializer_seconds
+
+    def reset(self):
+        with self.lock:
+            self.routes.clear()
+
+    def render(self):
+        with self.lock:
+            routes = [
+                (method, route, stats, sorted(stats.recent))
+                for (method, route), stats in sorted(self.routes.items())
+            ]
+
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for suffix, labels, value in samples:
+                label_text = ",".join(f'{key}="{value}"' for key, value in labels)
+                lines.append(f"{name}{suffix}{{{label_text}}} {value}")
+
+        def labels(method, route, *extra):
+            return (("method", method), ("route", route), *extra)
+
+        metric(
+            "http_requests_total",
+            "counter",
+            "Requests by route, method and status class.",
+            [
+                ("", labels(method, route, ("status", status)), count)
+                for method, route, stats, _ in routes
+                for status, count in sorted(stats.requests.items())
+            ],
+        )
+
+        histogram = []
+        for method, route, stats, _ in routes:
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+                cumulative += count
+                histogram.append(
+                    ("_bucket", labels(method, route, ("le", bound)), cumulative)
+                )
+            histogram += [
+                ("_bucket", labels(method, route, ("le", "+Inf")), stats.count),
+                ("_sum", labels(method, route), stats.latency_sum),
+                ("_count", labels(method, route), stats.count),
+            ]
+        metric(
+            "http_request_duration_seconds",
+            "histogram",
+            "Request latency by route.",
+            histogram,
+        )
+
+        metric(
+            "http_request_latency_seconds",
+            "summary",
+            f"Latency quantiles over the last {QUANTILE_WINDOW} requests by route.",
+            [
+                (
+                    "",
+                    labels(method, route, ("quantile", quantile)),
+                    recent[min(len(recent) - 1, int(quantile * len(recent)))],
+                )
+                for method, route, _, recent in routes
+                if recent
+                for quantile in QUANTILES
+            ],
+        )
+
+        for name, attribute, help_text in (
+            ("http_request_sql_queries_total", "sql_queries", "SQL queries run"),
+            ("http_request_sql_seconds_total", "sql_seconds", "Time spent in SQL"),
+            (
+                "http_request_serializer_seconds_total",
+                "serializer_seconds",
+                "Time spent serializing responses",
+            ),
+        ):
+            metric(
+                name,
+                "counter",
+                f"{help_text} by route.",
+                [
+                    ("", labels(method, route), getattr(stats, attribute))
+                    for method, route, stats, _ in routes
+                ],
+            )
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+def route_name(request):
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unmatched"
+    return match.view_name or match.route
+
+
+class MetricsMiddleware:
+    """
+    Record per-route request count, latency, SQL and serializer time.
+
+    Works under WSGI and ASGI without switching modes. With
+    ``SLOW_REQUEST_THRESHOLD_MS`` set, requests slower than the threshold
+    are logged with their slowest SQL queries.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        for connection in connections.all(initialized_only=True):
+            install_sql_wrapper(connection)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not settings.METRICS_ENABLED:
+            return self.get_response(request)
+        metrics, token, started = self.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.finish(request, response, metrics, started)
+        return response
+
+    async def __acall__(self, request):
+        if not settings.METRICS_ENABLED:
+            return await self.get_response(request)
+        metrics, token, started = self.start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.finish(request, response, metrics, started)
+        return response
+
+    def start(self):
+        metrics = RequestMetrics(capture_sql=bool(settings.SLOW_REQUEST_THRESHOLD_MS))
+        return metrics, _current.set(metrics), time.perf_counter()
+
+    def finish(self, request, response, metrics, started):
+        elapsed = time.perf_counter() - started
+        route = route_name(request)
+        registry.record(request.method, route, response.status_code, elapsed, metrics)
+
+        threshold = settings.SLOW_REQUEST_THRESHOLD_MS
+        if threshold and elapsed * 1000 >= threshold:
+            slowest = sorted(metrics.captured, reverse=True)[:SLOW_QUERIES_LOGGED]
+            logger.warning(
+                "Slow request %s %s (%s): %.1fms, %s queries in %.1fms%s",
+                request.method,
+                request.get_full_path(),
+                route,
+                elapsed * 1000,
+                metrics.queries,
+                metrics.sql_seconds * 1000,
+                "".join(
+                    f"\n  {seconds * 1000:.1f}ms {sql}" for seconds, sql in slowest
+                ),
+            )
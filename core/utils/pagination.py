@@ -1,17 +1,199 @@
-from rest_framework.pagination import PageNumberPagination
+import hashlib
+from functools import cached_property, partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db import DatabaseError, connections
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from core.utils.versioning import get_model_version
+
+EXACT = "exact"
+CACHED = "cached"
+APPROXIMATE = "approximate"
+COUNT_MODES = {EXACT, CACHED, APPROXIMATE}
+
+
+def estimate_count(queryset):
+    """
+    Estimate the number of rows of the queryset's table without scanning it.
+
+    PostgreSQL uses the planner statistics in ``pg_class``; SQLite uses
+    ``sqlite_stat1`` when ``ANALYZE`` has run and otherwise the highest
+    primary key, which is an index lookup. Returns None when no estimate is
+    available.
+    """
+    model = queryset.model
+    table = model._meta.db_table
+    connection = connections[queryset.db]
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [table],
+                )
+                row = cursor.fetchone()
+                if row and row[0] >= 0:
+                    return row[0]
+            elif connection.vendor == "sqlite":
+                cursor.execute(
+                    "SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1", [table]
+                )
+                row = cursor.fetchone()
+                if row:
+                    return int(row[0].split()[0])
+    except DatabaseError:
+        pass
+    return (
+        model._default_manager.using(queryset.db)
+        .order_by("-pk")
+        .values_list("pk", flat=True)
+        .first()
+    )
+
+
+class CountingPaginator(DjangoPaginator):
+    """Django paginator whose ``count`` is delegated to ``count_resolver``."""
+
+    def __init__(self, object_list, per_page, count_resolver=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_resolver = count_resolver
+
+    @cached_property
+    def count(self):
+        if self.count_resolver is None:
+            return super().count
+        return self.count_resolver(self.object_list)
+
+
+class NameCursorPagination(CursorPagination):
+    """
+    Paginación por cursor (keyset) ordenada por ``(name, id)``.
+
+    Cada página se obtiene con ``WHERE name > <cursor>`` sobre el índice único
+    de ``name``, sin ``COUNT(*)`` ni ``OFFSET``, por lo que recorrer todo el
+    catálogo cuesta O(n) en total.
+    """
+
+    page_size = 30
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("name", "id")
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "page_size": self.page_size,
+                "results": data,
+            }
+        )
 
 
 class PlanetPagination(PageNumberPagination):
     """
     Paginación personalizada para planetas con metadatos completos
+
+    Con ``?pagination=cursor`` (o un parámetro ``cursor``) se usa
+    ``NameCursorPagination``, que omite ``count``, ``total_pages`` y
+    ``current_page``.
+
+    El ``count`` se calcula según ``PAGINATION_COUNT_MODES`` (por nombre de
+    viewset, con ``PAGINATION_COUNT_MODE`` por defecto):
+
+    - ``exact``: ``COUNT(*)`` en cada petición.
+    - ``cached``: ``COUNT(*)`` cacheado por modelo, búsqueda normalizada y
+      filtros; se invalida con la versión del modelo al escribir.
+    - ``approximate``: estimación del motor para tablas sin filtrar mayores
+      que ``PAGINATION_APPROXIMATE_COUNT_THRESHOLD``; si no, como ``cached``.
     """
 
     page_size = 30
     page_size_query_param = "page_size"
     max_page_size = 100
+    mode_query_param = "pagination"
+    cursor_pagination_class = NameCursorPagination
+
+    cursor_paginator = None
+    count_mode = EXACT
+    ignored_count_params = {"page", "page_size", "pagination", "cursor", "ordering"}
+    # Only the search term is case-insensitive; other filters keep their value.
+    normalized_count_params = {api_settings.SEARCH_PARAM}
+
+    @property
+    def django_paginator_class(self):
+        return partial(CountingPaginator, count_resolver=self.resolve_count)
+
+    def get_count_mode(self, view):
+        mode = settings.PAGINATION_COUNT_MODES.get(
+            type(view).__name__, settings.PAGINATION_COUNT_MODE
+        )
+        return mode if mode in COUNT_MODES else EXACT
+
+    def get_count_filters(self):
+        """Normalized query params that change the number of rows."""
+        filters = []
+        for key in sorted(self.request.query_params):
+            if key in self.ignored_count_params:
+                continue
+            for value in self.request.query_params.getlist(key):
+                if key in self.normalized_count_params:
+                    value = " ".join(value.lower().split())
+                filters.append((key, value))
+        return filters
+
+    def get_count_cache_key(self, queryset):
+        filters = repr(self.get_count_filters()).encode()
+        return "pagination-count:{}:{}:{}".format(
+            queryset.model._meta.label_lower,
+            get_model_version(queryset.model),
+            hashlib.sha1(filters).hexdigest(),
+        )
+
+    def resolve_count(self, queryset):
+        if self.count_mode == EXACT:
+            return queryset.count()
+
+        if self.count_mode == APPROXIMATE and not self.get_count_filters():
+            estimate = estimate_count(queryset)
+            if (
+                estimate is not None
+                and estimate >= settings.PAGINATION_APPROXIMATE_COUNT_THRESHOLD
+            ):
+                return estimate
+
+        key = self.get_count_cache_key(queryset)
+        count = cache.get(key)
+        if count is None:
+            count = queryset.count()
+            cache.set(key, count, settings.PAGINATION_COUNT_CACHE_TIMEOUT)
+        return count
+
+    def use_cursor(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == "cursor"
+            or self.cursor_pagination_class.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count_mode = self.get_count_mode(view)
+        if self.use_cursor(request):
+            self.cursor_paginator = self.cursor_pagination_class()
+            page = self.cursor_paginator.paginate_queryset(queryset, request, view)
+            self.display_page_controls = getattr(
+                self.cursor_paginator, "display_page_controls", False
+            )
+            return page
+        return super().paginate_queryset(queryset, request, view)
 
     def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
         return Response(
             {
                 "count": self.page.paginator.count,
@@ -23,3 +205,8 @@ class PlanetPagination(PageNumberPagination):
                 "results": data,
             }
         )
+
+    def to_html(self):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.to_html()
+        return super().to_html()
@@ -0,0 +1,93 @@
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+
+def encode_default(obj):
+    """Types the fast encoders lack (``Decimal``, lazy strings...), as DRF does."""
+    return JSONEncoder().default(obj)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    ``JSONRenderer`` encoding with orjson when it is installed. Indented output
+    (``Accept: application/json; indent=4``) still uses the standard encoder.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        return orjson.dumps(
+            data, default=encode_default, option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+def column_name(field):
+    return field if field.endswith("s") else f"{field}s"
+
+
+def to_columns(rows, fields=None):
+    """
+    ``[{"name": ..., "population": ...}, ...]`` ->
+    ``{"names": [...], "populations": [...]}``.
+
+    Columns are taken from ``fields`` when given, so an empty list still has
+    every column, and from the first row otherwise.
+    """
+    if fields is None:
+        fields = list(rows[0]) if rows else []
+    return {column_name(field): [row.get(field) for row in rows] for field in fields}
+
+
+def list_fields(renderer_context):
+    """The fields of a list view's serializer, or ``None`` for other views."""
+    view = (renderer_context or {}).get("view")
+    if getattr(view, "action", None) != "list":
+        return None
+    return list(view.get_serializer_class()().fields)
+
+
+class CompactJSONRenderer(FastJSONRenderer):
+    """
+    Columnar JSON: list results are sent as parallel arrays, one per field
+    (``names``, ``populations``, ``climates``, ``terrains``), so field names are
+    not repeated for every object. Other responses are rendered as JSON.
+    """
+
+    media_type = "application/vnd.planets.compact+json"
+    format = "compact"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        fields = list_fields(renderer_context)
+        if isinstance(data, dict) and isinstance(data.get("results"), list):
+            data = {**data, "results": to_columns(data["results"], fields)}
+        elif isinstance(data, list) and all(isinstance(row, dict) for row in data):
+            data = to_columns(data, fields)
+        return super().render(data, accepted_media_type, renderer_context)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """MessagePack responses; requires the optional ``msgpack`` package."""
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=encode_default, use_bin_type=True)
@@ -0,0 +1,158 @@
+import math
+import random
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+PIN_COOKIE = "replica_pin"
+# Unix time until which the client reads from the primary, for clients that
+# do not keep cookies (API clients echo it back as a request header).
+PIN_HEADER = "X-Replica-Pin"
+USER_PIN_KEY = "replica-pin:user:{}"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+_current = ContextVar("replica_state", default=None)
+
+
+class ReplicaState:
+    """Routing state of the request being served."""
+
+    __slots__ = ("request", "use_replicas", "wrote", "user_checked")
+
+    def __init__(self, request, use_replicas):
+        self.request = request
+        self.use_replicas = use_replicas
+        self.wrote = False
+        self.user_checked = False
+
+
+def authenticated_user_id(request):
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return None
+    return user.pk
+
+
+def header_pinned(request):
+    try:
+        return float(request.headers.get(PIN_HEADER, "")) > time.time()
+    except ValueError:
+        return False
+
+
+class ReplicaRouter:
+    """
+    Send reads of the replicated apps to ``DATABASE_REPLICAS`` during
+    safe-method requests that are not pinned to the primary.
+
+    Everything else (writes, unsafe requests, reads after a write in the same
+    request, users who wrote recently, management commands and background
+    jobs) uses the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _current.get()
+        if (
+            state is None
+            or not state.use_replicas
+            or not settings.DATABASE_REPLICAS
+            or model._meta.app_label not in settings.REPLICATED_APPS
+        ):
+            return DEFAULT_DB_ALIAS
+        if not state.user_checked:
+            # Checked on the first replicated read, once DRF has authenticated.
+            state.user_checked = True
+            user_id = authenticated_user_id(state.request)
+            if user_id is not None and cache.get(USER_PIN_KEY.format(user_id)):
+                state.use_replicas = False
+                return DEFAULT_DB_ALIAS
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        state = _current.get()
+        if state is not None:
+            state.use_replicas = False
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
+
+
+class ReplicaPinningMiddleware:
+    """
+    Enable replica reads for safe-method requests.
+
+    A request that writes pins its client to the primary for
+    ``DATABASE_REPLICA_PIN_SECONDS``, so it reads its own writes while the
+    replicas catch up. The pin is a cookie, an ``X-Replica-Pin`` response
+    header that clients without cookies send back, and, for authenticated
+    users, a cache entry, which covers JWT clients that do neither (across
+    workers only with a shared cache backend).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        state, token = self.start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        user_pin = self.finish(response, state)
+        if user_pin:
+            cache.set(user_pin, True, settings.DATABASE_REPLICA_PIN_SECONDS)
+        return response
+
+    async def __acall__(self, request):
+        state, token = self.start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        user_pin = self.finish(response, state)
+        if user_pin:
+            await cache.aset(user_pin, True, settings.DATABASE_REPLICA_PIN_SECONDS)
+        return response
+
+    def start(self, request):
+        state = ReplicaState(
+            request,
+            request.method in SAFE_METHODS
+            and PIN_COOKIE not in request.COOKIES
+            and not header_pinned(request),
+        )
+        return state, _current.set(state)
+
+    def finish(self, response, state):
+        """Pin a client that wrote; returns the user's pin cache key, if any."""
+        if not state.wrote or not settings.DATABASE_REPLICAS:
+            return None
+        pin_seconds = settings.DATABASE_REPLICA_PIN_SECONDS
+        response.set_cookie(
+            PIN_COOKIE, "1", max_age=pin_seconds, httponly=True, samesite="Lax"
+        )
+        response.headers[PIN_HEADER] = str(math.ceil(time.time() + pin_seconds))
+        user_id = authenticated_user_id(state.request)
+        return USER_PIN_KEY.format(user_id) if user_id is not None else None
@@ -0,0 +1,104 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+VERSION_KEY = "model-version:{}"
+
+# Models written less than DATABASE_REPLICA_PIN_SECONDS ago -> time of the write.
+_lagging = {}
+_lagging_lock = threading.Lock()
+_lagging_timer = None
+
+
+def _version_key(model):
+    return VERSION_KEY.format(model._meta.label_lower)
+
+
+def get_model_version(model):
+    """
+    Return the current data version of ``model``.
+
+    Versions live in the default cache and start from a nanosecond timestamp,
+    so a counter that is evicted or lost on restart never goes back to a value
+    that was already used.
+    """
+    key = _version_key(model)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns())
+        version = cache.get(key)
+    return version
+
+
+async def aget_model_version(model):
+    """Async version of :func:`get_model_version`."""
+    key = _version_key(model)
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, time.time_ns())
+        version = await cache.aget(key)
+    return version
+
+
+def _bump(models):
+    for model in models:
+        key = _version_key(model)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns())
+
+
+def _schedule_lagging_bump(delay):
+    global _lagging_timer
+    _lagging_timer = threading.Timer(delay, _bump_caught_up)
+    _lagging_timer.daemon = True
+    _lagging_timer.start()
+
+
+def _bump_caught_up():
+    global _lagging_timer
+    pin_seconds = settings.DATABASE_REPLICA_PIN_SECONDS
+    now = time.monotonic()
+    with _lagging_lock:
+        models = [m for m, at in _lagging.items() if now - at >= pin_seconds]
+        for model in models:
+            del _lagging[model]
+        _lagging_timer = None
+        if _lagging:
+            _schedule_lagging_bump(min(_lagging.values()) + pin_seconds - now)
+    _bump(models)
+
+
+def _bump_committed(models):
+    """
+    Bump once the write is committed and, with read replicas, again when
+    they have caught up, so responses cached from a lagging replica under
+    the new version are invalidated too.
+    """
+    _bump(models)
+    if not settings.DATABASE_REPLICAS:
+        return
+    with _lagging_lock:
+        for model in models:
+            _lagging[model] = time.monotonic()
+        if _lagging_timer is None:
+            _schedule_lagging_bump(settings.DATABASE_REPLICA_PIN_SECONDS)
+
+
+def bump_model_version(*models):
+    """
+    Invalidate everything cached against the versions of ``models``.
+
+    Inside a transaction the version is bumped again once it commits, so
+    readers that cached uncommitted-invisible data in between are invalidated
+    as well.
+    """
+    if connection.in_atomic_block:
+        _bump(models)
+        transaction.on_commit(lambda: _bump_committed(models))
+    else:
+        _bump_committed(models)
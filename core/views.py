@@ -0,0 +1,16 @@
+from django.http import HttpResponse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+
+from core.utils.metrics import registry
+
+
+class MetricsView(APIView):
+    """Per-route request metrics of this process in Prometheus text format."""
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return HttpResponse(
+            registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+        )
@@ -11,6 +11,6 @@ import os
 
 from django.core.wsgi import get_wsgi_application
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "star_wars_planets.settings")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.prod_settings")
 
 application = get_wsgi_application()
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class PlanetsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "planets"
+
+    def ready(self):
+        from core.utils import caching  # noqa: F401 - registers the checks
+
+        from . import signals  # noqa: F401
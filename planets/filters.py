@@ -0,0 +1,87 @@
+from django.conf import settings
+from django.db.models import Count
+from django_filters import rest_framework as filters
+from rest_framework.filters import SearchFilter
+
+from planets.models import Planet
+from planets.services.names import clean_names
+from planets.services.search import search_queryset
+
+MATCH_ANY = "any"
+MATCH_ALL = "all"
+MATCH_CHOICES = [(MATCH_ANY, "Any"), (MATCH_ALL, "All")]
+
+
+class IndexedSearchFilter(SearchFilter):
+    """
+    ``?search=`` backed by the trigram index instead of ``ICONTAINS`` scans.
+
+    Matches are ranked (exact name, name prefix, word prefix, other) unless
+    the request sets an explicit ordering. Set ``SEARCH_BACKEND = "icontains"``
+    to fall back to DRF's ``SearchFilter``.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        if settings.SEARCH_BACKEND != "trigram":
+            return super().filter_queryset(request, queryset, view)
+
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        queryset = search_queryset(queryset, terms)
+        if "ordering" not in request.query_params:
+            queryset = queryset.order_by("search_rank", "name")
+        return queryset
+
+
+class NameInFilter(filters.BaseInFilter, filters.CharFilter):
+    """Comma-separated list of names."""
+
+
+class PlanetFilter(filters.FilterSet):
+    """
+    Planet filters backed by the M2M through tables and ``population``.
+
+    ``climate`` and ``terrain`` take comma-separated names and match planets
+    having any of them, or all of them with ``climate_match=all`` /
+    ``terrain_match=all``. Both are answered from the ``(climate_id,
+    planet_id)`` / ``(terrain_id, planet_id)`` indexes of the through tables.
+    """
+
+    climate = NameInFilter(method="filter_climates")
+    climate_match = filters.ChoiceFilter(choices=MATCH_CHOICES, method="skip")
+    terrain = NameInFilter(method="filter_terrains")
+    terrain_match = filters.ChoiceFilter(choices=MATCH_CHOICES, method="skip")
+    population_min = filters.NumberFilter(field_name="population", lookup_expr="gte")
+    population_max = filters.NumberFilter(field_name="population", lookup_expr="lte")
+
+    class Meta:
+        model = Planet
+        fields = []
+
+    def skip(self, queryset, name, value):
+        return queryset
+
+    def filter_climates(self, queryset, name, value):
+        return self.filter_related(
+            queryset, Planet.climates.through, "climate", value, "climate_match"
+        )
+
+    def filter_terrains(self, queryset, name, value):
+        return self.filter_related(
+            queryset, Planet.terrains.through, "terrain", value, "terrain_match"
+        )
+
+    def filter_related(self, queryset, through, field, names, match_param):
+        names = clean_names(names)
+        if not names:
+            return queryset
+        planet_ids = through.objects.filter(**{f"{field}__name__in": names})
+        if self.form.cleaned_data.get(match_param) == MATCH_ALL:
+            planet_ids = (
+                planet_ids.values("planet_id")
+                .annotate(matched=Count(f"{field}_id"))
+                .filter(matched=len(names))
+            )
+        return queryset.filter(pk__in=planet_ids.values("planet_id"))
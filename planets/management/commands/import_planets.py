@@ -0,0 +1,58 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from planets.services import SyncResult
+from planets.services.importer import FILE_FORMATS, detect_format, iter_import_batches
+
+
+class Command(BaseCommand):
+    help = (
+        "Import planets from a JSON, NDJSON or CSV file using the SWAPI field "
+        "mapping, upserting them by name in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import.")
+        parser.add_argument(
+            "--input-format",
+            choices=sorted(set(FILE_FORMATS.values())),
+            help="File format (default: detected from the extension).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Planets written per transaction (default: SWAPI_SYNC_BATCH_SIZE).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Processes used to parse the file; one writer commits (default: 1).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            file_format = options["input_format"] or detect_format(options["path"])
+            file = open(options["path"], encoding="utf-8", newline="")
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        total = SyncResult()
+        started = time.perf_counter()
+        with file:
+            for result in iter_import_batches(
+                file, file_format, options["batch_size"], options["workers"]
+            ):
+                total.merge(result)
+                if options["verbosity"] > 1:
+                    self.stdout.write(f"{total.rows} rows...")
+        elapsed = time.perf_counter() - started
+
+        counts = ", ".join(f"{key}: {value}" for key, value in total.as_dict().items())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {total.rows} rows in {elapsed:.2f}s "
+                f"({total.rows / elapsed if elapsed else 0:.0f} rows/s) - {counts}"
+            )
+        )
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from planets.services.denormalize import iter_name_drift, rebuild_planet_names
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the denormalized climate and terrain names of every planet, "
+        "or check them for drift against the M2M tables."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report planets whose names drifted; fail if any did.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["check"]:
+            count = rebuild_planet_names()
+            self.stdout.write(f"Rebuilt the names of {count} planets.")
+            return
+
+        drifted = list(iter_name_drift())
+        if drifted:
+            sample = ", ".join(str(pk) for pk in drifted[:20])
+            raise CommandError(
+                f"{len(drifted)} planets have drifted names (ids: {sample}). "
+                "Run rebuild_planet_names to fix them."
+            )
+        self.stdout.write("No drift found.")
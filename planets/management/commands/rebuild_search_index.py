@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from planets.models import Climate, Planet, Terrain
+from planets.services.search import rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the trigram search index of planets, climates and terrains."
+
+    def handle(self, *args, **options):
+        for model in (Planet, Climate, Terrain):
+            count = rebuild_index(model)
+            self.stdout.write(f"Indexed {count} {model._meta.verbose_name_plural}.")
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from planets.services import run_pending_jobs
+
+
+class Command(BaseCommand):
+    help = "Run queued SWAPI sync jobs from the database-backed job queue."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run the jobs currently queued and exit.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Seconds to wait between queue polls (default: 2).",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            count = run_pending_jobs()
+            if count:
+                self.stdout.write(f"Ran {count} sync job(s).")
+            if options["once"]:
+                return
+            time.sleep(options["poll_interval"])
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("planets", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="planet",
+            name="fingerprint",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=64
+            ),
+        ),
+    ]
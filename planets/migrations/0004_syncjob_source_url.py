@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("planets", "0003_syncjob"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="syncjob",
+            name="source_url",
+            field=models.TextField(),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:47
+
+import re
+
+from django.db import migrations, models
+
+WORD_RE = re.compile(r"\w+")
+
+
+def name_trigrams(name):
+    """Frozen copy of ``planets.services.search.name_trigrams``."""
+    grams = set()
+    for word in WORD_RE.findall(str(name).lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def build_search_index(apps, schema_editor):
+    SearchTrigram = apps.get_model("planets", "SearchTrigram")
+    for model_name in ("planet", "climate", "terrain"):
+        model = apps.get_model("planets", model_name)
+        SearchTrigram.objects.bulk_create(
+            [
+                SearchTrigram(kind=model_name, object_id=pk, gram=gram)
+                for pk, name in model.objects.values_list("id", "name").iterator()
+                for gram in name_trigrams(name)
+            ],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("planets", "0004_syncjob_source_url"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchTrigram",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("kind", models.CharField(max_length=20)),
+                ("object_id", models.BigIntegerField()),
+                ("gram", models.CharField(max_length=3)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["object_id", "kind"], name="search_trigram_object"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("kind", "gram", "object_id"),
+                        name="search_trigram_unique",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(build_search_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:20
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+
+def build_planet_names(apps, schema_editor):
+    Planet = apps.get_model("planets", "Planet")
+    names = defaultdict(lambda: ([], []))
+    for index, field in enumerate(("climate", "terrain")):
+        through = Planet._meta.get_field(f"{field}s").remote_field.through
+        rows = through.objects.values_list("planet_id", f"{field}__name")
+        for planet_id, name in rows.iterator():
+            names[planet_id][index].append(name)
+    Planet.objects.bulk_update(
+        [
+            Planet(
+                pk=pk, climate_names=sorted(climates), terrain_names=sorted(terrains)
+            )
+            for pk, (climates, terrains) in names.items()
+        ],
+        ["climate_names", "terrain_names"],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("planets", "0005_searchtrigram"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="planet",
+            name="climate_names",
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.AddField(
+            model_name="planet",
+            name="terrain_names",
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.RunPython(build_planet_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("planets", "0006_planet_names"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="planet",
+            index=models.Index(fields=["population"], name="planet_population"),
+        ),
+        # Covering indexes for "planets with climate/terrain X". Django's own
+        # index on climate_id/terrain_id finds the rows but then reads each
+        # one for planet_id (and the unique constraint leads with planet_id);
+        # these answer the subqueries from the index alone.
+        migrations.RunSQL(
+            "CREATE INDEX planet_climates_climate_planet "
+            "ON planets_planet_climates (climate_id, planet_id)",
+            "DROP INDEX planet_climates_climate_planet",
+        ),
+        migrations.RunSQL(
+            "CREATE INDEX planet_terrains_terrain_planet "
+            "ON planets_planet_terrains (terrain_id, planet_id)",
+            "DROP INDEX planet_terrains_terrain_planet",
+        ),
+    ]
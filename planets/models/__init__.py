@@ -1,5 +1,7 @@
 from .climate import Climate
 from .planet import Planet
+from .search_trigram import SearchTrigram
+from .sync_job import SyncJob
 from .terrain import Terrain
 
-__all__ = ["Planet", "Terrain", "Climate"]
+__all__ = ["Planet", "Terrain", "Climate", "SyncJob", "SearchTrigram"]
@@ -11,6 +11,15 @@ class Planet(AuditModel):
     population = models.BigIntegerField(null=True, blank=True)
     climates = models.ManyToManyField(Climate, blank=True)
     terrains = models.ManyToManyField(Terrain, blank=True)
+    fingerprint = models.CharField(
+        max_length=64, blank=True, default="", editable=False
+    )
+    # Sorted copies of the climate and terrain names, so reads need no joins.
+    climate_names = models.JSONField(default=list, blank=True, editable=False)
+    terrain_names = models.JSONField(default=list, blank=True, editable=False)
+
+    class Meta:
+        indexes = [models.Index(fields=["population"], name="planet_population")]
 
     def __str__(self):
         return self.name
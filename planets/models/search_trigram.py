@@ -0,0 +1,26 @@
+from django.db import models
+
+
+class SearchTrigram(models.Model):
+    """
+    Inverted trigram index over the ``name`` of planets, climates and terrains.
+
+    Each row maps one trigram of a name to the object that contains it.
+    """
+
+    kind = models.CharField(max_length=20)
+    object_id = models.BigIntegerField()
+    gram = models.CharField(max_length=3)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "gram", "object_id"], name="search_trigram_unique"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["object_id", "kind"], name="search_trigram_object")
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.object_id}:{self.gram!r}"
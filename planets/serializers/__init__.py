@@ -1,5 +1,13 @@
 from .climate import ClimateSerializer
 from .planet import PlanetSerializer
+from .planet_bulk import PlanetBulkItemSerializer
+from .sync_job import SyncJobSerializer
 from .terrain import TerrainSerializer
 
-__all__ = ["PlanetSerializer", "ClimateSerializer", "TerrainSerializer"]
+__all__ = [
+    "PlanetSerializer",
+    "ClimateSerializer",
+    "TerrainSerializer",
+    "SyncJobSerializer",
+    "PlanetBulkItemSerializer",
+]
@@ -1,9 +1,11 @@
 from rest_framework import serializers
 
+from core.utils.metrics import TimedListSerializer, TimedSerializerMixin
 from planets.models import Climate
 
 
-class ClimateSerializer(serializers.ModelSerializer):
+class ClimateSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Climate
         fields = ["name"]
+        list_serializer_class = TimedListSerializer
@@ -1,9 +1,11 @@
 from rest_framework import serializers
 
+from core.utils.metrics import TimedListSerializer, TimedSerializerMixin
 from planets.models import Climate, Planet, Terrain
+from planets.services.names import resolve_names
 
 
-class PlanetSerializer(serializers.ModelSerializer):
+class PlanetSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     climates = serializers.ListField(
         child=serializers.CharField(), required=False, write_only=True
     )
@@ -15,6 +17,7 @@ class PlanetSerializer(serializers.ModelSerializer):
     class Meta:
         model = Planet
         fields = ["name", "population", "climates", "terrains"]
+        list_serializer_class = TimedListSerializer
 
     def create(self, validated_data):
         climate_names = validated_data.pop("climates", [])
@@ -28,23 +31,14 @@ class PlanetSerializer(serializers.ModelSerializer):
 
             if not created:
                 planet.population = validated_data.get("population")
+                planet.fingerprint = ""
                 planet.save()
 
             if climate_names:
-                climates = []
-                for c in climate_names:
-                    if c and c.strip():
-                        climate, _ = Climate.objects.get_or_create(name=c.strip())
-                        climates.append(climate)
-                planet.climates.set(climates)
+                planet.climates.set(resolve_names(Climate, climate_names).values())
 
             if terrain_names:
-                terrains = []
-                for t in terrain_names:
-                    if t and t.strip():
-                        terrain, _ = Terrain.objects.get_or_create(name=t.strip())
-                        terrains.append(terrain)
-                planet.terrains.set(terrains)
+                planet.terrains.set(resolve_names(Terrain, terrain_names).values())
 
             return planet
         except Exception as e:
@@ -57,23 +51,14 @@ class PlanetSerializer(serializers.ModelSerializer):
         try:
             instance.name = validated_data.get("name", instance.name)
             instance.population = validated_data.get("population", instance.population)
+            instance.fingerprint = ""
             instance.save()
 
             if climate_names is not None:
-                climates = []
-                for c in climate_names:
-                    if c and c.strip():
-                        climate, _ = Climate.objects.get_or_create(name=c.strip())
-                        climates.append(climate)
-                instance.climates.set(climates)
+                instance.climates.set(resolve_names(Climate, climate_names).values())
 
             if terrain_names is not None:
-                terrains = []
-                for t in terrain_names:
-                    if t and t.strip():
-                        terrain, _ = Terrain.objects.get_or_create(name=t.strip())
-                        terrains.append(terrain)
-                instance.terrains.set(terrains)
+                instance.terrains.set(resolve_names(Terrain, terrain_names).values())
 
             return instance
         except Exception as e:
@@ -81,17 +66,6 @@ class PlanetSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         rep = super().to_representation(instance)
-        try:
-            if hasattr(instance, "climates") and instance.climates:
-                rep["climates"] = [c.name for c in instance.climates.all()]
-            else:
-                rep["climates"] = []
-
-            if hasattr(instance, "terrains") and instance.terrains:
-                rep["terrains"] = [t.name for t in instance.terrains.all()]
-            else:
-                rep["terrains"] = []
-        except Exception as e:
-            rep["climates"] = []
-            rep["terrains"] = []
+        rep["climates"] = instance.climate_names
+        rep["terrains"] = instance.terrain_names
         return rep
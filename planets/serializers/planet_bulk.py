@@ -0,0 +1,30 @@
+from rest_framework import serializers
+
+from planets.services import normalize_swapi_planet
+
+
+class PlanetBulkItemSerializer(serializers.Serializer):
+    """
+    Validates one item of a bulk planet upsert without touching the database.
+
+    Items are upserted on their name, so unlike ``PlanetSerializer`` the name
+    is not checked for uniqueness. The validated data is a normalized record
+    ready for ``sync_planet_batch``.
+    """
+
+    name = serializers.CharField()
+    population = serializers.CharField(
+        allow_null=True, allow_blank=True, required=False, default=None
+    )
+    climates = serializers.ListField(
+        child=serializers.CharField(allow_blank=True), required=False, default=list
+    )
+    terrains = serializers.ListField(
+        child=serializers.CharField(allow_blank=True), required=False, default=list
+    )
+
+    def validate(self, attrs):
+        try:
+            return normalize_swapi_planet(attrs)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
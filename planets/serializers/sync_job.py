@@ -0,0 +1,33 @@
+from django.utils.timezone import now
+from rest_framework import serializers
+
+from planets.models import SyncJob
+
+
+class SyncJobSerializer(serializers.ModelSerializer):
+    throughput = serializers.SerializerMethodField()
+
+    class Meta:
+        model = SyncJob
+        fields = [
+            "id",
+            "status",
+            "rows_processed",
+            "created",
+            "updated",
+            "unchanged",
+            "skipped",
+            "throughput",
+            "errors",
+            "started_at",
+            "finished_at",
+        ]
+
+    def get_throughput(self, instance):
+        """Rows processed per second since the job started."""
+        if not instance.started_at:
+            return 0.0
+        elapsed = (
+            (instance.finished_at or now()) - instance.started_at
+        ).total_seconds()
+        return round(instance.rows_processed / elapsed, 2) if elapsed > 0 else 0.0
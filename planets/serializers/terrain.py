@@ -1,9 +1,11 @@
 from rest_framework import serializers
 
+from core.utils.metrics import TimedListSerializer, TimedSerializerMixin
 from planets.models import Terrain
 
 
-class TerrainSerializer(serializers.ModelSerializer):
+class TerrainSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Terrain
         fields = ["name"]
+        list_serializer_class = TimedListSerializer
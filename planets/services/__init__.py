@@ -0,0 +1,30 @@
+from .export import EXPORT_FORMATS, export_planets, iter_planet_chunks
+from .jobs import enqueue_sync_job, fail_stale_jobs, run_pending_jobs
+from .swapi import SwapiFetcher, iter_swapi_planets
+from .sync import (
+    SyncResult,
+    iter_sync_batches,
+    normalize_swapi_planet,
+    parse_population,
+    sync_planet_batch,
+    sync_planets,
+    upsert_planets,
+)
+
+__all__ = [
+    "EXPORT_FORMATS",
+    "export_planets",
+    "iter_planet_chunks",
+    "SwapiFetcher",
+    "iter_swapi_planets",
+    "SyncResult",
+    "enqueue_sync_job",
+    "fail_stale_jobs",
+    "iter_sync_batches",
+    "normalize_swapi_planet",
+    "parse_population",
+    "sync_planet_batch",
+    "run_pending_jobs",
+    "sync_planets",
+    "upsert_planets",
+]
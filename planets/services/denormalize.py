@@ -0,0 +1,76 @@
+from collections import defaultdict
+
+from django.db import transaction
+
+from core.utils.iterables import chunked
+from core.utils.versioning import bump_model_version
+from planets.models import Planet
+
+REFRESH_BATCH_SIZE = 500
+
+
+def related_names(through, field, planet_ids):
+    """Return a planet id -> sorted related names map read from ``through``."""
+    names = defaultdict(list)
+    rows = through.objects.filter(planet_id__in=planet_ids).values_list(
+        "planet_id", f"{field}__name"
+    )
+    for planet_id, name in rows:
+        names[planet_id].append(name)
+    # Sorted in Python so the order does not depend on the database collation.
+    for values in names.values():
+        values.sort()
+    return names
+
+
+def planet_names(planet_ids):
+    """
+    Return the current ``(climate names, terrain names)`` of every planet,
+    read from the M2M tables.
+    """
+    climates = related_names(Planet.climates.through, "climate", planet_ids)
+    terrains = related_names(Planet.terrains.through, "terrain", planet_ids)
+    return {pk: (climates.get(pk, []), terrains.get(pk, [])) for pk in planet_ids}
+
+
+@transaction.atomic
+def refresh_planet_names(planet_ids):
+    """
+    Rewrite ``climate_names``/``terrain_names`` of the given planets.
+
+    Returns:
+        dict: Planet id -> ``(climate names, terrain names)``
+    """
+    refreshed = {}
+    for batch in chunked(set(planet_ids), REFRESH_BATCH_SIZE):
+        names = planet_names(batch)
+        Planet.objects.bulk_update(
+            [
+                Planet(pk=pk, climate_names=climates, terrain_names=terrains)
+                for pk, (climates, terrains) in names.items()
+            ],
+            ["climate_names", "terrain_names"],
+        )
+        refreshed.update(names)
+    if refreshed:
+        bump_model_version(Planet)
+    return refreshed
+
+
+def iter_name_drift(chunk_size=REFRESH_BATCH_SIZE):
+    """Yield the ids of planets whose stored names differ from the M2M tables."""
+    rows = Planet.objects.order_by("pk").values_list(
+        "pk", "climate_names", "terrain_names"
+    )
+    for chunk in chunked(rows.iterator(chunk_size=chunk_size), chunk_size):
+        names = planet_names([row[0] for row in chunk])
+        for pk, climates, terrains in chunk:
+            if names[pk] != (climates, terrains):
+                yield pk
+
+
+def rebuild_planet_names():
+    """Refresh the names of every planet. Returns the number of planets."""
+    ids = list(Planet.objects.values_list("pk", flat=True))
+    refresh_planet_names(ids)
+    return len(ids)
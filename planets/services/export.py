@@ -0,0 +1,84 @@
+import csv
+import io
+import json
+
+from django.conf import settings
+
+from core.utils.iterables import chunked
+from planets.models import Planet
+
+NDJSON = "ndjson"
+CSV = "csv"
+EXPORT_FORMATS = {
+    NDJSON: "application/x-ndjson",
+    CSV: "text/csv",
+}
+CSV_HEADER = ["name", "population", "climate", "terrain"]
+
+
+def iter_planet_chunks(queryset=None, chunk_size=None):
+    """
+    Yield lists of exported planets, one list per ``chunk_size`` rows.
+
+    Planets, with their denormalized climate and terrain names, are read with
+    ``QuerySet.iterator`` (a server-side cursor on PostgreSQL) as plain
+    tuples, so memory only holds a single chunk at a time.
+    """
+    if queryset is None:
+        queryset = Planet.objects.order_by("name")
+    chunk_size = chunk_size or settings.PLANET_EXPORT_CHUNK_SIZE
+    rows = queryset.values_list(
+        "name", "population", "climate_names", "terrain_names"
+    ).iterator(chunk_size=chunk_size)
+    for chunk in chunked(rows, chunk_size):
+        yield [
+            {
+                "name": name,
+                "population": population,
+                "climates": climates,
+                "terrains": terrains,
+            }
+            for name, population, climates, terrains in chunk
+        ]
+
+
+def iter_ndjson(chunks):
+    """Encode planet chunks as NDJSON, one string per chunk."""
+    for chunk in chunks:
+        yield "".join(
+            json.dumps(planet, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for planet in chunk
+        )
+
+
+def iter_csv(chunks):
+    """
+    Encode planet chunks as CSV, one string per chunk.
+
+    Columns follow the SWAPI REST planet fields: climates and terrains are
+    comma-separated and an unknown population is written as ``unknown``.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+    for chunk in chunks:
+        writer.writerows(
+            [
+                planet["name"],
+                "unknown" if planet["population"] is None else planet["population"],
+                ", ".join(planet["climates"]),
+                ", ".join(planet["terrains"]),
+            ]
+            for planet in chunk
+        )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def export_planets(output, queryset=None, chunk_size=None):
+    """Stream planets in the ``output`` format (``ndjson`` or ``csv``)."""
+    chunks = iter_planet_chunks(queryset, chunk_size)
+    if output == CSV:
+        return iter_csv(chunks)
+    return iter_ndjson(chunks)
@@ -0,0 +1,143 @@
+import csv
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.conf import settings
+
+from core.utils.iterables import chunked
+from core.utils.json_stream import iter_json_array
+
+from .swapi import GRAPHQL_PLANETS_PATH, REST_PLANETS_PATH
+from .sync import SyncResult, normalize_swapi_planet, sync_planet_batch
+
+logger = logging.getLogger(__name__)
+
+JSON = "json"
+NDJSON = "ndjson"
+CSV = "csv"
+FILE_FORMATS = {
+    ".json": JSON,
+    ".ndjson": NDJSON,
+    ".jsonl": NDJSON,
+    ".csv": CSV,
+}
+
+
+def detect_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FILE_FORMATS:
+        raise ValueError(f"Cannot detect the format of {path}, use --input-format")
+    return FILE_FORMATS[extension]
+
+
+def _iter_json(file):
+    """Stream the planets of a JSON array, GraphQL document or REST page."""
+    chunks = iter(lambda: file.read(settings.SWAPI_STREAM_CHUNK_SIZE), "")
+    return iter_json_array(chunks, (), GRAPHQL_PLANETS_PATH, REST_PLANETS_PATH)
+
+
+def _iter_csv(file):
+    """
+    Stream CSV rows as SWAPI payloads.
+
+    Besides the SWAPI REST ``climate``/``terrain`` columns, ``climates`` and
+    ``terrains`` are accepted; both hold comma-separated names.
+    """
+    for row in csv.DictReader(file):
+        for plural, singular in (("climates", "climate"), ("terrains", "terrain")):
+            if plural in row:
+                row[singular] = row.pop(plural)
+        yield row
+
+
+def iter_raw_items(file, file_format):
+    """
+    Yield the raw items of an import file without decoding NDJSON lines.
+
+    NDJSON lines are left as strings so decoding them can happen in the
+    parser processes.
+    """
+    if file_format == JSON:
+        return _iter_json(file)
+    if file_format == CSV:
+        return _iter_csv(file)
+    return (line for line in file if line.strip())
+
+
+def parse_batch(items):
+    """
+    Decode and normalize a batch of raw items.
+
+    Runs in the parser processes, so it must not touch the database.
+
+    Returns:
+        tuple: Normalized records and the error of every rejected item
+    """
+    records = []
+    errors = []
+    for item in items:
+        try:
+            if isinstance(item, str):
+                item = json.loads(item)
+            records.append(normalize_swapi_planet(item))
+        except (AttributeError, ValueError) as e:
+            errors.append(str(e))
+    return records, errors
+
+
+def _iter_parsed(batches, workers):
+    """
+    Parse batches in ``workers`` processes, yielding results in file order.
+
+    At most ``2 * workers`` batches are in flight, so the file is never read
+    much further ahead than the writer.
+    """
+    if workers <= 1:
+        yield from map(parse_batch, batches)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as pool:
+        pending = []
+        for batch in batches:
+            pending.append(pool.submit(parse_batch, batch))
+            if len(pending) >= workers * 2:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+
+def iter_import_batches(file, file_format, batch_size=None, workers=1):
+    """
+    Import planets from an open file in batches, one transaction each.
+
+    Parsing can be spread over ``workers`` processes while this process is
+    the single writer, so batches are committed in file order.
+
+    Yields:
+        SyncResult: Counts and errors of each committed batch
+    """
+    batch_size = batch_size or settings.SWAPI_SYNC_BATCH_SIZE
+    batches = chunked(iter_raw_items(file, file_format), batch_size)
+    for records, errors in _iter_parsed(batches, workers):
+        result = SyncResult(skipped=len(errors), errors=errors)
+        for error in errors:
+            logger.warning("Skipping planet: %s", error)
+        result.add(sync_planet_batch(records))
+        yield result
+
+
+def import_planets(path, file_format=None, batch_size=None, workers=1):
+    """
+    Import planets from a JSON, NDJSON or CSV file.
+
+    Returns:
+        SyncResult: Created, updated, unchanged and skipped counts
+    """
+    file_format = file_format or detect_format(path)
+    total = SyncResult()
+    with open(path, encoding="utf-8", newline="") as file:
+        for result in iter_import_batches(file, file_format, batch_size, workers):
+            total.merge(result)
+    return total
@@ -0,0 +1,166 @@
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+from django.db.models import F
+from django.utils.timezone import now
+
+from core.utils.audit import acting_user
+from planets.models import SyncJob
+
+from .swapi import iter_swapi_planets
+from .sync import iter_sync_batches
+
+logger = logging.getLogger(__name__)
+
+MAX_JOB_ERRORS = 100
+STALE_JOB_ERROR = "The worker stopped before the job finished"
+
+_worker_lock = threading.Lock()
+_worker_wake = threading.Event()
+_worker_thread = None
+
+
+def enqueue_sync_job(url):
+    """
+    Queue a SWAPI sync job and make sure a local worker will pick it up.
+
+    With ``SYNC_JOB_RUNNER = "thread"`` an in-process worker thread is started
+    once the job row is committed; with ``"manual"`` jobs wait for the
+    ``run_sync_worker`` management command.
+    """
+    job = SyncJob.objects.create(source_url=url)
+    if settings.SYNC_JOB_RUNNER == "thread":
+        transaction.on_commit(start_worker)
+    return job
+
+
+def fail_stale_jobs(job_ids=None):
+    """
+    Fail running jobs (all of them, or those in ``job_ids``) whose worker
+    died: recycled, restarted or killed.
+
+    ``updated_at`` is the job's heartbeat: it is set when the job is claimed
+    and after every batch, so a running job that has not been updated for
+    ``SYNC_JOB_STALE_TIMEOUT`` seconds has no worker left. Such jobs are
+    failed rather than requeued, so a job that kills its worker is not
+    retried forever. Returns the number of jobs failed.
+    """
+    cutoff = now() - timedelta(seconds=settings.SYNC_JOB_STALE_TIMEOUT)
+    stale = SyncJob.objects.filter(status=SyncJob.RUNNING, updated_at__lt=cutoff)
+    if job_ids is not None:
+        stale = stale.filter(pk__in=job_ids)
+    failed = 0
+    for pk, errors in stale.values_list("pk", "errors"):
+        if SyncJob.objects.filter(
+            pk=pk, status=SyncJob.RUNNING, updated_at__lt=cutoff
+        ).update(
+            status=SyncJob.FAILED,
+            errors=[*errors, STALE_JOB_ERROR],
+            finished_at=now(),
+            updated_at=now(),
+        ):
+            logger.warning("Sync job %s stopped reporting progress, failed it", pk)
+            failed += 1
+    return failed
+
+
+def claim_next_job():
+    """
+    Atomically move the oldest pending job to running and return it, after
+    failing running jobs that were abandoned by their worker.
+    """
+    fail_stale_jobs()
+    for pk in (
+        SyncJob.objects.filter(status=SyncJob.PENDING)
+        .order_by("pk")
+        .values_list("pk", flat=True)[:5]
+    ):
+        claimed = SyncJob.objects.filter(pk=pk, status=SyncJob.PENDING).update(
+            status=SyncJob.RUNNING, started_at=now(), updated_at=now()
+        )
+        if claimed:
+            return SyncJob.objects.get(pk=pk)
+    return None
+
+
+def run_job(job):
+    """
+    Run a claimed sync job, committing and reporting progress per batch.
+
+    The planets written are attributed to the user who queued the job. The
+    job stops if it was failed as stale meanwhile (see :func:`fail_stale_jobs`).
+    """
+    errors = []
+    running = SyncJob.objects.filter(pk=job.pk, status=SyncJob.RUNNING)
+    try:
+        with acting_user(job.created_by):
+            for result in iter_sync_batches(iter_swapi_planets(job.source_url)):
+                errors.extend(result.errors[: MAX_JOB_ERRORS - len(errors)])
+                if not running.update(
+                    rows_processed=F("rows_processed") + result.rows,
+                    created=F("created") + result.created,
+                    updated=F("updated") + result.updated,
+                    unchanged=F("unchanged") + result.unchanged,
+                    skipped=F("skipped") + result.skipped,
+                    errors=errors,
+                    updated_at=now(),
+                ):
+                    logger.warning("Sync job %s was marked failed, stopping", job.pk)
+                    break
+    except Exception as e:
+        logger.exception("Sync job %s failed", job.pk)
+        errors.append(str(e))
+        running.update(
+            status=SyncJob.FAILED, errors=errors, finished_at=now(), updated_at=now()
+        )
+    else:
+        running.update(status=SyncJob.SUCCEEDED, finished_at=now(), updated_at=now())
+    job.refresh_from_db()
+    return job
+
+
+def run_pending_jobs():
+    """Run queued jobs until the queue is empty. Returns the number of jobs run."""
+    count = 0
+    while job := claim_next_job():
+        run_job(job)
+        count += 1
+    return count
+
+
+def _worker_loop():
+    global _worker_thread
+    try:
+        while True:
+            _worker_wake.clear()
+            close_old_connections()
+            try:
+                run_pending_jobs()
+            except Exception:
+                logger.exception("SWAPI sync worker failed to run pending jobs")
+            if _worker_wake.wait(timeout=settings.SYNC_WORKER_IDLE_TIMEOUT):
+                continue
+            with _worker_lock:
+                if not _worker_wake.is_set():
+                    _worker_thread = None
+                    return
+    finally:
+        with _worker_lock:
+            if _worker_thread is threading.current_thread():
+                _worker_thread = None
+        connections.close_all()
+
+
+def start_worker():
+    """Wake the in-process worker thread, starting it if it is not running."""
+    global _worker_thread
+    with _worker_lock:
+        _worker_wake.set()
+        if _worker_thread is None:
+            _worker_thread = threading.Thread(
+                target=_worker_loop, name="swapi-sync-worker", daemon=True
+            )
+            _worker_thread.start()
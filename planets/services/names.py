@@ -0,0 +1,138 @@
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+
+from core.utils.versioning import bump_model_version, get_model_version
+
+from .search import index_names
+
+
+def clean_names(names):
+    """Strip names, drop blanks and duplicates while keeping the original order."""
+    cleaned = []
+    for name in names or []:
+        if name and str(name).strip():
+            name = str(name).strip()
+            if name not in cleaned:
+                cleaned.append(name)
+    return cleaned
+
+
+class NameInterner:
+    """
+    Process-wide ``name -> pk`` cache for a small vocabulary model.
+
+    Entries are tagged with the model's data version and the whole cache is
+    dropped on the next lookup once it changes. The version lives in the
+    default cache, so writes in other processes are only seen when that
+    backend is shared (Redis, Memcached); with the per-process default the
+    cache is also dropped every ``NAME_INTERN_CACHE_TIMEOUT`` seconds, which
+    bounds how long a name deleted elsewhere resolves to a stale id. Entries
+    read inside a transaction are only stored once it commits, so
+    rolled-back rows never reach the cache. When empty, the cache is warmed
+    with up to ``max_size`` names in a single query; beyond that, least
+    recently used names are evicted.
+    """
+
+    def __init__(self, model, max_size=None):
+        self.model = model
+        self.max_size = max_size or settings.NAME_INTERN_CACHE_SIZE
+        self._entries = OrderedDict()
+        self._version = None
+        self._expires = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+
+    def _lookup(self, names, version):
+        now = time.monotonic()
+        with self._lock:
+            if version != self._version or now >= self._expires:
+                self._entries.clear()
+                self._version = version
+                self._expires = now + settings.NAME_INTERN_CACHE_TIMEOUT
+            found = {}
+            for name in names:
+                if name in self._entries:
+                    self._entries.move_to_end(name)
+                    found[name] = self._entries[name]
+            return found, not self._entries
+
+    def _store(self, pairs, version):
+        if get_model_version(self.model) != version:
+            return
+        with self._lock:
+            if version != self._version:
+                return
+            self._entries.update(pairs)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _remember(self, pairs, version):
+        if pairs:
+            transaction.on_commit(partial(self._store, pairs, version))
+
+    def resolve(self, names):
+        """
+        Return a ``name -> pk`` map for ``names``, creating missing rows.
+
+        Cached names cost no query; all misses are looked up together in one
+        query. Rows that do not exist yet are created in bulk, indexed for
+        search and the model version is bumped, as ``bulk_create`` bypasses
+        the model signals.
+        """
+        names = clean_names(names)
+        if not names:
+            return {}
+        version = get_model_version(self.model)
+        ids, empty = self._lookup(names, version)
+        missing = [name for name in names if name not in ids]
+        if not missing:
+            return ids
+
+        manager = self.model._default_manager
+        warm = {}
+        if empty:
+            warm = dict(manager.values_list("name", "id")[: self.max_size])
+        found = {name: warm[name] for name in missing if name in warm}
+        unresolved = [name for name in missing if name not in found]
+        # A warm-up below max_size loaded the whole vocabulary already.
+        if unresolved and (not empty or len(warm) >= self.max_size):
+            found.update(manager.filter(name__in=unresolved).values_list("name", "id"))
+        self._remember({**warm, **found}, version)
+        ids.update(found)
+
+        missing = [name for name in missing if name not in found]
+        if missing:
+            manager.bulk_create(
+                [self.model(name=name) for name in missing], ignore_conflicts=True
+            )
+            created = dict(manager.filter(name__in=missing).values_list("name", "id"))
+            index_names(self.model, {pk: name for name, pk in created.items()})
+            bump_model_version(self.model)
+            ids.update(created)
+        return ids
+
+
+_interners = {}
+_interners_lock = threading.Lock()
+
+
+def get_interner(model):
+    """Return the shared :class:`NameInterner` of ``model``."""
+    with _interners_lock:
+        if model not in _interners:
+            _interners[model] = NameInterner(model)
+        return _interners[model]
+
+
+def resolve_names(model, names):
+    """Return a ``name -> pk`` map for ``names``, creating the missing rows."""
+    return get_interner(model).resolve(names)
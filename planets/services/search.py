@@ -0,0 +1,156 @@
+import json
+import re
+
+from django.db import connections, router, transaction
+from django.db.models import Case, Count, IntegerField, Value, When
+
+from core.utils.iterables import chunked
+from planets.models import SearchTrigram
+
+WORD_RE = re.compile(r"\w+")
+INDEX_BATCH_SIZE = 1000
+
+
+def normalize_text(text):
+    return " ".join(WORD_RE.findall(str(text).lower()))
+
+
+def name_trigrams(name):
+    """
+    Trigrams of every word of ``name``, padded like ``pg_trgm``.
+
+    Words get two leading spaces and one trailing space, so ``"  t"`` and
+    ``" ta"`` mark the start of a word and prefix queries can be answered
+    from the index.
+    """
+    grams = set()
+    for word in normalize_text(name).split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def term_trigrams(term):
+    """
+    Trigrams every matching name must contain for a search ``term``.
+
+    Only the unpadded trigrams of words of three characters or more are
+    used, so matches are substrings anywhere in the name. Shorter words have
+    none; a term without trigrams is answered by ``icontains`` alone.
+    """
+    grams = set()
+    for word in normalize_text(term).split():
+        grams.update(word[i : i + 3] for i in range(len(word) - 2))
+    return grams
+
+
+def index_kind(model):
+    return model._meta.model_name
+
+
+def insert_trigrams(kind, rows):
+    """
+    Insert ``(object_id, gram)`` index rows.
+
+    SQLite and PostgreSQL expand a JSON array of the rows server-side, so
+    this is a single statement whatever the number of rows; other databases
+    use ``bulk_create`` in ``INDEX_BATCH_SIZE`` chunks.
+    """
+    connection = connections[router.db_for_write(SearchTrigram)]
+    if connection.vendor == "sqlite":
+        source = (
+            "SELECT %s, json_extract(value, '$[0]'), json_extract(value, '$[1]') "
+            "FROM json_each(%s)"
+        )
+    elif connection.vendor == "postgresql":
+        source = (
+            "SELECT %s, (entry ->> 0)::bigint, entry ->> 1 "
+            "FROM jsonb_array_elements(%s::jsonb) AS entry"
+        )
+    else:
+        SearchTrigram.objects.bulk_create(
+            [SearchTrigram(kind=kind, object_id=pk, gram=gram) for pk, gram in rows],
+            batch_size=INDEX_BATCH_SIZE,
+        )
+        return
+
+    quote = connection.ops.quote_name
+    columns = ", ".join(
+        quote(SearchTrigram._meta.get_field(name).column)
+        for name in ("kind", "object_id", "gram")
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {quote(SearchTrigram._meta.db_table)} ({columns}) {source}",
+            [kind, json.dumps(rows)],
+        )
+
+
+@transaction.atomic
+def index_names(model, names_by_id):
+    """
+    Replace the index rows of the given ``{id: name}`` objects, with two
+    statements however many objects are given.
+    """
+    if not names_by_id:
+        return
+    kind = index_kind(model)
+    SearchTrigram.objects.filter(kind=kind, object_id__in=list(names_by_id)).delete()
+    rows = [
+        (pk, gram) for pk, name in names_by_id.items() for gram in name_trigrams(name)
+    ]
+    if rows:
+        insert_trigrams(kind, rows)
+
+
+def unindex_objects(model, ids):
+    SearchTrigram.objects.filter(kind=index_kind(model), object_id__in=ids).delete()
+
+
+def rebuild_index(model):
+    """Rebuild the whole index of ``model``. Returns the number of objects indexed."""
+    SearchTrigram.objects.filter(kind=index_kind(model)).delete()
+    total = 0
+    rows = model._default_manager.order_by().values_list("id", "name")
+    for batch in chunked(rows.iterator(chunk_size=INDEX_BATCH_SIZE), INDEX_BATCH_SIZE):
+        index_names(model, dict(batch))
+        total += len(batch)
+    return total
+
+
+def search_queryset(queryset, terms):
+    """
+    Filter ``queryset`` to rows whose name contains every term.
+
+    Candidates come from the trigram index (objects having all the trigrams
+    of a term) and are then checked with a case-insensitive containment test,
+    so the table itself is never scanned. Results are annotated with
+    ``search_rank``: 0 exact match, 1 name prefix, 2 word prefix, 3 other.
+    """
+    kind = index_kind(queryset.model)
+    for term in terms:
+        grams = term_trigrams(term)
+        if not grams:
+            queryset = queryset.filter(name__icontains=term)
+            continue
+        candidates = (
+            SearchTrigram.objects.filter(kind=kind, gram__in=grams)
+            .values("object_id")
+            .annotate(matched=Count("gram"))
+            .filter(matched=len(grams))
+            .values("object_id")
+        )
+        queryset = queryset.filter(pk__in=candidates, name__icontains=term)
+
+    if terms:
+        term = terms[0]
+        queryset = queryset.annotate(
+            search_rank=Case(
+                When(name__iexact=term, then=Value(0)),
+                When(name__istartswith=term, then=Value(1)),
+                When(name__icontains=f" {term}", then=Value(2)),
+                default=Value(3),
+                output_field=IntegerField(),
+            )
+        )
+    return queryset
@@ -0,0 +1,123 @@
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg, Count, F, Sum, Window
+from django.db.models.functions import RowNumber
+
+from core.utils.versioning import get_model_version
+from planets.models import Planet
+
+
+def medians(queryset, value, group=None):
+    """
+    Median of ``value`` per ``group`` (or overall), computed in SQL.
+
+    Rows are numbered by ``value`` within each group with window functions
+    and only the one or two middle rows of every group are fetched.
+
+    Returns:
+        dict: Group value (None when ungrouped) -> median
+    """
+    partition = [group] if group else []
+    rows = (
+        queryset.filter(**{f"{value}__isnull": False})
+        .annotate(
+            position=Window(RowNumber(), partition_by=partition, order_by=value),
+            size=Window(Count("pk"), partition_by=partition),
+        )
+        .filter(position__gte=(F("size") + 1) / 2, position__lte=F("size") / 2 + 1)
+    )
+    middles = defaultdict(list)
+    if group is None:
+        middles[None] = list(rows.values_list(value, flat=True))
+    else:
+        for key, number in rows.values_list(group, value):
+            middles[key].append(number)
+    return {
+        key: sum(numbers) / len(numbers) for key, numbers in middles.items() if numbers
+    }
+
+
+def population_summary(total, known, average, median):
+    return {
+        "total": total,
+        "known": known,
+        "average": average,
+        "median": median,
+    }
+
+
+def facet_stats(through, field, planets=None):
+    """
+    Planet count and population aggregates per climate or terrain.
+
+    Grouped over the M2M ``through`` table, optionally restricted to the
+    ``planets`` queryset, and ordered by planet count.
+    """
+    rows = through.objects.all()
+    if planets is not None:
+        rows = rows.filter(planet_id__in=planets.values("pk"))
+    name = f"{field}__name"
+    facets = (
+        rows.values(name)
+        .annotate(
+            planets=Count("planet_id"),
+            known=Count("planet__population"),
+            total=Sum("planet__population"),
+            average=Avg("planet__population"),
+        )
+        .order_by("-planets", name)
+    )
+    median_by_name = medians(rows, "planet__population", name)
+    return [
+        {
+            "name": facet[name],
+            "planets": facet["planets"],
+            "population": population_summary(
+                facet["total"],
+                facet["known"],
+                facet["average"],
+                median_by_name.get(facet[name]),
+            ),
+        }
+        for facet in facets
+    ]
+
+
+def compute_planet_stats(planets=None):
+    """Facet counts and population aggregates of ``planets`` (default: all)."""
+    queryset = Planet.objects.all() if planets is None else planets
+    summary = queryset.order_by().aggregate(
+        planets=Count("pk"),
+        known=Count("population"),
+        total=Sum("population"),
+        average=Avg("population"),
+    )
+    return {
+        "planets": summary["planets"],
+        "population": population_summary(
+            summary["total"],
+            summary["known"],
+            summary["average"],
+            medians(queryset.order_by(), "population").get(None),
+        ),
+        "climates": facet_stats(Planet.climates.through, "climate", planets),
+        "terrains": facet_stats(Planet.terrains.through, "terrain", planets),
+    }
+
+
+def get_planet_stats():
+    """
+    Catalogue-wide stats, cached until the next planet write.
+
+    The rollup is keyed by the planet data version, which every planet,
+    relation and climate/terrain write bumps, so it is recomputed at most
+    once per change however often it is polled.
+    """
+    key = f"planet-stats:{get_model_version(Planet)}"
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_planet_stats()
+        cache.set(key, stats, settings.PLANET_STATS_CACHE_TIMEOUT)
+    return stats
@@ -0,0 +1,217 @@
+import asyncio
+import logging
+import math
+import queue
+import threading
+from itertools import chain
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from core.utils.iterables import chunked
+from core.utils.json_stream import iter_json_array
+
+logger = logging.getLogger(__name__)
+
+GRAPHQL_PLANETS_PATH = ("data", "allPlanets", "planets")
+REST_PLANETS_PATH = ("results",)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+_DONE = object()
+
+
+class RetryableResponse(requests.RequestException):
+    """Upstream answered with a status code worth retrying."""
+
+
+class _Cancelled(Exception):
+    """The consumer stopped reading batches."""
+
+
+class _PartialPage(Exception):
+    """A page failed after part of it was emitted."""
+
+
+RETRYABLE_ERRORS = (
+    RetryableResponse,
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+def split_urls(urls):
+    """Accept a comma-separated string or a list of SWAPI URLs."""
+    if isinstance(urls, str):
+        urls = urls.split(",")
+    return [url.strip() for url in urls if url and url.strip()]
+
+
+def build_session(pool_size):
+    """Create a keep-alive HTTP session with a connection pool of ``pool_size``."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _page_url(url, page):
+    parts = urlsplit(url)
+    query = parse_qs(parts.query)
+    query["page"] = [str(page)]
+    return urlunsplit(parts._replace(query=urlencode(query, doseq=True)))
+
+
+class SwapiFetcher:
+    """
+    Concurrent fetcher for one or more SWAPI planet sources.
+
+    Sources are fetched in parallel on an asyncio event loop, with at most
+    ``concurrency`` requests in flight over a shared pooled session. Both the
+    GraphQL document (``data.allPlanets.planets``) and the paginated REST
+    envelope (``results`` / ``next``) are supported; REST pages past the
+    first one are requested in parallel when the page count is known.
+
+    Each response is parsed incrementally and handed over in batches through
+    a bounded queue, so the database writer consumes batches while later
+    pages are still being downloaded.
+    """
+
+    def __init__(
+        self,
+        urls,
+        concurrency=None,
+        timeout=None,
+        retries=None,
+        backoff=None,
+        batch_size=None,
+        queue_size=None,
+        session=None,
+    ):
+        self.urls = split_urls(urls)
+        self.concurrency = concurrency or settings.SWAPI_FETCH_CONCURRENCY
+        self.timeout = timeout or settings.SWAPI_FETCH_TIMEOUT
+        self.retries = settings.SWAPI_FETCH_RETRIES if retries is None else retries
+        self.backoff = settings.SWAPI_FETCH_BACKOFF if backoff is None else backoff
+        self.batch_size = batch_size or settings.SWAPI_SYNC_BATCH_SIZE
+        self.session = session or build_session(self.concurrency)
+        self._queue = queue.Queue(maxsize=queue_size or self.concurrency * 2)
+        self._stopped = threading.Event()
+
+    def iter_batches(self):
+        """Yield lists of raw planet payloads as soon as they are fetched."""
+        producer = threading.Thread(
+            target=self._produce, name="swapi-fetcher", daemon=True
+        )
+        producer.start()
+        try:
+            while (batch := self._queue.get()) is not _DONE:
+                if isinstance(batch, BaseException):
+                    raise Exception(f"Request to SWAPI failed: {str(batch)}")
+                yield batch
+        finally:
+            self._stopped.set()
+            producer.join()
+
+    def iter_planets(self):
+        """Yield raw planet payloads one at a time."""
+        return chain.from_iterable(self.iter_batches())
+
+    def _produce(self):
+        try:
+            asyncio.run(self._fetch_all())
+        except _Cancelled:
+            return
+        except Exception as e:
+            self._emit(e)
+        else:
+            self._emit(_DONE)
+
+    def _emit(self, item):
+        """Queue ``item`` for the consumer. Returns False once it has stopped."""
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    async def _fetch_all(self):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        await asyncio.gather(*(self._fetch_source(url, semaphore) for url in self.urls))
+
+    async def _fetch_source(self, url, semaphore):
+        meta, count = await self._fetch_page(url, semaphore)
+        next_url = meta.get("next")
+        total = meta.get("count")
+        if next_url and isinstance(total, int) and count and "page=" in next_url:
+            pages = math.ceil(total / count)
+            await asyncio.gather(
+                *(
+                    self._fetch_page(_page_url(next_url, page), semaphore)
+                    for page in range(2, pages + 1)
+                )
+            )
+            return
+        while next_url:
+            meta, _ = await self._fetch_page(next_url, semaphore)
+            next_url = meta.get("next")
+
+    async def _fetch_page(self, url, semaphore):
+        attempt = 0
+        while True:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(self._download, url)
+                except _PartialPage as e:
+                    raise e.__cause__
+                except RETRYABLE_ERRORS as e:
+                    if attempt >= self.retries or self._stopped.is_set():
+                        raise
+                    error = e
+            delay = self.backoff * 2**attempt
+            attempt += 1
+            logger.warning(
+                "Retrying %s in %.2fs (attempt %s): %s", url, delay, attempt, error
+            )
+            await asyncio.sleep(delay)
+
+    def _download(self, url):
+        """Fetch and stream-parse one page. Returns its top-level metadata."""
+        meta = {}
+        count = 0
+        with self.session.get(url, stream=True, timeout=self.timeout) as response:
+            if response.status_code in RETRY_STATUS_CODES:
+                raise RetryableResponse(f"{response.status_code} for url: {url}")
+            response.raise_for_status()
+            items = iter_json_array(
+                response.iter_content(chunk_size=settings.SWAPI_STREAM_CHUNK_SIZE),
+                GRAPHQL_PLANETS_PATH,
+                REST_PLANETS_PATH,
+                meta=meta,
+            )
+            try:
+                for batch in chunked(items, self.batch_size):
+                    count += len(batch)
+                    if not self._emit(batch):
+                        raise _Cancelled()
+            except RETRYABLE_ERRORS as e:
+                if not count:
+                    raise
+                # Items were already handed to the writer: retrying the page
+                # would only duplicate them, so give up on it instead.
+                raise _PartialPage() from e
+        return meta, count
+
+
+def iter_swapi_planets(urls, **kwargs):
+    """
+    Fetch SWAPI planets from one or more comma-separated URLs.
+
+    See :class:`SwapiFetcher` for the available options.
+    """
+    return SwapiFetcher(urls, **kwargs).iter_planets()
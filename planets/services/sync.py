@@ -0,0 +1,291 @@
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.timezone import now
+
+from core.utils.iterables import chunked
+from core.utils.versioning import bump_model_version
+from planets.models import Climate, Planet, Terrain
+
+from .names import clean_names, resolve_names
+from .search import index_names
+
+logger = logging.getLogger(__name__)
+
+CREATED = "created"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+
+NAME_MAX_LENGTH = Planet._meta.get_field("name").max_length
+
+
+@dataclass
+class SyncResult:
+    """Aggregated outcome of a planet sync run."""
+
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+    errors: list = field(default_factory=list)
+
+    @property
+    def processed(self):
+        return self.created + self.updated + self.unchanged
+
+    @property
+    def rows(self):
+        return self.processed + self.skipped
+
+    def add(self, statuses):
+        for status in statuses.values():
+            setattr(self, status, getattr(self, status) + 1)
+
+    def merge(self, other):
+        self.created += other.created
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        self.skipped += other.skipped
+        self.errors.extend(other.errors)
+
+    def as_dict(self):
+        return {
+            "created": self.created,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "skipped": self.skipped,
+        }
+
+
+def parse_population(value):
+    """Convert a SWAPI population value to an integer, ``"unknown"`` to None."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    if value in ("", "unknown"):
+        return None
+    try:
+        return int(Decimal(value))
+    except (InvalidOperation, ValueError):
+        raise ValueError(f"Invalid population: {value!r}")
+
+
+def _names_field(item, key, rest_key):
+    """Read a GraphQL name list or a comma-separated SWAPI REST string."""
+    names = item.get(key)
+    if names is None and isinstance(item.get(rest_key), str):
+        names = [
+            name for name in item[rest_key].split(",") if name.strip() != "unknown"
+        ]
+    return names
+
+
+def normalize_swapi_planet(item):
+    """
+    Map a SWAPI planet payload to the record format used by the sync engine.
+
+    Raises:
+        ValueError: If the payload has no usable name or population.
+    """
+    name = str(item.get("name") or "").strip()
+    if not name:
+        raise ValueError("Planet without name")
+    if len(name) > NAME_MAX_LENGTH:
+        raise ValueError(f"Planet name too long: {name[:20]}...")
+
+    return {
+        "name": name,
+        "population": parse_population(item.get("population")),
+        "climates": clean_names(_names_field(item, "climates", "climate")),
+        "terrains": clean_names(_names_field(item, "terrains", "terrain")),
+    }
+
+
+def planet_fingerprint(record):
+    """
+    Hash the synced content of a planet record.
+
+    Climate and terrain order is irrelevant, so both lists are sorted before
+    hashing.
+    """
+    content = json.dumps(
+        [
+            record["name"],
+            record["population"],
+            sorted(record["climates"]),
+            sorted(record["terrains"]),
+        ],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def _replace_links(through, field, links):
+    through.objects.filter(planet_id__in=list(links)).delete()
+    through.objects.bulk_create(
+        [
+            through(planet_id=planet_id, **{field: related_id})
+            for planet_id, related_ids in links.items()
+            for related_id in related_ids
+        ]
+    )
+
+
+@transaction.atomic
+def sync_planet_batch(records):
+    """
+    Upsert a batch of normalized planet records with a fixed number of queries.
+
+    Incoming records are compared against the stored planet fingerprints in a
+    single lookup and only new or changed planets are written: climates and
+    terrains are created in bulk, planets are upserted on their unique name
+    and the M2M through rows of every written planet are rebuilt.
+
+    Returns:
+        dict: Planet name -> ``"created"``, ``"updated"`` or ``"unchanged"``
+    """
+    planets = {record["name"]: record for record in records}
+    if not planets:
+        return {}
+
+    existing = {
+        name: (pk, fingerprint)
+        for name, pk, fingerprint in Planet.objects.filter(
+            name__in=list(planets)
+        ).values_list("name", "id", "fingerprint")
+    }
+
+    statuses = {}
+    to_write = []
+    timestamp = now()
+    for name, record in planets.items():
+        fingerprint = planet_fingerprint(record)
+        if name in existing:
+            if existing[name][1] == fingerprint:
+                statuses[name] = UNCHANGED
+                continue
+            statuses[name] = UPDATED
+        else:
+            statuses[name] = CREATED
+
+        to_write.append(
+            Planet(
+                name=name,
+                population=record["population"],
+                fingerprint=fingerprint,
+                climate_names=sorted(record["climates"]),
+                terrain_names=sorted(record["terrains"]),
+                updated_at=timestamp,
+            )
+        )
+
+    if not to_write:
+        return statuses
+
+    written = [planets[planet.name] for planet in to_write]
+    climate_ids = resolve_names(Climate, (c for r in written for c in r["climates"]))
+    terrain_ids = resolve_names(Terrain, (t for r in written for t in r["terrains"]))
+
+    Planet.objects.bulk_create(
+        to_write,
+        update_conflicts=True,
+        unique_fields=["name"],
+        update_fields=[
+            "population",
+            "fingerprint",
+            "climate_names",
+            "terrain_names",
+            "updated_at",
+            "updated_by",
+        ],
+    )
+
+    planet_ids = {name: pk for name, (pk, _) in existing.items()}
+    created_names = [name for name, status in statuses.items() if status == CREATED]
+    if created_names:
+        created_ids = dict(
+            Planet.objects.filter(name__in=created_names).values_list("name", "id")
+        )
+        index_names(Planet, {pk: name for name, pk in created_ids.items()})
+        planet_ids.update(created_ids)
+
+    _replace_links(
+        Planet.climates.through,
+        "climate_id",
+        {
+            planet_ids[r["name"]]: {climate_ids[c] for c in r["climates"]}
+            for r in written
+        },
+    )
+    _replace_links(
+        Planet.terrains.through,
+        "terrain_id",
+        {
+            planet_ids[r["name"]]: {terrain_ids[t] for t in r["terrains"]}
+            for r in written
+        },
+    )
+    # Bulk writes bypass the model signals that invalidate cached data.
+    bump_model_version(Planet)
+    return statuses
+
+
+@transaction.atomic
+def upsert_planets(records, batch_size=None):
+    """
+    Upsert normalized planet records in a single transaction.
+
+    Records are written with ``sync_planet_batch`` in batches of
+    ``batch_size``; when a name appears more than once the last record wins.
+
+    Returns:
+        dict: Planet name -> ``"created"``, ``"updated"`` or ``"unchanged"``
+    """
+    statuses = {}
+    records = {record["name"]: record for record in records}.values()
+    batch_size = batch_size or settings.SWAPI_SYNC_BATCH_SIZE
+    for batch in chunked(records, batch_size):
+        statuses.update(sync_planet_batch(batch))
+    return statuses
+
+
+def iter_sync_batches(items, batch_size=None):
+    """
+    Sync raw SWAPI planet payloads in fixed-size batches, one transaction each.
+
+    Invalid payloads are logged and counted as skipped.
+
+    Yields:
+        SyncResult: Counts and skip reasons of each committed batch
+    """
+    batch_size = batch_size or settings.SWAPI_SYNC_BATCH_SIZE
+    for batch in chunked(items, batch_size):
+        result = SyncResult()
+        records = []
+        for item in batch:
+            try:
+                records.append(normalize_swapi_planet(item))
+            except (AttributeError, ValueError) as e:
+                logger.warning("Skipping SWAPI planet %r: %s", item, e)
+                result.skipped += 1
+                result.errors.append(str(e))
+        result.add(sync_planet_batch(records))
+        yield result
+
+
+def sync_planets(items, batch_size=None):
+    """
+    Sync raw SWAPI planet payloads into the database in fixed-size batches.
+
+    Returns:
+        SyncResult: Created, updated, unchanged and skipped counts
+    """
+    total = SyncResult()
+    for result in iter_sync_batches(items, batch_size):
+        total.merge(result)
+    return total
@@ -0,0 +1,94 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from core.utils.versioning import bump_model_version
+from planets.models import Climate, Planet, Terrain
+from planets.services.denormalize import refresh_planet_names
+from planets.services.names import get_interner
+from planets.services.search import index_names, unindex_objects
+
+M2M_WRITE_ACTIONS = {"post_add", "post_remove", "post_clear"}
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, **kwargs):
+    # Drops the users cached by core.utils.authentication in every process.
+    bump_model_version(User)
+
+
+@receiver(post_save, sender=Planet)
+@receiver(post_delete, sender=Planet)
+def planet_changed(sender, **kwargs):
+    bump_model_version(Planet)
+
+
+@receiver(post_save, sender=Climate)
+@receiver(post_delete, sender=Climate)
+@receiver(post_save, sender=Terrain)
+@receiver(post_delete, sender=Terrain)
+def vocabulary_changed(sender, **kwargs):
+    # Planet representations and filters include climate and terrain names.
+    bump_model_version(sender, Planet)
+    get_interner(sender).invalidate()
+
+
+@receiver(m2m_changed, sender=Planet.climates.through)
+@receiver(m2m_changed, sender=Planet.terrains.through)
+def planet_relations_changed(sender, action, **kwargs):
+    if action in M2M_WRITE_ACTIONS:
+        bump_model_version(Planet)
+
+
+@receiver(post_save, sender=Planet)
+@receiver(post_save, sender=Climate)
+@receiver(post_save, sender=Terrain)
+def index_search_name(sender, instance, **kwargs):
+    index_names(sender, {instance.pk: instance.name})
+
+
+@receiver(post_delete, sender=Planet)
+@receiver(post_delete, sender=Climate)
+@receiver(post_delete, sender=Terrain)
+def unindex_search_name(sender, instance, **kwargs):
+    unindex_objects(sender, [instance.pk])
+
+
+@receiver(m2m_changed, sender=Planet.climates.through)
+@receiver(m2m_changed, sender=Planet.terrains.through)
+def refresh_relation_names(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse and action == "pre_clear":
+        # The planets of a cleared climate/terrain are unknown after the fact.
+        instance._cleared_planet_ids = list(
+            instance.planet_set.values_list("pk", flat=True)
+        )
+    if action not in M2M_WRITE_ACTIONS:
+        return
+    if not reverse:
+        names = refresh_planet_names([instance.pk])[instance.pk]
+        instance.climate_names, instance.terrain_names = names
+    elif action == "post_clear":
+        refresh_planet_names(instance.__dict__.pop("_cleared_planet_ids", []))
+    else:
+        refresh_planet_names(pk_set)
+
+
+@receiver(post_save, sender=Climate)
+@receiver(post_save, sender=Terrain)
+def refresh_renamed_names(sender, instance, created, **kwargs):
+    if not created:
+        refresh_planet_names(instance.planet_set.values_list("pk", flat=True))
+
+
+@receiver(pre_delete, sender=Climate)
+@receiver(pre_delete, sender=Terrain)
+def collect_deleted_names(sender, instance, **kwargs):
+    instance._planet_ids = list(instance.planet_set.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Climate)
+@receiver(post_delete, sender=Terrain)
+def refresh_deleted_names(sender, instance, **kwargs):
+    refresh_planet_names(getattr(instance, "_planet_ids", []))
@@ -0,0 +1,127 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import include, path
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.throttling import AnonRateThrottle
+
+from planets.services import sync_planets
+from planets.tests.test_sync import swapi_planet
+from planets.urls import router
+from planets.views import PlanetViewSet
+from planets.views.async_read import async_read_urls
+
+
+class OncePerMinute(AnonRateThrottle):
+    rate = "1/min"
+
+
+urlpatterns = [path("api/", include(async_read_urls(router) + router.urls))]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncReadViewTestCase(APITestCase):
+    """Test cases for the async list/retrieve views"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        cache.clear()
+        sync_planets(
+            [swapi_planet(f"Planet {i:02}", str(i), ["arid"]) for i in range(35)]
+        )
+
+    async def test_async_list_matches_viewset(self):
+        """Test the async list returns the same page as the viewset"""
+        response = await self.async_client.get("/api/planets/", {"page": "2"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Unsupported params are served by the viewset itself.
+        expected = await self.async_client.get(
+            "/api/planets/", {"page": "2", "pagination": "page"}
+        )
+        data = response.json()
+        self.assertEqual(data["results"], expected.json()["results"])
+        self.assertEqual((data["count"], data["total_pages"]), (35, 2))
+        self.assertIsNone(data["next"])
+        self.assertEqual(data["previous"], "http://testserver/api/planets/")
+        self.assertEqual(
+            data["results"][0],
+            {
+                "name": "Planet 30",
+                "population": "30",
+                "climates": ["arid"],
+                "terrains": ["desert"],
+            },
+        )
+
+    async def test_async_list_search_and_invalid_page(self):
+        """Test search is applied and out-of-range pages are 404"""
+        response = await self.async_client.get("/api/planets/", {"search": "net 07"})
+        self.assertEqual([p["name"] for p in response.json()["results"]], ["Planet 07"])
+        response = await self.async_client.get("/api/planets/", {"page": "9"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_async_retrieve_and_etag(self):
+        """Test retrieve serves details, 404s and conditional requests"""
+        response = await self.async_client.get("/api/climates/1/")
+        self.assertEqual(response.json(), {"name": "arid"})
+        response = await self.async_client.get(
+            "/api/climates/1/", headers={"If-None-Match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        response = await self.async_client.get("/api/climates/999/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_async_headers_match_viewset(self):
+        """Test async responses carry the viewset's Allow and Vary headers"""
+        for url, fallback_params in (
+            ("/api/planets/", {"pagination": "page"}),
+            ("/api/planets/1/", {"format": "json"}),
+        ):
+            response = await self.async_client.get(url)
+            expected = await self.async_client.get(url, fallback_params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response["Allow"], expected["Allow"])
+            self.assertEqual(response["Vary"], expected["Vary"])
+            self.assertIn("Accept", response["Vary"])
+            response = await self.async_client.get(
+                url, headers={"If-None-Match": response["ETag"]}
+            )
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(response["Allow"], expected["Allow"])
+        self.assertEqual(response["Allow"], "GET, PUT, PATCH, DELETE, HEAD, OPTIONS")
+
+    async def test_extra_actions_are_not_detail_routes(self):
+        """Test list-level actions are not shadowed by the async detail route"""
+        response = await self.async_client.get("/api/planets/stats/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["data"]["planets"], 35)
+
+    async def test_async_read_checks_credentials(self):
+        """Test bad tokens are rejected by the async views as by the viewset"""
+        for url in ("/api/planets/", "/api/climates/1/"):
+            response = await self.async_client.get(
+                url, headers={"Authorization": "Bearer garbage"}
+            )
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+            self.assertIn("WWW-Authenticate", response)
+            expected = await self.async_client.get(
+                url,
+                {"pagination": "page"},
+                headers={"Authorization": "Bearer garbage"},
+            )
+            self.assertEqual(response.json(), expected.json())
+
+    async def test_async_read_is_throttled(self):
+        """Test the viewset's throttles apply to the async views"""
+        with mock.patch.object(PlanetViewSet, "throttle_classes", [OncePerMinute]):
+            first = await self.async_client.get("/api/planets/")
+            second = await self.async_client.get("/api/planets/")
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_writes_fall_back_to_viewset(self):
+        """Test non-read requests are handled by the DRF viewset"""
+        response = self.client.post("/api/planets/", {"name": "Hoth"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
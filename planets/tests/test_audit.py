@@ -0,0 +1,83 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.utils.audit import acting_user
+from planets.models import Climate, Planet
+from planets.tests.test_sync import swapi_planet
+
+
+class AuditFieldsTestCase(APITestCase):
+    """Test cases for the created_by/updated_by audit fields"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        self.user = User.objects.create_user(username="testuser", password="testpass")
+        self.other = User.objects.create_user(username="other", password="otherpass")
+
+    def test_request_user_stamped_on_save(self):
+        """Test API writes are attributed to the authenticated user"""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            reverse("planet-list"),
+            {"name": "Tatooine", "population": "1000", "climates": ["arid"]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        planet = Planet.objects.get(name="Tatooine")
+        self.assertEqual((planet.created_by, planet.updated_by), (self.user, self.user))
+        self.assertEqual(Climate.objects.get(name="arid").created_by, self.user)
+
+        self.client.force_authenticate(user=self.other)
+        self.client.patch(
+            reverse("planet-detail", args=[planet.pk]),
+            {"population": "2000"},
+            format="json",
+        )
+        planet.refresh_from_db()
+        self.assertEqual(
+            (planet.created_by, planet.updated_by), (self.user, self.other)
+        )
+
+    def test_bulk_paths_stamped(self):
+        """Test bulk_create upserts and bulk_update carry the acting user"""
+        with acting_user(self.user):
+            Planet.objects.create(name="Tatooine")
+        self.client.force_authenticate(user=self.other)
+        self.client.post(
+            reverse("planet-bulk-upsert"),
+            [swapi_planet("Tatooine", "200000"), swapi_planet("Hoth")],
+            format="json",
+        )
+        tatooine = Planet.objects.get(name="Tatooine")
+        self.assertEqual(
+            (tatooine.created_by, tatooine.updated_by), (self.user, self.other)
+        )
+        hoth = Planet.objects.get(name="Hoth")
+        self.assertEqual((hoth.created_by, hoth.updated_by), (self.other, self.other))
+
+        with acting_user(self.user):
+            Planet.objects.bulk_update([hoth], ["population", "updated_by"])
+            Planet.objects.bulk_update([tatooine], ["population"])
+        hoth.refresh_from_db()
+        tatooine.refresh_from_db()
+        self.assertEqual(
+            (hoth.updated_by, tatooine.updated_by), (self.user, self.other)
+        )
+
+    async def test_acting_user_follows_async_calls(self):
+        """Test the acting user is seen by ORM calls in sync_to_async threads"""
+        user = await User.objects.aget(username="testuser")
+        with acting_user(user):
+            climate = await sync_to_async(Climate.objects.create)(name="windy")
+        self.assertEqual(climate.created_by_id, user.pk)
+
+    def test_deleting_user_keeps_rows(self):
+        """Test audit references are cleared when the user is deleted"""
+        with acting_user(self.user):
+            Planet.objects.create(name="Tatooine")
+        self.user.delete()
+        planet = Planet.objects.get(name="Tatooine")
+        self.assertIsNone(planet.created_by)
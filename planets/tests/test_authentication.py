@@ -0,0 +1,56 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.utils.authentication import user_cache
+
+
+class CachedJWTAuthenticationTestCase(APITestCase):
+    """Test cases for the cached JWT authentication"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        cache.clear()
+        user_cache.invalidate()
+        self.created = []
+        self.user = User.objects.create_user(username="testuser", password="testpass")
+        response = self.client.post(
+            reverse("token_obtain_pair"),
+            {"username": "testuser", "password": "testpass"},
+            format="json",
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+    def user_queries(self):
+        """Create a climate and return the queries on the user table"""
+        name = f"climate {len(self.created)}"
+        self.created.append(name)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse("climate-list"), {"name": name})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return [q["sql"] for q in queries if 'FROM "auth_user"' in q["sql"]]
+
+    def test_user_cached_between_requests(self):
+        """Test only the first authenticated request loads the user"""
+        self.assertEqual(len(self.user_queries()), 1)
+        self.assertEqual(self.user_queries(), [])
+        self.assertEqual(self.user_queries(), [])
+
+    def test_user_change_invalidates_cache(self):
+        """Test a deactivated user is rejected on the next request"""
+        self.user_queries()
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get(reverse("climate-list"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(JWT_USER_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self):
+        """Test the user is loaded on every request without the cache"""
+        self.assertEqual(len(self.user_queries()), 1)
+        self.assertEqual(len(self.user_queries()), 1)
@@ -0,0 +1,128 @@
+import json
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from planets.models import Planet
+from planets.tests.test_sync import swapi_planet
+
+
+class PlanetBulkUpsertTestCase(APITestCase):
+    """Test cases for the bulk planet upsert endpoint"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        self.user = User.objects.create_user(username="testuser", password="testpass")
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("planet-bulk-upsert")
+
+    def test_bulk_upsert_json_array(self):
+        """Test a JSON array creates new planets and updates existing ones"""
+        Planet.objects.create(name="Tatooine", population=1)
+        response = self.client.post(
+            self.url,
+            [swapi_planet("Tatooine", "200000"), swapi_planet("Hoth", None)],
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data["data"]
+        self.assertEqual((data["created"], data["updated"]), (1, 1))
+        self.assertEqual(
+            [result["status"] for result in data["results"]], ["updated", "created"]
+        )
+        self.assertEqual(Planet.objects.get(name="Tatooine").population, 200000)
+        self.assertEqual(
+            list(
+                Planet.objects.get(name="Hoth").climates.values_list("name", flat=True)
+            ),
+            ["arid"],
+        )
+
+    def test_bulk_upsert_ndjson(self):
+        """Test NDJSON bodies are parsed line by line"""
+        body = "\n".join(
+            json.dumps(swapi_planet(name)) for name in ["Naboo", "Endor", ""]
+        )
+        response = self.client.post(self.url, body, content_type="application/x-ndjson")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"]["created"], 2)
+        self.assertEqual(Planet.objects.count(), 2)
+
+    def test_bulk_upsert_reports_invalid_items(self):
+        """Test invalid items are reported while valid ones are written"""
+        response = self.client.post(
+            self.url,
+            [swapi_planet("Naboo"), swapi_planet("Hoth", "lots"), {"name": ""}],
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data["data"]
+        self.assertEqual((data["created"], data["invalid"]), (1, 2))
+        self.assertEqual(data["results"][1]["status"], "invalid")
+        self.assertEqual(list(Planet.objects.values_list("name", flat=True)), ["Naboo"])
+
+    def test_bulk_upsert_duplicate_names(self):
+        """Test only the last item of a repeated name is written and counted"""
+        response = self.client.post(
+            self.url,
+            [
+                swapi_planet("Hoth", "1"),
+                swapi_planet("Naboo"),
+                swapi_planet("Hoth", "2"),
+            ],
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data["data"]
+        self.assertEqual((data["created"], data["superseded"]), (2, 1))
+        self.assertEqual(
+            [result["status"] for result in data["results"]],
+            ["superseded", "created", "created"],
+        )
+        self.assertEqual(data["results"][0]["superseded_by"], 2)
+        self.assertEqual(Planet.objects.get(name="Hoth").population, 2)
+
+    def test_bulk_upsert_rejects_malformed_body(self):
+        """Test non-array payloads and broken NDJSON are rejected"""
+        response = self.client.post(self.url, {"name": "Naboo"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(
+            self.url, '{"name": "Naboo"}\n{broken', content_type="application/x-ndjson"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("line 2", response.data["data"])
+
+    def test_bulk_upsert_rejects_unsupported_media_type(self):
+        """Test unsupported content types are rejected with a 415"""
+        response = self.client.post(
+            self.url, "name,population\nNaboo,1", content_type="text/csv"
+        )
+        self.assertEqual(response.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+        self.assertTrue(response.data["error"])
+        self.assertIn("text/csv", response.data["data"])
+
+    def test_bulk_upsert_query_count_is_constant(self):
+        """Test the number of queries does not grow with the number of items"""
+
+        def count_queries(names):
+            payload = [
+                swapi_planet(name, climates=[name], terrains=[name]) for name in names
+            ]
+            with CaptureQueriesContext(connection) as queries:
+                self.client.post(self.url, payload, format="json")
+            return len(queries)
+
+        small = count_queries([f"Small {i}" for i in range(3)])
+        large = count_queries([f"Large {i}" for i in range(30)])
+        self.assertEqual(small, large)
+
+    def test_bulk_upsert_requires_authentication(self):
+        """Test anonymous users cannot bulk upsert"""
+        self.client.force_authenticate(user=None)
+        response = self.client.post(self.url, [swapi_planet("Naboo")], format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,101 @@
+import tempfile
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.utils.caching import check_shared_cache
+from planets.models import Climate, Planet
+
+
+class ResponseCacheTestCase(APITestCase):
+    """Test cases for the versioned response cache and conditional GETs"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        cache.clear()
+        self.user = User.objects.create_user(username="testuser", password="testpass")
+        self.planet = Planet.objects.create(name="Tatooine", population=200000)
+        self.planet.climates.add(Climate.objects.create(name="arid"))
+
+    def get(self, url, **headers):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, **headers)
+        return response, len(ctx.captured_queries)
+
+    def test_repeated_reads_are_served_from_cache(self):
+        """Test a second identical GET does not query the database"""
+        url = reverse("planet-list")
+        first, queries = self.get(url)
+        self.assertGreater(queries, 0)
+        second, queries = self.get(url)
+        self.assertEqual(queries, 0)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_if_none_match_returns_304_without_queries(self):
+        """Test a matching ETag is answered with 304 and no database access"""
+        url = reverse("planet-detail", kwargs={"pk": self.planet.pk})
+        etag = self.get(url)[0]["ETag"]
+        response, queries = self.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(queries, 0)
+
+    def test_writes_invalidate_cached_responses(self):
+        """Test API writes and related renames change the ETag and content"""
+        url = reverse("planet-list")
+        etag = self.get(url)[0]["ETag"]
+
+        self.client.force_authenticate(user=self.user)
+        self.client.post(url, {"name": "Hoth"}, format="json")
+        self.client.force_authenticate(user=None)
+        response, _ = self.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+
+        climate = Climate.objects.get(name="arid")
+        climate.name = "dry"
+        climate.save()
+        detail = reverse("planet-detail", kwargs={"pk": self.planet.pk})
+        self.assertEqual(self.get(detail)[0].data["climates"], ["dry"])
+
+    def test_query_params_are_part_of_the_key(self):
+        """Test different query strings are cached separately"""
+        url = reverse("planet-list")
+        self.assertEqual(self.get(url)[0].data["count"], 1)
+        response = self.client.get(url, {"search": "hoth"})
+        self.assertEqual(response.data["count"], 0)
+        self.assertNotEqual(response["ETag"], self.get(url)[0]["ETag"])
+
+    def test_process_local_cache_deploy_check(self):
+        """Test the deploy check warns when versions are not shared by workers"""
+        self.assertEqual([error.id for error in check_shared_cache()], ["core.W001"])
+        with override_settings(RESPONSE_CACHE_ENABLED=False):
+            self.assertEqual(check_shared_cache(), [])
+        with override_settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                    "LOCATION": "redis://localhost:6379",
+                }
+            }
+        ):
+            self.assertEqual(check_shared_cache(), [])
+
+    def test_file_based_cache_backend(self):
+        """Test responses can be cached with the file-based backend"""
+        with tempfile.TemporaryDirectory() as location:
+            backend = "django.core.cache.backends.filebased.FileBasedCache"
+            with override_settings(
+                CACHES={"default": {"BACKEND": backend, "LOCATION": location}}
+            ):
+                url = reverse("climate-list")
+                first, _ = self.get(url)
+                second, queries = self.get(url)
+                self.assertEqual(queries, 0)
+                self.assertEqual(second.data, first.data)
@@ -0,0 +1,93 @@
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.db import connections
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import SimpleTestCase
+
+from core.utils.database import sqlite_database
+
+
+class SQLiteProfileTestCase(SimpleTestCase):
+    """Test cases for the SQLite production database profile"""
+
+    def setUp(self):
+        """Create a file database with some planets"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "db.sqlite3"
+        connection = self.connect("setup")
+        self.addCleanup(connection.close)
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE TABLE planet (name TEXT, population INTEGER)")
+            cursor.executemany(
+                "INSERT INTO planet VALUES (%s, %s)",
+                [(f"Planet {i}", i) for i in range(100)],
+            )
+
+    def connect(self, alias):
+        """A connection configured with the profile, usable in this thread only"""
+        database = connections.configure_settings(
+            {"default": sqlite_database(self.path)}
+        )
+        return DatabaseWrapper(database["default"], alias)
+
+    def count_planets(self, alias):
+        connection = self.connect(alias)
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT COUNT(*) FROM planet")
+                return cursor.fetchone()[0]
+        finally:
+            connection.close()
+
+    def test_pragmas_applied_on_connect(self):
+        """Test WAL, synchronous, mmap and busy timeout are set"""
+        connection = self.connect("check")
+        self.addCleanup(connection.close)
+        with connection.cursor() as cursor:
+            pragmas = {}
+            for pragma in ("journal_mode", "synchronous", "busy_timeout", "mmap_size"):
+                cursor.execute(f"PRAGMA {pragma}")
+                pragmas[pragma] = cursor.fetchone()[0]
+        self.assertEqual(pragmas["journal_mode"], "wal")
+        self.assertEqual(pragmas["synchronous"], 1)  # NORMAL
+        self.assertEqual(pragmas["busy_timeout"], 20000)
+        self.assertGreater(pragmas["mmap_size"], 0)
+
+    def test_reads_continue_during_sync_write(self):
+        """Test parallel readers are not blocked by an open write transaction"""
+        writing = threading.Event()
+        reads_done = threading.Event()
+
+        def write():
+            connection = self.connect("writer")
+            with connection.cursor() as cursor:
+                # A tiny page cache makes the writer spill pages before it
+                # commits, which locks readers out of a rollback journal.
+                cursor.execute("PRAGMA cache_size=10")
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.executemany(
+                    "INSERT INTO planet VALUES (%s, %s)",
+                    [(f"Synced {i:05} " + "x" * 200, i) for i in range(5000)],
+                )
+                writing.set()
+                reads_done.wait(timeout=10)
+                cursor.execute("COMMIT")
+            connection.close()
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            writer = executor.submit(write)
+            self.assertTrue(writing.wait(timeout=10))
+            readers = [
+                executor.submit(self.count_planets, f"reader-{i}") for i in range(4)
+            ]
+            counts = [reader.result(timeout=5) for reader in readers]
+            reads_done.set()
+            writer.result(timeout=10)
+
+        # Readers saw the last committed state while the sync was writing.
+        self.assertEqual(counts, [100] * 4)
+        self.assertEqual(self.count_planets("after"), 5100)
@@ -0,0 +1,84 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from planets.models import Climate, Planet, Terrain
+from planets.services.names import get_interner
+
+
+class PlanetNamesTestCase(APITestCase):
+    """Test cases for the denormalized climate/terrain names of planets"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        self.user = User.objects.create_user(username="testuser", password="testpass")
+        self.client.force_authenticate(user=self.user)
+        for model in (Climate, Terrain):
+            self.addCleanup(get_interner(model).invalidate)
+
+        response = self.client.post(
+            reverse("planet-list"),
+            {
+                "name": "Tatooine",
+                "population": "200000",
+                "climates": ["hot", "arid"],
+                "terrains": ["desert"],
+            },
+            format="json",
+        )
+        self.assertEqual(response.data["climates"], ["arid", "hot"])
+        self.planet = Planet.objects.get(name="Tatooine")
+
+    def test_serializer_writes_keep_names(self):
+        """Test creating and updating planets stores their sorted names"""
+        self.assertEqual(self.planet.climate_names, ["arid", "hot"])
+        response = self.client.patch(
+            reverse("planet-detail", kwargs={"pk": self.planet.pk}),
+            {"terrains": ["mountains", "canyons"]},
+            format="json",
+        )
+        self.assertEqual(response.data["terrains"], ["canyons", "mountains"])
+        self.planet.refresh_from_db()
+        self.assertEqual(self.planet.terrain_names, ["canyons", "mountains"])
+
+    def test_rename_and_delete_update_names(self):
+        """Test renaming a climate and deleting a terrain refresh planets"""
+        climate = Climate.objects.get(name="hot")
+        self.client.put(
+            reverse("climate-detail", kwargs={"pk": climate.pk}),
+            {"name": "scorching"},
+            format="json",
+        )
+        self.client.delete(
+            reverse("terrain-detail", kwargs={"pk": Terrain.objects.get().pk})
+        )
+        self.planet.refresh_from_db()
+        self.assertEqual(self.planet.climate_names, ["arid", "scorching"])
+        self.assertEqual(self.planet.terrain_names, [])
+
+    def test_reverse_relation_writes_update_names(self):
+        """Test adding and clearing planets from the climate side"""
+        climate = Climate.objects.create(name="windy")
+        climate.planet_set.add(self.planet)
+        self.planet.refresh_from_db()
+        self.assertEqual(self.planet.climate_names, ["arid", "hot", "windy"])
+
+        climate.planet_set.clear()
+        self.planet.refresh_from_db()
+        self.assertEqual(self.planet.climate_names, ["arid", "hot"])
+
+    def test_drift_check_and_rebuild(self):
+        """Test the command reports drifted names and rebuilds them"""
+        Planet.objects.update(climate_names=["stale"])
+        with self.assertRaisesMessage(CommandError, "1 planets have drifted"):
+            call_command("rebuild_planet_names", "--check", stdout=StringIO())
+
+        call_command("rebuild_planet_names", stdout=StringIO())
+        out = StringIO()
+        call_command("rebuild_planet_names", "--check", stdout=out)
+        self.assertIn("No drift found", out.getvalue())
+        self.planet.refresh_from_db()
+        self.assertEqual(self.planet.climate_names, ["arid", "hot"])
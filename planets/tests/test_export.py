@@ -0,0 +1,119 @@
+import csv
+import io
+import json
+import warnings
+from unittest import mock, skipUnless
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.utils.compression import brotli
+from planets.services import export_planets, sync_planets
+from planets.tests.test_sync import swapi_planet
+
+
+class PlanetExportTestCase(APITestCase):
+    """Test cases for the streaming planet export"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        sync_planets(
+            [
+                swapi_planet("Tatooine", "200000", ["arid", "hot"], ["desert"]),
+                swapi_planet("Hoth", "unknown", ["frozen"], []),
+                swapi_planet("Naboo", "4500000000", ["temperate"], ["swamp"]),
+            ]
+        )
+        self.url = reverse("planet-export")
+
+    def export(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_export_ndjson(self):
+        """Test the default export is NDJSON ordered by name"""
+        lines = [json.loads(line) for line in self.export().splitlines()]
+        self.assertEqual(
+            [line["name"] for line in lines], ["Hoth", "Naboo", "Tatooine"]
+        )
+        self.assertEqual(
+            lines[2],
+            {
+                "name": "Tatooine",
+                "population": 200000,
+                "climates": ["arid", "hot"],
+                "terrains": ["desert"],
+            },
+        )
+        self.assertIsNone(lines[0]["population"])
+
+    def test_export_csv(self):
+        """Test the CSV export uses SWAPI REST columns"""
+        rows = list(csv.DictReader(io.StringIO(self.export(output="csv"))))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]["population"], "unknown")
+        self.assertEqual(rows[2]["climate"], "arid, hot")
+
+    def test_export_honours_search(self):
+        """Test the export only includes planets matching the search"""
+        lines = self.export(search="tatoo").splitlines()
+        self.assertEqual(len(lines), 1)
+
+    def test_export_rejects_unknown_output(self):
+        """Test unsupported output formats are rejected"""
+        response = self.client.get(self.url, {"output": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(PLANET_EXPORT_CHUNK_SIZE=2)
+    def test_export_reads_in_chunks(self):
+        """Test the export reads the planets table only, with a single cursor"""
+        with CaptureQueriesContext(connection) as queries:
+            self.export()
+        self.assertEqual(len(queries), 1)
+
+    @override_settings(PLANET_EXPORT_CHUNK_SIZE=1)
+    async def test_export_streams_under_asgi(self):
+        """Test ASGI responses send each chunk as soon as it is encoded"""
+        produced = []
+
+        def recording_export(*args, **kwargs):
+            for chunk in export_planets(*args, **kwargs):
+                produced.append(chunk)
+                yield chunk
+
+        received = []
+        with (
+            mock.patch("planets.views.planet.export_planets", recording_export),
+            warnings.catch_warnings(),
+        ):
+            warnings.simplefilter("error")
+            response = await self.async_client.get(self.url)
+            self.assertTrue(response.is_async)
+            async for chunk in response:
+                received.append((chunk, len(produced)))
+
+        lines = b"".join(chunk for chunk, _ in received).decode().splitlines()
+        self.assertEqual(
+            [json.loads(line)["name"] for line in lines], ["Hoth", "Naboo", "Tatooine"]
+        )
+        # Each chunk was sent before the next one was read.
+        self.assertEqual([count for _, count in received], [1, 2, 3])
+
+    @skipUnless(brotli, "brotli is not installed")
+    async def test_export_compressed_under_asgi(self):
+        """Test the brotli stream wraps the async export"""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            response = await self.async_client.get(
+                self.url, {"output": "csv"}, headers={"Accept-Encoding": "br"}
+            )
+            self.assertEqual(response["Content-Encoding"], "br")
+            content = b"".join([chunk async for chunk in response])
+        rows = list(csv.DictReader(io.StringIO(brotli.decompress(content).decode())))
+        self.assertEqual([row["name"] for row in rows], ["Hoth", "Naboo", "Tatooine"])
@@ -0,0 +1,89 @@
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from planets.filters import PlanetFilter
+from planets.models import Planet
+from planets.services import sync_planets
+from planets.tests.test_sync import swapi_planet
+
+
+class PlanetFilterTestCase(APITestCase):
+    """Test cases for the planet climate, terrain and population filters"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        sync_planets(
+            [
+                swapi_planet("Tatooine", "200000", ["arid", "hot"], ["desert"]),
+                swapi_planet("Jakku", "2000000000", ["arid"], ["desert"]),
+                swapi_planet("Hoth", "unknown", ["frozen"], ["tundra"]),
+                swapi_planet("Naboo", "4500000000", ["temperate"], ["swamp"]),
+            ]
+        )
+        self.url = reverse("planet-list")
+
+    def names(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [planet["name"] for planet in response.data["results"]]
+
+    def test_filter_by_climate_any_and_all(self):
+        """Test multi-valued filters match any name by default, or all of them"""
+        self.assertEqual(self.names(climate="hot,frozen"), ["Hoth", "Tatooine"])
+        self.assertEqual(
+            self.names(climate="arid,hot", climate_match="all"), ["Tatooine"]
+        )
+
+    def test_filter_by_terrain_and_population(self):
+        """Test the 'desert planets with population > 1e9' query"""
+        self.assertEqual(
+            self.names(terrain="desert", population_min=1_000_000_000), ["Jakku"]
+        )
+        self.assertEqual(
+            self.names(population_min=100, population_max=3_000_000_000),
+            ["Jakku", "Tatooine"],
+        )
+
+    def test_invalid_filter_values_are_rejected(self):
+        """Test invalid population and match values return 400"""
+        response = self.client.get(self.url, {"population_min": "many"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {"climate_match": "some"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class PlanetFilterQueryPlanTestCase(APITestCase):
+    """Test the common planet filters are answered from indexes"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        if connection.vendor != "sqlite":
+            self.skipTest("Query plan assertions are written for SQLite")
+        sync_planets(
+            swapi_planet(f"Planet {i}", str(i), ["arid", f"climate {i % 5}"])
+            for i in range(50)
+        )
+
+    def plan(self, data):
+        return PlanetFilter(data, Planet.objects.order_by("name")).qs.explain()
+
+    def test_climate_filters_use_through_index(self):
+        """Test climate filters seek the (climate_id, planet_id) index"""
+        for data in ({"climate": "arid"}, {"climate": "arid", "climate_match": "all"}):
+            plan = self.plan(data)
+            self.assertIn("COVERING INDEX planet_climates_climate_planet", plan)
+            self.assertNotIn("SCAN", plan)
+
+    def test_terrain_filter_uses_through_index(self):
+        """Test terrain filters seek the (terrain_id, planet_id) index"""
+        plan = self.plan({"terrain": "desert"})
+        self.assertIn("COVERING INDEX planet_terrains_terrain_planet", plan)
+        self.assertNotIn("SCAN", plan)
+
+    def test_population_range_uses_index(self):
+        """Test population ranges seek the population index"""
+        plan = self.plan({"population_min": "10", "population_max": "20"})
+        self.assertIn("USING INDEX planet_population", plan)
+        self.assertNotIn("SCAN", plan)
@@ -0,0 +1,73 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from rest_framework.test import APITestCase
+
+from planets.models import Planet
+from planets.services import sync_planets
+from planets.services.export import export_planets
+from planets.tests.test_sync import swapi_payload, swapi_planet
+
+
+class ImportPlanetsCommandTestCase(APITestCase):
+    """Test cases for the import_planets management command"""
+
+    def write_file(self, suffix, content):
+        file = tempfile.NamedTemporaryFile(
+            "w", suffix=suffix, encoding="utf-8", delete=False
+        )
+        with file:
+            file.write(content)
+        self.addCleanup(os.remove, file.name)
+        return file.name
+
+    def import_file(self, path, *args):
+        out = StringIO()
+        call_command("import_planets", path, *args, stdout=out)
+        return out.getvalue()
+
+    def test_import_ndjson(self):
+        """Test NDJSON files are imported and invalid lines skipped"""
+        lines = [
+            json.dumps(swapi_planet("Tatooine", "200000", ["arid", "hot"])),
+            json.dumps(swapi_planet("Hoth", "unknown")),
+            "not json",
+            "",
+        ]
+        output = self.import_file(self.write_file(".ndjson", "\n".join(lines)))
+        self.assertIn("Imported 3 rows", output)
+        self.assertIn("rows/s", output)
+        self.assertIn("skipped: 1", output)
+        self.assertIsNone(Planet.objects.get(name="Hoth").population)
+        self.assertEqual(Planet.objects.get(name="Tatooine").climates.count(), 2)
+
+    def test_import_json_documents(self):
+        """Test plain arrays and SWAPI GraphQL documents are imported"""
+        self.import_file(self.write_file(".json", json.dumps([swapi_planet("Naboo")])))
+        self.import_file(
+            self.write_file(".json", json.dumps(swapi_payload([swapi_planet("Endor")])))
+        )
+        self.assertEqual(Planet.objects.count(), 2)
+
+    def test_import_csv_export_round_trip(self):
+        """Test a CSV export re-imports without changes"""
+        sync_planets([swapi_planet("Tatooine", "200000", ["arid", "hot"], ["desert"])])
+        path = self.write_file(".csv", "".join(export_planets("csv")))
+        output = self.import_file(path, "--batch-size", "1")
+        self.assertIn("unchanged: 1", output)
+
+    def test_import_with_parser_processes(self):
+        """Test parsing in several processes imports every row in order"""
+        lines = [json.dumps(swapi_planet(f"Planet {i}")) for i in range(50)]
+        path = self.write_file(".ndjson", "\n".join(lines))
+        output = self.import_file(path, "--workers", "2", "--batch-size", "10")
+        self.assertIn("created: 50", output)
+        self.assertEqual(Planet.objects.count(), 50)
+
+    def test_import_unknown_format(self):
+        """Test files with an unknown extension are rejected"""
+        with self.assertRaises(CommandError):
+            self.import_file(self.write_file(".txt", ""))
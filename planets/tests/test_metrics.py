@@ -0,0 +1,70 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.utils.metrics import registry
+from planets.services import sync_planets
+from planets.tests.test_sync import swapi_planet
+
+
+class MetricsTestCase(APITestCase):
+    """Test cases for the request metrics middleware and endpoint"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        cache.clear()
+        registry.reset()
+        sync_planets([swapi_planet("Tatooine", "200000", ["arid"])])
+        self.admin = User.objects.create_user(
+            username="admin", password="adminpass", is_staff=True
+        )
+
+    def route_stats(self, route):
+        return registry.routes[("GET", route)]
+
+    def test_records_requests_sql_and_serializer_time(self):
+        """Test per-route counts, SQL queries and serializer time"""
+        for _ in range(3):
+            self.client.get(reverse("planet-list"))
+        self.client.get(reverse("planet-detail", args=[999]))
+
+        stats = self.route_stats("planet-list")
+        self.assertEqual(stats.count, 3)
+        self.assertEqual(stats.requests, {"2xx": 3})
+        # Count and page once, then served from the response cache.
+        self.assertEqual(stats.sql_queries, 2)
+        self.assertGreater(stats.serializer_seconds, 0)
+        self.assertEqual(self.route_stats("planet-detail").requests, {"4xx": 1})
+
+    @override_settings(ROOT_URLCONF="planets.tests.test_async")
+    async def test_records_async_views(self):
+        """Test queries run by the async ORM are attributed to the request"""
+        await self.async_client.get("/api/planets/")
+        stats = self.route_stats("planet-list")
+        self.assertEqual((stats.count, stats.sql_queries), (1, 2))
+
+    def test_prometheus_endpoint_is_admin_only(self):
+        """Test the metrics endpoint output and permissions"""
+        self.client.get(reverse("planet-list"))
+        url = reverse("metrics")
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.content.decode()
+        labels = 'method="GET",route="planet-list"'
+        self.assertIn(f'http_requests_total{{{labels},status="2xx"}} 1', body)
+        self.assertIn(f"http_request_duration_seconds_count{{{labels}}} 1", body)
+        self.assertIn(f'http_request_latency_seconds{{{labels},quantile="0.99"}}', body)
+        self.assertIn(f"http_request_sql_queries_total{{{labels}}} 2", body)
+
+    @override_settings(SLOW_REQUEST_THRESHOLD_MS=0.001)
+    def test_slow_request_log(self):
+        """Test slow requests are logged with their queries"""
+        with self.assertLogs("core.metrics", "WARNING") as logs:
+            self.client.get(reverse("planet-list"), {"search": "tatooine"})
+        self.assertIn("Slow request GET /api/planets/?search=tatooine", logs.output[0])
+        self.assertIn("SELECT", logs.output[0])
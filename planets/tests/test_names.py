@@ -0,0 +1,107 @@
+import time
+from unittest import mock
+
+from django.db import connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from planets.models import Climate
+from planets.services.names import NameInterner, get_interner
+
+
+class NameInternerTestCase(APITestCase):
+    """Test cases for the climate/terrain name -> id cache"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        self.interner = get_interner(Climate)
+        self.interner.invalidate()
+        # Rows are rolled back after each test, so must their cached ids.
+        self.addCleanup(self.interner.invalidate)
+        self.arid = Climate.objects.create(name="arid")
+        self.hot = Climate.objects.create(name="hot")
+
+    def resolve(self, interner, names):
+        with self.captureOnCommitCallbacks(execute=True):
+            return interner.resolve(names)
+
+    def climate_queries(self, func):
+        with CaptureQueriesContext(connection) as queries:
+            func()
+        return [q for q in queries if "planets_climate" in q["sql"]]
+
+    def test_resolve_warms_and_reuses_cache(self):
+        """Test the first lookup loads the vocabulary and later ones hit the cache"""
+        queries = self.climate_queries(
+            lambda: self.assertEqual(
+                self.resolve(self.interner, [" arid", "hot", ""]),
+                {"arid": self.arid.pk, "hot": self.hot.pk},
+            )
+        )
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(
+            self.climate_queries(lambda: self.resolve(self.interner, ["hot"])), []
+        )
+
+    def test_resolve_creates_missing_names(self):
+        """Test unknown names are created in bulk"""
+        ids = self.resolve(self.interner, ["arid", "frozen", "murky"])
+        self.assertEqual(
+            set(
+                Climate.objects.filter(pk__in=ids.values()).values_list(
+                    "name", flat=True
+                )
+            ),
+            {"arid", "frozen", "murky"},
+        )
+
+    def test_rolled_back_names_are_not_cached(self):
+        """Test names created in a rolled-back transaction never reach the cache"""
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            try:
+                with transaction.atomic():
+                    self.interner.resolve(["frozen"])
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+        self.assertEqual(callbacks, [])
+        self.assertNotIn("frozen", self.interner._entries)
+
+    def test_rename_invalidates_cache(self):
+        """Test renaming a climate drops the cached ids"""
+        self.resolve(self.interner, ["arid"])
+        self.arid.name = "dry"
+        self.arid.save()
+        self.assertEqual(
+            len(self.climate_queries(lambda: self.resolve(self.interner, ["dry"]))), 1
+        )
+        self.assertNotIn("arid", self.resolve(self.interner, ["dry"]))
+
+    def test_cache_expires(self):
+        """Test a name deleted by another process is reloaded after the timeout"""
+        self.resolve(self.interner, ["arid"])
+        # Deleted by another process: this process's data version is unchanged.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {Climate._meta.db_table} WHERE id = %s", [self.arid.pk]
+            )
+        self.assertEqual(self.resolve(self.interner, ["arid"]), {"arid": self.arid.pk})
+
+        with (
+            override_settings(NAME_INTERN_CACHE_TIMEOUT=60),
+            mock.patch(
+                "planets.services.names.time.monotonic",
+                return_value=time.monotonic() + 61,
+            ),
+        ):
+            ids = self.resolve(self.interner, ["arid"])
+        self.assertNotEqual(ids["arid"], self.arid.pk)
+        self.assertTrue(Climate.objects.filter(pk=ids["arid"], name="arid").exists())
+
+    def test_cache_is_bounded(self):
+        """Test least recently used names are evicted beyond max_size"""
+        interner = NameInterner(Climate, max_size=1)
+        self.resolve(interner, ["arid"])
+        self.resolve(interner, ["hot"])
+        self.assertEqual(list(interner._entries), ["hot"])
@@ -0,0 +1,125 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from planets.models import Climate, Planet, Terrain
+
+
+class CursorPaginationTestCase(APITestCase):
+    """Test cases for the opt-in keyset pagination mode"""
+
+    def crawl(self, url, params):
+        names = []
+        pages = 0
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, params)
+            while True:
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(
+                    set(response.data), {"next", "previous", "page_size", "results"}
+                )
+                names += [item["name"] for item in response.data["results"]]
+                pages += 1
+                if not response.data["next"]:
+                    break
+                response = self.client.get(response.data["next"])
+        return names, pages, ctx.captured_queries
+
+    def test_cursor_crawl_visits_every_row_once(self):
+        """Test following next links returns every planet once, in name order"""
+        for i in range(7):
+            Planet.objects.create(name=f"Planet {6 - i}")
+        names, pages, queries = self.crawl(
+            reverse("planet-list"), {"pagination": "cursor", "page_size": 3}
+        )
+        self.assertEqual(names, [f"Planet {i}" for i in range(7)])
+        self.assertEqual(pages, 3)
+        self.assertFalse(any("COUNT(" in q["sql"] for q in queries))
+        self.assertFalse(any("OFFSET" in q["sql"] for q in queries))
+
+    def test_cursor_previous_link(self):
+        """Test previous links walk back through the pages"""
+        for name in "abcde":
+            Climate.objects.create(name=name)
+        url = reverse("climate-list")
+        first = self.client.get(url, {"pagination": "cursor", "page_size": 2})
+        second = self.client.get(first.data["next"])
+        back = self.client.get(second.data["previous"])
+        self.assertEqual([c["name"] for c in back.data["results"]], ["a", "b"])
+        self.assertIsNone(back.data["previous"])
+
+    def test_cursor_pagination_with_search(self):
+        """Test cursor mode keeps the search filter across pages"""
+        for name in ("desert", "desert plains", "forest", "desert canyons"):
+            Terrain.objects.create(name=name)
+        names, _, _ = self.crawl(
+            reverse("terrain-list"),
+            {"pagination": "cursor", "page_size": 1, "search": "desert"},
+        )
+        self.assertEqual(names, ["desert", "desert canyons", "desert plains"])
+
+    def test_page_number_pagination_is_default(self):
+        """Test the default envelope still includes count and total pages"""
+        Planet.objects.create(name="Tatooine")
+        response = self.client.get(reverse("planet-list"))
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["total_pages"], 1)
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=False)
+class PaginationCountModeTestCase(APITestCase):
+    """Test cases for the exact, cached and approximate count modes"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        cache.clear()
+        for i in range(3):
+            Planet.objects.create(name=f"Planet {i}")
+
+    def list_planets(self, params=None):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("planet-list"), params)
+        counts = [
+            q for q in ctx.captured_queries if q["sql"].startswith("SELECT COUNT(")
+        ]
+        return response.data["count"], len(counts)
+
+    @override_settings(PAGINATION_COUNT_MODES={"PlanetViewSet": "cached"})
+    def test_cached_count_is_reused_until_a_write(self):
+        """Test cached counts skip COUNT(*) until the model changes"""
+        self.assertEqual(self.list_planets(), (3, 1))
+        self.assertEqual(self.list_planets({"page": 1}), (3, 0))
+        self.assertEqual(self.list_planets({"search": "Planet 1"}), (1, 1))
+        self.assertEqual(self.list_planets({"search": "  planet   1 "}), (1, 0))
+
+        Planet.objects.get(name="Planet 2").climates.add(
+            Climate.objects.create(name="arid")
+        )
+        self.assertEqual(self.list_planets({"climate": "arid"}), (1, 1))
+        self.assertEqual(self.list_planets({"climate": "Arid"}), (0, 1))
+
+        Planet.objects.create(name="Planet 3")
+        self.assertEqual(self.list_planets(), (4, 1))
+        Planet.objects.get(name="Planet 0").delete()
+        self.assertEqual(self.list_planets(), (3, 1))
+
+    @override_settings(
+        PAGINATION_COUNT_MODES={"PlanetViewSet": "approximate"},
+        PAGINATION_APPROXIMATE_COUNT_THRESHOLD=0,
+    )
+    def test_approximate_count(self):
+        """Test approximate counts avoid COUNT(*) on unfiltered lists only"""
+        Planet.objects.get(name="Planet 0").delete()
+        count, count_queries = self.list_planets()
+        self.assertGreaterEqual(count, 2)
+        self.assertEqual(count_queries, 0)
+        self.assertEqual(self.list_planets({"search": "Planet 1"}), (1, 1))
+
+    def test_exact_count_is_default(self):
+        """Test exact mode counts on every request"""
+        self.assertEqual(self.list_planets(), (3, 1))
+        self.assertEqual(self.list_planets(), (3, 1))
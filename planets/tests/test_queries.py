@@ -0,0 +1,59 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from planets.models import Planet
+from planets.services import sync_planets
+
+PLANET_LIST_QUERY_BUDGET = 2
+PLANET_DETAIL_QUERY_BUDGET = 1
+
+
+class PlanetQueryBudgetTestCase(APITestCase):
+    """Regression tests for the number of queries run by planet reads"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        self.user = User.objects.create_user(username="testuser", password="testpass")
+        self.client.force_authenticate(user=self.user)
+
+    def seed(self, count):
+        sync_planets(
+            {
+                "name": f"Planet {i:03}",
+                "population": i,
+                "climates": ["arid", f"climate {i}"],
+                "terrains": ["desert", f"terrain {i}"],
+            }
+            for i in range(count)
+        )
+
+    def count_queries(self, url, params=None):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(ctx.captured_queries)
+
+    def test_list_query_count_is_independent_of_page_size(self):
+        """Test listing planets runs a fixed number of queries for any page size"""
+        self.seed(100)
+        url = reverse("planet-list")
+        for page_size in (1, 10, 100):
+            response, queries = self.count_queries(url, {"page_size": page_size})
+            self.assertEqual(len(response.data["results"]), page_size)
+            self.assertLessEqual(queries, PLANET_LIST_QUERY_BUDGET)
+
+        first = response.data["results"][0]
+        self.assertEqual(sorted(first["climates"]), ["arid", "climate 0"])
+        self.assertEqual(sorted(first["terrains"]), ["desert", "terrain 0"])
+
+    def test_detail_query_count(self):
+        """Test retrieving a planet reads its names without joins"""
+        self.seed(1)
+        url = reverse("planet-detail", kwargs={"pk": Planet.objects.get().pk})
+        response, queries = self.count_queries(url)
+        self.assertEqual(sorted(response.data["climates"]), ["arid", "climate 0"])
+        self.assertLessEqual(queries, PLANET_DETAIL_QUERY_BUDGET)
@@ -0,0 +1,119 @@
+import gzip
+import json
+from unittest import skipUnless
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from core.utils.compression import brotli
+from core.utils.renderers import FastJSONRenderer, msgpack, orjson
+from planets.services import sync_planets
+from planets.tests.test_sync import swapi_planet
+
+COMPACT = "application/vnd.planets.compact+json"
+
+
+class RendererTestCase(APITestCase):
+    """Test cases for the content-negotiated renderers and compression"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        cache.clear()
+        sync_planets(
+            [
+                swapi_planet("Tatooine", "200000", ["arid", "hot"], ["desert"]),
+                swapi_planet("Hoth", "unknown", ["frozen"], ["tundra", "ice caves"]),
+            ]
+            + [swapi_planet(f"Planet {i:02}", str(i)) for i in range(20)]
+        )
+        self.url = reverse("planet-list")
+
+    @skipUnless(orjson, "orjson is not installed")
+    def test_fast_json_matches_json_renderer(self):
+        """Test the orjson path renders the same document as DRF"""
+        response = self.client.get(self.url, HTTP_ACCEPT="application/json")
+        data = {**response.data, "detail": "ñandú", "ratio": 0.5}
+        self.assertEqual(
+            json.loads(FastJSONRenderer().render(data)),
+            json.loads(JSONRenderer().render(data)),
+        )
+
+    def test_compact_list_is_columnar(self):
+        """Test the compact format sends list results as parallel arrays"""
+        expected = self.client.get(self.url, {"search": "hoth"}).json()
+        for params, headers in (
+            ({"search": "hoth", "format": "compact"}, {}),
+            ({"search": "hoth"}, {"HTTP_ACCEPT": COMPACT}),
+        ):
+            response = self.client.get(self.url, params, **headers)
+            self.assertEqual(response["Content-Type"], COMPACT)
+            data = json.loads(response.content)
+            self.assertEqual(data["count"], expected["count"])
+            results = data["results"]
+            self.assertEqual(
+                set(results), {"names", "populations", "climates", "terrains"}
+            )
+            self.assertEqual(
+                results["names"], [row["name"] for row in expected["results"]]
+            )
+            self.assertEqual(
+                results["terrains"], [row["terrains"] for row in expected["results"]]
+            )
+
+        response = self.client.get(reverse("planet-list"), {"format": "compact"})
+        full = self.client.get(reverse("planet-list"))
+        self.assertLess(len(response.content), len(full.content) * 0.8)
+
+    def test_compact_empty_list_keeps_columns(self):
+        """Test an empty compact page still has every column"""
+        response = self.client.get(
+            self.url, {"search": "alderaan", "format": "compact"}
+        )
+        data = json.loads(response.content)
+        self.assertEqual(data["count"], 0)
+        self.assertEqual(
+            data["results"],
+            {"names": [], "populations": [], "climates": [], "terrains": []},
+        )
+        response = self.client.get(
+            reverse("climate-list"), {"search": "alderaan", "format": "compact"}
+        )
+        self.assertEqual(json.loads(response.content)["results"], {"names": []})
+
+    @skipUnless(msgpack, "msgpack is not installed")
+    def test_msgpack(self):
+        """Test MessagePack responses decode to the JSON document"""
+        response = self.client.get(self.url, HTTP_ACCEPT="application/msgpack")
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertEqual(
+            msgpack.unpackb(response.content), self.client.get(self.url).json()
+        )
+
+    def test_gzip_and_weak_etag(self):
+        """Test large responses are gzipped and their weak ETag still matches"""
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(
+            json.loads(gzip.decompress(response.content)),
+            self.client.get(self.url).json(),
+        )
+        etag = response["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+        response = self.client.get(
+            self.url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    @skipUnless(brotli, "brotli is not installed")
+    def test_brotli_preferred(self):
+        """Test brotli is used when the client accepts it"""
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(
+            json.loads(brotli.decompress(response.content)),
+            self.client.get(self.url).json(),
+        )
@@ -0,0 +1,198 @@
+import tempfile
+import time
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connections
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.utils.database import sqlite_database
+from core.utils.replicas import (
+    PIN_COOKIE,
+    PIN_HEADER,
+    ReplicaPinningMiddleware,
+    ReplicaRouter,
+)
+from core.utils.versioning import bump_model_version, get_model_version
+from planets.models import Planet
+
+REPLICAS = ["replica_1", "replica_2"]
+
+
+@override_settings(DATABASE_REPLICAS=REPLICAS, DATABASE_REPLICA_PIN_SECONDS=5)
+class ReplicaRouterTestCase(SimpleTestCase):
+    """Test cases for the read-replica router and pinning middleware"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        self.router = ReplicaRouter()
+        self.factory = RequestFactory()
+
+    def tearDown(self):
+        cache.clear()
+
+    def route(self, request, *operations):
+        """
+        Serve ``request`` through the middleware, routing one read or write
+        of a planet per operation. Returns the databases and the response.
+        """
+        databases = []
+
+        def view(request):
+            for operation in operations:
+                if operation == "read":
+                    databases.append(self.router.db_for_read(Planet))
+                elif operation == "read-user":
+                    databases.append(self.router.db_for_read(User))
+                else:
+                    databases.append(self.router.db_for_write(Planet))
+            return HttpResponse()
+
+        response = ReplicaPinningMiddleware(view)(request)
+        return databases, response
+
+    def test_safe_requests_read_from_replicas(self):
+        """Test planet reads of safe requests go to a replica"""
+        databases, response = self.route(
+            self.factory.get("/api/planets/"), "read", "read", "read-user"
+        )
+        self.assertIn(databases[0], REPLICAS)
+        self.assertIn(databases[1], REPLICAS)
+        self.assertEqual(databases[2], "default")
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    def test_writes_pin_to_primary(self):
+        """Test writes, reads after a write and unsafe requests use the primary"""
+        databases, response = self.route(
+            self.factory.get("/api/planets/"), "read", "write", "read"
+        )
+        self.assertIn(databases[0], REPLICAS)
+        self.assertEqual(databases[1:], ["default", "default"])
+        self.assertEqual(response.cookies[PIN_COOKIE]["max-age"], 5)
+
+        databases, _ = self.route(self.factory.post("/api/planets/"), "read")
+        self.assertEqual(databases, ["default"])
+
+    def test_pin_cookie_reads_from_primary(self):
+        """Test a client that wrote recently reads from the primary"""
+        request = self.factory.get("/api/planets/")
+        request.COOKIES[PIN_COOKIE] = "1"
+        databases, _ = self.route(request, "read")
+        self.assertEqual(databases, ["default"])
+
+    def test_pin_header_reads_from_primary(self):
+        """Test clients without cookies are pinned by echoing the pin header"""
+        _, response = self.route(self.factory.post("/api/planets/"), "write")
+        deadline = float(response[PIN_HEADER])
+        self.assertGreater(deadline, time.time())
+
+        request = self.factory.get("/api/planets/", HTTP_X_REPLICA_PIN=str(deadline))
+        self.assertEqual(self.route(request, "read")[0], ["default"])
+        request = self.factory.get("/api/planets/", HTTP_X_REPLICA_PIN="1")
+        self.assertIn(self.route(request, "read")[0][0], REPLICAS)
+
+    def test_user_pinned_after_write(self):
+        """Test an authenticated user reads from the primary after writing"""
+        user = User(pk=7, username="writer")
+        request = self.factory.post("/api/planets/")
+        request.user = user
+        self.route(request, "write")
+
+        request = self.factory.get("/api/planets/")
+        request.user = user
+        self.assertEqual(self.route(request, "read", "read")[0], ["default"] * 2)
+        request = self.factory.get("/api/planets/")
+        request.user = User(pk=8, username="reader")
+        self.assertIn(self.route(request, "read")[0][0], REPLICAS)
+
+    def test_outside_requests_and_without_replicas(self):
+        """Test commands and unconfigured replicas use the primary"""
+        self.assertEqual(self.router.db_for_read(Planet), "default")
+        with self.settings(DATABASE_REPLICAS=[]):
+            databases, response = self.route(
+                self.factory.get("/api/planets/"), "read", "write"
+            )
+        self.assertEqual(databases, ["default", "default"])
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+        self.assertFalse(self.router.allow_migrate("replica_1", "planets"))
+
+    @override_settings(DATABASE_REPLICA_PIN_SECONDS=0.05)
+    def test_version_bumped_again_after_pin_window(self):
+        """Test responses cached from a lagging replica are invalidated"""
+        cache.clear()
+        bump_model_version(Planet)
+        version = get_model_version(Planet)
+        deadline = time.monotonic() + 5
+        while get_model_version(Planet) == version and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(get_model_version(Planet), version + 1)
+
+
+REPLICA = "replica_test"
+
+
+@override_settings(DATABASE_REPLICAS=[REPLICA], RESPONSE_CACHE_ENABLED=False)
+class SQLiteReplicaTestCase(APITestCase):
+    """Test cases for the replica router against a real second SQLite file"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Add a replica database with the planet tables, in a file of its own"""
+        directory = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(directory.cleanup)
+        connections.settings[REPLICA] = connections.configure_settings(
+            {"default": sqlite_database(Path(directory.name) / "replica.sqlite3")}
+        )["default"]
+        cls.addClassCleanup(connections.settings.pop, REPLICA)
+        cls.addClassCleanup(connections.__delitem__, REPLICA)
+        cls.addClassCleanup(connections[REPLICA].close)
+        with connections[REPLICA].schema_editor() as editor:
+            editor.create_model(User)
+            editor.create_model(Planet)
+        # Set here, as the test runner only knows the configured databases.
+        cls.databases = {"default", REPLICA}
+        super().setUpClass()
+
+    def setUp(self):
+        """Give the replica a planet the primary does not have"""
+        cache.clear()
+        Planet.objects.using(REPLICA).bulk_create([Planet(name="Lagging")])
+        Planet.objects.create(name="Tatooine")
+        self.user = User.objects.create_user(username="testuser", password="testpass")
+
+    def names(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [planet["name"] for planet in response.data["results"]]
+
+    def test_reads_from_replica_and_writes_to_primary(self):
+        """Test reads are served by the replica and writes stay on the primary"""
+        self.assertEqual(
+            self.names(self.client.get(reverse("planet-list"))), ["Lagging"]
+        )
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            reverse("planet-list"), {"name": "Naboo"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Planet.objects.using("default").filter(name="Naboo").exists())
+        self.assertFalse(Planet.objects.using(REPLICA).filter(name="Naboo").exists())
+
+        # The writer keeps reading its own writes without cookies or headers.
+        self.client.cookies.clear()
+        self.assertEqual(
+            self.names(self.client.get(reverse("planet-list"))), ["Naboo", "Tatooine"]
+        )
+        self.client.force_authenticate(user=None)
+        self.assertEqual(
+            self.names(self.client.get(reverse("planet-list"))), ["Lagging"]
+        )
+        response = self.client.get(
+            reverse("planet-list"), headers={PIN_HEADER: response[PIN_HEADER]}
+        )
+        self.assertEqual(self.names(response), ["Naboo", "Tatooine"])
@@ -0,0 +1,68 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from planets.models import Climate, Planet, SearchTrigram
+from planets.services import sync_planets
+from planets.services.search import rebuild_index
+
+
+class IndexedSearchTestCase(APITestCase):
+    """Test cases for the trigram-indexed search backend"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        for name in ("Tatooine", "Dantooine", "Toydaria", "Hoth", "Alderaan"):
+            Planet.objects.create(name=name)
+
+    def search(self, term, url_name="planet-list"):
+        response = self.client.get(reverse(url_name), {"search": term})
+        return [item["name"] for item in response.data["results"]]
+
+    def test_substring_search_is_ranked(self):
+        """Test substring matches are returned with prefix matches first"""
+        self.assertEqual(self.search("tooine"), ["Dantooine", "Tatooine"])
+        self.assertEqual(self.search("too"), ["Dantooine", "Tatooine"])
+        self.assertEqual(self.search("tatooine"), ["Tatooine"])
+
+    def test_short_terms_match_anywhere(self):
+        """Test terms shorter than a trigram match anywhere in the name"""
+        Planet.objects.create(name="Naboo")
+        self.assertEqual(self.search("oo"), ["Dantooine", "Naboo", "Tatooine"])
+        self.assertEqual(self.search("ab"), ["Naboo"])
+        self.assertEqual(self.search("ho"), ["Hoth"])
+        self.assertEqual(
+            self.search("t"), ["Tatooine", "Toydaria", "Dantooine", "Hoth"]
+        )
+
+    def test_index_follows_writes(self):
+        """Test renames and deletions are reflected in search results"""
+        hoth = Planet.objects.get(name="Hoth")
+        hoth.name = "Echo Base"
+        hoth.save()
+        self.assertEqual(self.search("hoth"), [])
+        self.assertEqual(self.search("base"), ["Echo Base"])
+
+        hoth.delete()
+        self.assertEqual(self.search("base"), [])
+        self.assertFalse(SearchTrigram.objects.filter(object_id=hoth.pk).exists())
+
+    def test_sync_indexes_new_rows(self):
+        """Test planets and climates created by the bulk sync are searchable"""
+        sync_planets([{"name": "Kamino", "climates": ["temperate"], "terrains": []}])
+        self.assertEqual(self.search("kami"), ["Kamino"])
+        self.assertEqual(self.search("temp", "climate-list"), ["temperate"])
+
+    def test_rebuild_index(self):
+        """Test the index can be rebuilt from scratch"""
+        SearchTrigram.objects.all().delete()
+        Climate.objects.bulk_create([Climate(name="murky")])
+        self.assertEqual(rebuild_index(Planet), 5)
+        rebuild_index(Climate)
+        self.assertEqual(self.search("alder"), ["Alderaan"])
+        self.assertEqual(self.search("murk", "climate-list"), ["murky"])
+
+    @override_settings(SEARCH_BACKEND="icontains")
+    def test_icontains_backend(self):
+        """Test the plain icontains backend can still be selected"""
+        self.assertEqual(self.search("ot"), ["Hoth"])
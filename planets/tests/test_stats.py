@@ -0,0 +1,78 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from planets.models import Planet
+from planets.services import sync_planets
+from planets.tests.test_sync import swapi_planet
+
+
+class PlanetStatsTestCase(APITestCase):
+    """Test cases for the planet statistics endpoint"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        cache.clear()
+        sync_planets(
+            [
+                swapi_planet("Tatooine", "200000", ["arid", "hot"], ["desert"]),
+                swapi_planet("Jakku", "1000", ["arid"], ["desert"]),
+                swapi_planet("Geonosis", "100", ["arid"], ["rock", "desert"]),
+                swapi_planet("Hoth", "unknown", ["frozen"], ["tundra"]),
+            ]
+        )
+        self.url = reverse("planet-stats")
+
+    def get_stats(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["data"]
+
+    def test_stats_summary_and_facets(self):
+        """Test counts, totals and medians overall and per facet"""
+        stats = self.get_stats()
+        self.assertEqual(stats["planets"], 4)
+        self.assertEqual(
+            stats["population"],
+            {
+                "total": 201100,
+                "known": 3,
+                "average": 67033.333333333333,
+                "median": 1000,
+            },
+        )
+        arid = stats["climates"][0]
+        self.assertEqual((arid["name"], arid["planets"]), ("arid", 3))
+        self.assertEqual(arid["population"]["median"], 1000)
+        frozen = next(c for c in stats["climates"] if c["name"] == "frozen")
+        self.assertEqual(frozen["population"]["known"], 0)
+        self.assertIsNone(frozen["population"]["median"])
+        self.assertEqual(
+            [t["name"] for t in stats["terrains"]], ["desert", "rock", "tundra"]
+        )
+
+    def test_stats_even_median_and_filters(self):
+        """Test medians of even groups and filtered stats"""
+        stats = self.get_stats(climate="arid", population_max=5000)
+        self.assertEqual(stats["planets"], 2)
+        self.assertEqual(stats["population"]["median"], 550)
+        self.assertEqual([t["name"] for t in stats["terrains"]], ["desert", "rock"])
+
+    @override_settings(RESPONSE_CACHE_ENABLED=False)
+    def test_stats_rollup_is_cached_per_version(self):
+        """Test polling reuses the rollup until a planet changes"""
+        with CaptureQueriesContext(connection) as queries:
+            self.get_stats()
+        # Summary, overall median, then counts and medians per facet.
+        self.assertEqual(len(queries), 6)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.get_stats()
+        self.assertEqual(len(queries), 0)
+
+        Planet.objects.filter(name="Hoth").first().delete()
+        self.assertEqual(self.get_stats()["planets"], 3)
@@ -0,0 +1,80 @@
+from django.test import SimpleTestCase
+
+from planets.services import SwapiFetcher, normalize_swapi_planet
+from planets.tests.stubs import StubSwapiServer
+
+
+def rest_page(server, page, pages, names):
+    return {
+        "count": pages * len(names),
+        "next": server.url(f"/api/planets/?page={page + 1}") if page < pages else None,
+        "previous": None,
+        "results": [
+            {
+                "name": name,
+                "population": "10",
+                "climate": "arid, hot",
+                "terrain": "desert",
+            }
+            for name in names
+        ],
+    }
+
+
+class SwapiFetcherTestCase(SimpleTestCase):
+    """Test cases for the concurrent SWAPI fetcher against a stub server"""
+
+    def fetch(self, urls, **kwargs):
+        kwargs.setdefault("backoff", 0)
+        fetcher = SwapiFetcher(urls, batch_size=2, **kwargs)
+        return [item["name"] for item in fetcher.iter_planets()]
+
+    def test_fetches_rest_pages_and_multiple_sources(self):
+        """Test REST pages and a GraphQL source are all fetched"""
+        with StubSwapiServer({}) as server:
+            for page in range(1, 4):
+                path = "/api/planets/" if page == 1 else f"/api/planets/?page={page}"
+                names = [f"Rest {page}-{i}" for i in range(3)]
+                server.routes[path] = [(200, rest_page(server, page, 3, names))]
+            server.routes["/graphql"] = [
+                (200, {"data": {"allPlanets": {"planets": [{"name": "Graph"}]}}})
+            ]
+
+            names = self.fetch(
+                f"{server.url('/api/planets/')},{server.url('/graphql')}",
+                concurrency=3,
+            )
+
+        self.assertEqual(len(names), 10)
+        self.assertIn("Graph", names)
+        self.assertIn("Rest 3-2", names)
+        self.assertEqual(len(server.requests), 4)
+
+    def test_retries_with_backoff(self):
+        """Test transient upstream errors are retried"""
+        payload = {"data": {"allPlanets": {"planets": [{"name": "Hoth"}]}}}
+        with StubSwapiServer(
+            {"/graphql": [(503, {}), (502, {}), (200, payload)]}
+        ) as server:
+            self.assertEqual(self.fetch(server.url("/graphql"), retries=2), ["Hoth"])
+        self.assertEqual(len(server.requests), 3)
+
+    def test_gives_up_after_retries(self):
+        """Test persistent errors are raised once retries are exhausted"""
+        with StubSwapiServer({"/graphql": [(503, {})]}) as server:
+            with self.assertRaisesMessage(Exception, "Request to SWAPI failed: 503"):
+                self.fetch(server.url("/graphql"), retries=1)
+        self.assertEqual(len(server.requests), 2)
+
+    def test_normalizes_rest_planets(self):
+        """Test comma-separated REST climates and terrains are split"""
+        record = normalize_swapi_planet(
+            {
+                "name": "Hoth",
+                "population": "unknown",
+                "climate": "frozen, unknown",
+                "terrain": "tundra, ice caves",
+            }
+        )
+        self.assertEqual(record["climates"], ["frozen"])
+        self.assertEqual(record["terrains"], ["tundra", "ice caves"])
@@ -0,0 +1,279 @@
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.timezone import now
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.utils.json_stream import iter_json_array
+from planets.models import Climate, Planet, SyncJob, Terrain
+from planets.services import run_pending_jobs, sync_planets
+from planets.services.jobs import STALE_JOB_ERROR, iter_sync_batches
+from planets.tests.stubs import StubSwapiServer
+
+
+def swapi_planet(name, population="1000", climates=None, terrains=None):
+    return {
+        "name": name,
+        "population": population,
+        "climates": climates if climates is not None else ["arid"],
+        "terrains": terrains if terrains is not None else ["desert"],
+    }
+
+
+def swapi_payload(planets):
+    return {"data": {"allPlanets": {"planets": planets}}}
+
+
+def chunk_bytes(payload, size=7):
+    body = json.dumps(payload).encode()
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+class SyncPlanetsTestCase(APITestCase):
+    """Test cases for the bulk SWAPI sync engine"""
+
+    def test_sync_creates_planets_and_relations(self):
+        """Test planets, climates and terrains are created in bulk"""
+        result = sync_planets(
+            [
+                swapi_planet("Tatooine", "200000", ["arid", "hot"], ["desert"]),
+                swapi_planet("Hoth", "unknown", ["frozen"], ["tundra", "ice caves"]),
+            ]
+        )
+        self.assertEqual(result.as_dict()["created"], 2)
+        self.assertEqual(Climate.objects.count(), 3)
+        self.assertEqual(Terrain.objects.count(), 3)
+
+        tatooine = Planet.objects.get(name="Tatooine")
+        self.assertEqual(tatooine.population, 200000)
+        self.assertEqual(
+            sorted(tatooine.climates.values_list("name", flat=True)), ["arid", "hot"]
+        )
+        self.assertIsNone(Planet.objects.get(name="Hoth").population)
+
+    def test_sync_reports_updated_and_unchanged(self):
+        """Test re-syncing only counts changed planets as updated"""
+        sync_planets([swapi_planet("Tatooine"), swapi_planet("Hoth")])
+        result = sync_planets(
+            [
+                swapi_planet("Tatooine"),
+                swapi_planet("Hoth", terrains=["tundra"]),
+                swapi_planet("Naboo"),
+            ]
+        )
+        self.assertEqual(
+            result.as_dict(),
+            {"created": 1, "updated": 1, "unchanged": 1, "skipped": 0},
+        )
+        self.assertEqual(
+            list(
+                Planet.objects.get(name="Hoth").terrains.values_list("name", flat=True)
+            ),
+            ["tundra"],
+        )
+
+    def test_resync_of_unchanged_feed_does_not_write(self):
+        """Test a steady-state re-sync only runs the fingerprint lookup"""
+        feed = [
+            swapi_planet(f"Planet {i}", climates=["arid", "hot"]) for i in range(20)
+        ]
+        sync_planets(feed)
+        reordered = [swapi_planet(p["name"], climates=["hot", "arid"]) for p in feed]
+        with CaptureQueriesContext(connection) as ctx:
+            result = sync_planets(reordered)
+        self.assertEqual(result.unchanged, 20)
+        statements = [q["sql"].split()[0] for q in ctx.captured_queries]
+        self.assertNotIn("INSERT", statements)
+        self.assertNotIn("UPDATE", statements)
+        self.assertNotIn("DELETE", statements)
+
+    def test_local_changes_reset_fingerprint(self):
+        """Test planets edited or affected locally are rewritten by the next sync"""
+        sync_planets([swapi_planet("Tatooine"), swapi_planet("Hoth")])
+        Planet.objects.filter(name="Tatooine").update(population=1)
+        tatooine = Planet.objects.get(name="Tatooine")
+        self.client.force_authenticate(
+            user=User.objects.create_user(username="testuser", password="testpass")
+        )
+        self.client.patch(
+            reverse("planet-detail", kwargs={"pk": tatooine.pk}),
+            {"population": "5"},
+            format="json",
+        )
+        climate = Climate.objects.get(name="arid")
+        self.client.patch(
+            reverse("climate-detail", kwargs={"pk": climate.pk}),
+            {"name": "dry"},
+            format="json",
+        )
+
+        result = sync_planets([swapi_planet("Tatooine"), swapi_planet("Hoth")])
+        self.assertEqual(result.updated, 2)
+        self.assertEqual(Planet.objects.get(name="Tatooine").population, 1000)
+
+    def test_sync_skips_invalid_planets(self):
+        """Test invalid payloads are skipped instead of aborting the sync"""
+        result = sync_planets(
+            [swapi_planet(""), swapi_planet("Bespin", population="a lot")]
+        )
+        self.assertEqual(result.skipped, 2)
+        self.assertEqual(Planet.objects.count(), 0)
+
+    def test_sync_query_count_is_constant(self):
+        """Test the number of queries does not grow with the feed size"""
+
+        def count_queries(planets):
+            with CaptureQueriesContext(connection) as ctx:
+                sync_planets(planets, batch_size=1000)
+            return len(ctx.captured_queries)
+
+        small = count_queries([swapi_planet(f"Small {i}") for i in range(5)])
+        large = count_queries(
+            [
+                swapi_planet(f"Large {i}", climates=[f"c{i}"], terrains=[f"t{i}"])
+                for i in range(100)
+            ]
+        )
+        self.assertEqual(small, large)
+
+
+class SyncEndpointTestCase(APITestCase):
+    """Test cases for the background sync endpoints"""
+
+    def setUp(self):
+        """Initial setup for each test"""
+        self.user = User.objects.create_user(username="testuser", password="testpass")
+        self.client.force_authenticate(user=self.user)
+
+    def queue_sync(self, url):
+        with mock.patch.dict("os.environ", {"SWAPI_PLANETS_URL": url}):
+            response = self.client.post(reverse("planet-sync-from-swapi"))
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        return response.data["data"]["job_id"]
+
+    def job_status(self, job_id):
+        url = reverse("planet-sync-status", kwargs={"job_id": job_id})
+        return self.client.get(url).data["data"]
+
+    def test_sync_job_reports_progress(self):
+        """Test a queued sync job reports counts once the worker has run it"""
+        payload = swapi_payload([swapi_planet("Tatooine"), swapi_planet("Hoth"), {}])
+        with StubSwapiServer({"/graphql": [(200, payload)]}) as server:
+            job_id = self.queue_sync(server.url("/graphql"))
+            self.assertEqual(self.job_status(job_id)["status"], SyncJob.PENDING)
+            self.assertEqual(Planet.objects.count(), 0)
+
+            self.assertEqual(run_pending_jobs(), 1)
+            job = self.job_status(job_id)
+            self.assertEqual(job["status"], SyncJob.SUCCEEDED)
+            self.assertEqual(job["rows_processed"], 3)
+            self.assertEqual(job["created"], 2)
+            self.assertEqual(job["skipped"], 1)
+            self.assertEqual(job["errors"], ["Planet without name"])
+
+            self.queue_sync(server.url("/graphql"))
+            run_pending_jobs()
+            self.assertEqual(SyncJob.objects.latest("pk").unchanged, 2)
+
+    def test_sync_job_records_failure(self):
+        """Test upstream failures mark the job as failed with the error"""
+        with StubSwapiServer({}) as server:
+            job_id = self.queue_sync(server.url("/missing"))
+            run_pending_jobs()
+        job = self.job_status(job_id)
+        self.assertEqual(job["status"], SyncJob.FAILED)
+        self.assertTrue(job["errors"][0].startswith("Request to SWAPI failed: 404"))
+
+    @override_settings(SYNC_JOB_STALE_TIMEOUT=60)
+    def test_abandoned_running_job_is_failed(self):
+        """Test running jobs without progress past the timeout are failed"""
+        with StubSwapiServer({}) as server:
+            stale_id = self.queue_sync(server.url("/graphql"))
+            live_id = self.queue_sync(server.url("/graphql"))
+        SyncJob.objects.update(status=SyncJob.RUNNING, started_at=now())
+        SyncJob.objects.filter(pk=stale_id).update(
+            updated_at=now() - timedelta(seconds=61)
+        )
+
+        job = self.job_status(stale_id)
+        self.assertEqual(job["status"], SyncJob.FAILED)
+        self.assertEqual(job["errors"], [STALE_JOB_ERROR])
+        self.assertEqual(self.job_status(live_id)["status"], SyncJob.RUNNING)
+
+        # Workers fail abandoned jobs before claiming the next one.
+        SyncJob.objects.filter(pk=live_id).update(
+            updated_at=now() - timedelta(seconds=61)
+        )
+        self.assertEqual(run_pending_jobs(), 0)
+        self.assertEqual(SyncJob.objects.get(pk=live_id).status, SyncJob.FAILED)
+
+    @override_settings(SWAPI_SYNC_BATCH_SIZE=1)
+    def test_job_failed_as_stale_stops_its_worker(self):
+        """Test a worker whose job was failed meanwhile stops and keeps it failed"""
+
+        def batches_then_failed(items):
+            for result in iter_sync_batches(items):
+                yield result
+                SyncJob.objects.update(status=SyncJob.FAILED)
+
+        payload = swapi_payload(
+            [swapi_planet("Tatooine"), swapi_planet("Hoth"), swapi_planet("Naboo")]
+        )
+        with StubSwapiServer({"/graphql": [(200, payload)]}) as server:
+            job_id = self.queue_sync(server.url("/graphql"))
+            with mock.patch(
+                "planets.services.jobs.iter_sync_batches", batches_then_failed
+            ):
+                run_pending_jobs()
+        job = self.job_status(job_id)
+        self.assertEqual(job["status"], SyncJob.FAILED)
+        # The batch in flight is committed but not reported; no more are run.
+        self.assertEqual((job["rows_processed"], Planet.objects.count()), (1, 2))
+
+    def test_sync_requires_authentication(self):
+        """Test anonymous users cannot queue sync jobs"""
+        self.client.force_authenticate(user=None)
+        response = self.client.post(reverse("planet-sync-from-swapi"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_sync_status_unknown_job(self):
+        """Test unknown job ids return 404"""
+        url = reverse("planet-sync-status", kwargs={"job_id": 999})
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+
+
+class JSONStreamTestCase(APITestCase):
+    """Test cases for the incremental JSON array parser"""
+
+    def test_iter_json_array_across_chunks(self):
+        """Test items split across chunk boundaries are parsed one at a time"""
+        planets = [
+            swapi_planet("Tatooine", 200000, ["arid"], ["desert"]),
+            swapi_planet("Alderaan ✨", 2000000000, [], ["mountains"]),
+        ]
+        payload = {"meta": {"skip": [1, 2]}, **swapi_payload(planets)}
+        for size in (1, 3, 64):
+            items = iter_json_array(
+                chunk_bytes(payload, size), ("data", "allPlanets", "planets")
+            )
+            self.assertEqual(list(items), planets)
+
+    def test_iter_json_array_is_lazy(self):
+        """Test the stream is only consumed as far as the requested items"""
+        chunks = iter(chunk_bytes(swapi_payload([swapi_planet("A")] * 50), 16))
+        items = iter_json_array(chunks, ("data", "allPlanets", "planets"))
+        self.assertEqual(next(items)["name"], "A")
+        self.assertTrue(len(list(chunks)) > 0)
+
+    def test_iter_json_array_missing_path(self):
+        """Test a missing or null path yields no items"""
+        path = ("data", "allPlanets", "planets")
+        self.assertEqual(list(iter_json_array(chunk_bytes({"data": None}), path)), [])
+        self.assertEqual(list(iter_json_array(chunk_bytes({"errors": []}), path)), [])
@@ -1,6 +1,8 @@
+from django.conf import settings
 from rest_framework.routers import DefaultRouter
 
 from planets.views import ClimateViewSet, PlanetViewSet, TerrainViewSet
+from planets.views.async_read import async_read_urls
 
 router = DefaultRouter()
 router.register(r"planets", PlanetViewSet, basename="planet")
@@ -8,3 +10,6 @@ router.register(r"climates", ClimateViewSet, basename="climate")
 router.register(r"terrains", TerrainViewSet, basename="terrain")
 
 urlpatterns = router.urls
+
+if settings.ASYNC_READ_VIEWS:
+    urlpatterns = async_read_urls(router) + urlpatterns
@@ -0,0 +1,253 @@
+import math
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.http import HttpResponse
+from django.urls import path, re_path
+from django.utils.decorators import classonlymethod
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from core.utils.caching import etag_matches, response_cache_key, response_etag
+from core.utils.pagination import EXACT
+from core.utils.renderers import FastJSONRenderer
+from core.utils.versioning import aget_model_version
+
+LIST_ACTIONS = {"get": "list", "post": "create"}
+JSON_MEDIA_TYPES = {"", "*/*", "application/*", "application/json"}
+DETAIL_ACTIONS = {
+    "get": "retrieve",
+    "put": "update",
+    "patch": "partial_update",
+    "delete": "destroy",
+}
+
+
+class AsyncReadView(View):
+    """
+    Async ``list`` and ``retrieve`` in front of a DRF viewset.
+
+    JSON ``GET`` requests using page-number pagination, ``search`` and the
+    viewset's filterset are served on the event loop with the async ORM
+    (``acount``, ``aget`` and ``async for``; planets carry their climate and
+    terrain names, so nothing is prefetched) and reuse the viewset's
+    queryset, serializer, filters and response cache, so the responses are
+    the same as the viewset's. Every other request (writes, the browsable
+    API, cursor pagination, non-exact counts, other renderers) is handed to
+    the viewset in a thread. The viewset's authentication, permission and
+    throttle checks run first in either case.
+    """
+
+    viewset_class = None
+    viewset_initkwargs = None
+    actions = None
+    fallback = None
+    async_params = {"page", "page_size", "search"}
+
+    @classonlymethod
+    def as_view(cls, viewset_class, actions, **viewset_initkwargs):
+        fallback = viewset_class.as_view(actions, **viewset_initkwargs)
+        view = super().as_view(
+            viewset_class=viewset_class,
+            viewset_initkwargs=viewset_initkwargs,
+            actions=actions,
+            fallback=fallback,
+        )
+        return csrf_exempt(view)
+
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        self.viewset = self.viewset_class(**self.viewset_initkwargs)
+        # Bound as DRF's viewset view does, for the ``Allow`` header.
+        actions = {**self.actions}
+        if "get" in actions:
+            actions.setdefault("head", actions["get"])
+        self.viewset.action_map = actions
+        for method, action in actions.items():
+            setattr(self.viewset, method, getattr(self.viewset, action))
+        self.pagination = self.viewset.pagination_class()
+
+    async def dispatch(self, request, *args, **kwargs):
+        if request.method == "GET" and self.can_serve(request):
+            error = await sync_to_async(self.check_request)(request, *args, **kwargs)
+            if error is not None:
+                return error
+            response = await self.get(request, *args, **kwargs)
+            # ``Allow`` and ``Vary: Accept``, as the viewset's responses have.
+            for name, value in self.viewset.headers.items():
+                response[name] = value
+            return response
+        return await sync_to_async(self.fallback)(request, *args, **kwargs)
+
+    def check_request(self, request, *args, **kwargs):
+        """
+        Run the viewset's content negotiation, authentication, permission
+        and throttle checks, as DRF does before every action. Returns the
+        viewset's error response when one of them fails.
+        """
+        viewset = self.viewset
+        viewset.args = args
+        viewset.kwargs = kwargs
+        viewset.request = viewset.initialize_request(request, *args, **kwargs)
+        viewset.headers = viewset.default_response_headers
+        try:
+            viewset.initial(viewset.request, *args, **kwargs)
+        except Exception as exc:
+            response = viewset.handle_exception(exc)
+            response = viewset.finalize_response(
+                viewset.request, response, *args, **kwargs
+            )
+            return response.render()
+        return None
+
+    def can_serve(self, request):
+        params = set(self.async_params)
+        filterset_class = getattr(self.viewset, "filterset_class", None)
+        if filterset_class is not None:
+            params.update(filterset_class.base_filters)
+        accepted = {
+            media_type.split(";")[0].strip()
+            for media_type in request.headers.get("Accept", "").split(",")
+        }
+        return (
+            set(request.GET) <= params
+            and accepted <= JSON_MEDIA_TYPES
+            and self.pagination.get_count_mode(self.viewset) == EXACT
+        )
+
+    async def get(self, request, pk=None):
+        headers = {}
+        if settings.RESPONSE_CACHE_ENABLED:
+            versions = [
+                await aget_model_version(model)
+                for model in self.viewset.get_cache_models()
+            ]
+            key = response_cache_key(request, versions)
+            headers = {"ETag": response_etag(key), "Cache-Control": "no-cache"}
+            if etag_matches(request, headers["ETag"]):
+                return HttpResponse(status=304, headers=headers)
+            data = await cache.aget(f"response:{key}")
+            if data is not None:
+                return self.json_response(data, headers=headers)
+
+        try:
+            data = await (self.list(request) if pk is None else self.retrieve(pk))
+        except APIException as e:
+            detail = (
+                e.detail if isinstance(e.detail, (list, dict)) else {"detail": e.detail}
+            )
+            return self.json_response(detail, status=e.status_code)
+
+        if settings.RESPONSE_CACHE_ENABLED:
+            await cache.aset(f"response:{key}", data, settings.RESPONSE_CACHE_TIMEOUT)
+        return self.json_response(data, headers=headers)
+
+    def json_response(self, data, **kwargs):
+        """Encoded like the viewset's default renderer."""
+        return HttpResponse(
+            FastJSONRenderer().render(data),
+            content_type="application/json",
+            **kwargs,
+        )
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.GET["page_size"])
+        except (KeyError, ValueError):
+            return self.pagination.page_size
+        if page_size <= 0:
+            return self.pagination.page_size
+        return min(page_size, self.pagination.max_page_size)
+
+    async def list(self, request):
+        queryset = self.viewset.queryset.all()
+        for backend in self.viewset.filter_backends:
+            queryset = backend().filter_queryset(
+                self.viewset.request, queryset, self.viewset
+            )
+
+        page_size = self.get_page_size(request)
+        count = await queryset.acount()
+        total_pages = max(1, math.ceil(count / page_size))
+        page = request.GET.get("page", "1")
+        if page in self.pagination.last_page_strings:
+            page = total_pages
+        try:
+            page = int(page)
+        except ValueError:
+            raise NotFound(self.pagination.invalid_page_message)
+        if not 1 <= page <= total_pages:
+            raise NotFound(self.pagination.invalid_page_message)
+
+        offset = (page - 1) * page_size
+        objects = [obj async for obj in queryset[offset : offset + page_size]]
+        serializer = self.viewset.get_serializer_class()(objects, many=True)
+
+        url = request.build_absolute_uri()
+        previous = None
+        if page == 2:
+            previous = remove_query_param(url, self.pagination.page_query_param)
+        elif page > 2:
+            previous = replace_query_param(
+                url, self.pagination.page_query_param, page - 1
+            )
+        return {
+            "count": count,
+            "next": (
+                replace_query_param(url, self.pagination.page_query_param, page + 1)
+                if page < total_pages
+                else None
+            ),
+            "previous": previous,
+            "page_size": self.pagination.page_size,
+            "total_pages": total_pages,
+            "current_page": page,
+            "results": serializer.data,
+        }
+
+    async def retrieve(self, pk):
+        queryset = self.viewset.queryset
+        try:
+            instance = await queryset.aget(pk=pk)
+        except (queryset.model.DoesNotExist, ValueError, TypeError, ValidationError):
+            raise NotFound(
+                f"No {queryset.model._meta.object_name} matches the given query."
+            )
+        return self.viewset.get_serializer_class()(instance).data
+
+
+def async_read_urls(router):
+    """
+    URL patterns serving the list and detail routes of ``router`` with
+    :class:`AsyncReadView`. They must be placed before ``router.urls``.
+    """
+    urlpatterns = []
+    for prefix, viewset, basename in router.registry:
+        # List-level extra actions (``planets/stats/``...) are not detail ids.
+        actions = "|".join(
+            action.url_path
+            for action in viewset.get_extra_actions()
+            if not action.detail and "/" not in action.url_path
+        )
+        lookup = rf"(?!(?:{actions})/$)" if actions else ""
+        urlpatterns += [
+            path(
+                f"{prefix}/",
+                AsyncReadView.as_view(
+                    viewset, LIST_ACTIONS, basename=basename, detail=False
+                ),
+                name=f"{basename}-list",
+            ),
+            re_path(
+                rf"^{prefix}/{lookup}(?P<pk>[^/.]+)/$",
+                AsyncReadView.as_view(
+                    viewset, DETAIL_ACTIONS, basename=basename, detail=True
+                ),
+                name=f"{basename}-detail",
+            ),
+        ]
+    return urlpatterns
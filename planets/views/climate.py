@@ -1,14 +1,15 @@
 from django.db import transaction
 from rest_framework import viewsets
-from rest_framework.filters import SearchFilter
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 
+from core.utils.caching import CachedResponseMixin
 from core.utils.pagination import PlanetPagination
-from planets.models import Climate
+from planets.filters import IndexedSearchFilter
+from planets.models import Climate, Planet
 from planets.serializers import ClimateSerializer
 
 
-class ClimateViewSet(viewsets.ModelViewSet):
+class ClimateViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing climates.
 
@@ -19,15 +20,19 @@ class ClimateViewSet(viewsets.ModelViewSet):
     - Update existing climates
     - Delete climates
 
-    Search functionality allows filtering by climate name.
+    Search functionality allows filtering by climate name. Lists use page-number
+    pagination by default; ``?pagination=cursor`` switches to keyset pagination
+    on ``(name, id)`` without the ``count``/``total_pages`` metadata. List and
+    detail responses are cached per data version and served with ETags.
     """
 
     queryset = Climate.objects.all().order_by("name")
     serializer_class = ClimateSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
     pagination_class = PlanetPagination
-    filter_backends = [SearchFilter]
+    filter_backends = [IndexedSearchFilter]
     search_fields = ["name"]
+    cache_models = [Climate]
 
     @transaction.atomic
     def perform_create(self, serializer):
@@ -41,6 +46,7 @@ class ClimateViewSet(viewsets.ModelViewSet):
     def perform_update(self, serializer):
         """Update an existing climate with atomic transaction."""
         try:
+            self.reset_planet_fingerprints(serializer.instance)
             serializer.save()
         except Exception as e:
             raise Exception(f"Error updating climate: {str(e)}")
@@ -49,6 +55,11 @@ class ClimateViewSet(viewsets.ModelViewSet):
     def perform_destroy(self, instance):
         """Delete a climate with atomic transaction."""
         try:
+            self.reset_planet_fingerprints(instance)
             instance.delete()
         except Exception as e:
             raise Exception(f"Error deleting climate: {str(e)}")
+
+    def reset_planet_fingerprints(self, instance):
+        """Force the next SWAPI sync to rewrite planets using this climate."""
+        Planet.objects.filter(climates=instance).update(fingerprint="")
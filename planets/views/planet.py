@@ -1,19 +1,41 @@
 import os
 
-import requests
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
 from django.db import transaction
-from rest_framework import viewsets
+from django.http import StreamingHttpResponse
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import status, viewsets
 from rest_framework.decorators import action
-from rest_framework.filters import SearchFilter
+from rest_framework.exceptions import APIException
+from rest_framework.parsers import JSONParser
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
 
+from core.utils.caching import CachedResponseMixin
+from core.utils.iterables import aiter_sync
 from core.utils.pagination import PlanetPagination
 from planets.decorators import api_response_handler
-from planets.models import Planet
-from planets.serializers import PlanetSerializer
+from planets.filters import IndexedSearchFilter, PlanetFilter
+from planets.models import Planet, SyncJob
+from planets.parsers import NDJSONParser
+from planets.serializers import (
+    PlanetBulkItemSerializer,
+    PlanetSerializer,
+    SyncJobSerializer,
+)
+from planets.services import (
+    EXPORT_FORMATS,
+    enqueue_sync_job,
+    export_planets,
+    fail_stale_jobs,
+    upsert_planets,
+)
+from planets.services.stats import compute_planet_stats, get_planet_stats
 
 
-class PlanetViewSet(viewsets.ModelViewSet):
+class PlanetViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing planets.
 
@@ -23,17 +45,27 @@ class PlanetViewSet(viewsets.ModelViewSet):
     - Create new planets with climate and terrain associations
     - Update existing planets
     - Delete planets
-    - Sync planets from external SWAPI API
+    - Sync planets from external SWAPI API as a background job
+    - Create or update many planets in one request
+    - Stream the whole catalogue as NDJSON or CSV
+    - Facet counts and population statistics per climate and terrain
 
-    Search functionality allows filtering by planet name.
+    Search functionality allows filtering by planet name; ``climate``,
+    ``terrain`` (any/all) and ``population_min``/``population_max`` filter
+    the list through indexed lookups. Lists use page-number
+    pagination by default; ``?pagination=cursor`` switches to keyset pagination
+    on ``(name, id)`` without the ``count``/``total_pages`` metadata. List and
+    detail responses are cached per data version and served with ETags.
     """
 
-    queryset = Planet.objects.all().order_by("name")
+    queryset = Planet.objects.order_by("name")
     serializer_class = PlanetSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
     pagination_class = PlanetPagination
-    filter_backends = [SearchFilter]
+    filter_backends = [DjangoFilterBackend, IndexedSearchFilter]
+    filterset_class = PlanetFilter
     search_fields = ["name"]
+    cache_models = [Planet]
 
     @transaction.atomic
     def perform_create(self, serializer):
@@ -51,49 +83,208 @@ class PlanetViewSet(viewsets.ModelViewSet):
         except Exception as e:
             raise Exception(f"Error updating planet: {str(e)}")
 
-    @action(detail=False, methods=["GET"], url_path="sync")
+    @action(
+        detail=False,
+        methods=["POST"],
+        url_path="bulk",
+        parser_classes=[JSONParser, NDJSONParser],
+    )
+    @api_response_handler
+    def bulk_upsert(self, request):
+        """
+        Create or update many planets by name in a single transaction.
+
+        Accepts a JSON array or NDJSON (``application/x-ndjson``) of planets
+        with ``name``, ``population``, ``climates`` and ``terrains``. Items are
+        validated independently; valid ones are upserted in bulk with a fixed
+        number of queries per batch and invalid ones are reported back. When a
+        name appears more than once the last item wins and the earlier ones
+        are reported as ``superseded``.
+
+        Returns:
+            dict: Totals per status and one result per item, in input order
+        """
+        try:
+            items = request.data
+        except APIException as e:
+            # Malformed bodies (400) and unsupported content types (415).
+            return Response(
+                {"error": True, "data": str(e.detail)}, status=e.status_code
+            )
+        if not isinstance(items, list):
+            return Response(
+                {"error": True, "data": "Expected a JSON array or NDJSON body"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(items) > settings.PLANET_BULK_MAX_ITEMS:
+            return Response(
+                {
+                    "error": True,
+                    "data": (
+                        f"At most {settings.PLANET_BULK_MAX_ITEMS} items per request"
+                    ),
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        records = {}
+        errors = {}
+        for index, item in enumerate(items):
+            serializer = PlanetBulkItemSerializer(data=item)
+            if serializer.is_valid():
+                records[index] = serializer.validated_data
+            else:
+                errors[index] = serializer.errors
+
+        try:
+            statuses = upsert_planets(records.values())
+        except Exception as e:
+            raise Exception(f"Error bulk upserting planets: {str(e)}")
+
+        last_index = {record["name"]: index for index, record in records.items()}
+        results = []
+        totals = {
+            "created": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "superseded": 0,
+            "invalid": len(errors),
+        }
+        for index in range(len(items)):
+            if index in errors:
+                results.append(
+                    {"index": index, "status": "invalid", "errors": errors[index]}
+                )
+                continue
+            name = records[index]["name"]
+            if last_index[name] != index:
+                totals["superseded"] += 1
+                results.append(
+                    {
+                        "index": index,
+                        "name": name,
+                        "status": "superseded",
+                        "superseded_by": last_index[name],
+                    }
+                )
+                continue
+            totals[statuses[name]] += 1
+            results.append({"index": index, "name": name, "status": statuses[name]})
+        return {**totals, "results": results}
+
+    @action(detail=False, methods=["GET"], url_path="stats")
+    def stats(self, request):
+        """
+        Planet counts and population aggregates per climate and terrain.
+
+        Computed with grouped SQL over the M2M tables (medians with window
+        functions). The list filters and ``search`` narrow the planets;
+        responses are cached per data version and served with ETags.
+        """
+        filter_params = set(PlanetFilter.base_filters) | {
+            IndexedSearchFilter.search_param
+        }
+        planets = None
+        if filter_params & set(request.query_params):
+            planets = self.filter_queryset(Planet.objects.all())
+        return self.cached_response(request, self.planet_stats, planets)
+
+    @api_response_handler
+    def planet_stats(self, request, planets):
+        if planets is None:
+            return get_planet_stats()
+        return compute_planet_stats(planets)
+
+    @action(detail=False, methods=["GET"], url_path="export")
+    def export(self, request):
+        """
+        Stream every planet as NDJSON (default) or CSV.
+
+        The format is chosen with ``?output=ndjson|csv`` (``format`` is
+        reserved for content negotiation) and ``search`` is honoured. Rows
+        are read from the database in chunks and written as they are
+        encoded, so memory use does not grow with the size of the catalogue.
+        Under ASGI the chunks are pulled one at a time in a thread, as the
+        handler would otherwise read a synchronous iterator in full first.
+
+        Returns:
+            StreamingHttpResponse: The export, as an attachment
+        """
+        output = request.query_params.get("output", "ndjson")
+        if output not in EXPORT_FORMATS:
+            return Response(
+                {
+                    "error": True,
+                    "data": f"Unsupported output {output!r}, use ndjson or csv",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        queryset = self.filter_queryset(Planet.objects.all()).order_by("name")
+        content = export_planets(output, queryset)
+        if isinstance(request._request, ASGIRequest):
+            content = aiter_sync(content)
+        response = StreamingHttpResponse(
+            content,
+            content_type=f"{EXPORT_FORMATS[output]}; charset=utf-8",
+        )
+        response["Content-Disposition"] = f'attachment; filename="planets.{output}"'
+        return response
+
+    @action(detail=False, methods=["POST"], url_path="sync")
     @api_response_handler
     def sync_from_swapi(self, request):
         """
-        Sync planets from external SWAPI API.
+        Queue a background sync of planets from external SWAPI API.
 
-        Fetches planet data from SWAPI and creates/updates local planet records.
-        Requires SWAPI_PLANETS_URL environment variable to be set.
+        The import runs on a local worker that streams the SWAPI payload and
+        commits it in batches, so the request returns immediately with the id
+        of the queued job. Requires SWAPI_PLANETS_URL environment variable to
+        be set.
 
         Returns:
-            dict: Response with number of planets imported or updated
+            Response: 202 with the job id and its status URL
         """
         url = os.getenv("SWAPI_PLANETS_URL")
         if not url:
             raise Exception("SWAPI_PLANETS_URL not set in .env")
 
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            raise Exception(f"Request to SWAPI failed: {str(e)}")
-
-        data = response.json().get("data", {}).get("allPlanets", {}).get("planets", [])
-
-        with transaction.atomic():
-            created = 0
-            for item in data:
-                planet_data = {
-                    "name": item["name"],
-                    "population": (
-                        item["population"]
-                        if item["population"] not in [None, "unknown"]
-                        else None
+        job = enqueue_sync_job(url)
+        return Response(
+            {
+                "error": False,
+                "data": {
+                    "job_id": job.pk,
+                    "status": job.status,
+                    "status_url": reverse(
+                        "planet-sync-status", kwargs={"job_id": job.pk}, request=request
                     ),
-                    "climates": item.get("climates") or [],
-                    "terrains": item.get("terrains") or [],
-                }
-
-                serializer = PlanetSerializer(data=planet_data)
-                if serializer.is_valid():
-                    serializer.save()
-                    created += 1
-                else:
-                    print(f"Validation errors for {item['name']}: {serializer.errors}")
-
-            return {"message": f"{created} planets imported or updated."}
+                },
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    @action(
+        detail=False,
+        methods=["GET"],
+        url_path=r"sync/(?P<job_id>[0-9]+)",
+        url_name="sync-status",
+    )
+    @api_response_handler
+    def sync_status(self, request, job_id=None):
+        """
+        Report the progress of a SWAPI sync job. A running job whose worker
+        stopped reporting progress is marked failed first.
+
+        Returns:
+            dict: Job status, rows processed, throughput (rows/s) and errors
+        """
+        job = SyncJob.objects.filter(pk=job_id).first()
+        if job is None:
+            return Response(
+                {"error": True, "data": f"Sync job {job_id} not found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        if job.status == SyncJob.RUNNING and fail_stale_jobs(job_ids=[job.pk]):
+            job.refresh_from_db()
+        return dict(SyncJobSerializer(job).data)
@@ -1,14 +1,15 @@
 from django.db import transaction
 from rest_framework import viewsets
-from rest_framework.filters import SearchFilter
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 
+from core.utils.caching import CachedResponseMixin
 from core.utils.pagination import PlanetPagination
-from planets.models import Terrain
+from planets.filters import IndexedSearchFilter
+from planets.models import Planet, Terrain
 from planets.serializers import TerrainSerializer
 
 
-class TerrainViewSet(viewsets.ModelViewSet):
+class TerrainViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing terrains.
 
@@ -19,15 +20,19 @@ class TerrainViewSet(viewsets.ModelViewSet):
     - Update existing terrains
     - Delete terrains
 
-    Search functionality allows filtering by terrain name.
+    Search functionality allows filtering by terrain name. Lists use page-number
+    pagination by default; ``?pagination=cursor`` switches to keyset pagination
+    on ``(name, id)`` without the ``count``/``total_pages`` metadata. List and
+    detail responses are cached per data version and served with ETags.
     """
 
     queryset = Terrain.objects.all().order_by("name")
     serializer_class = TerrainSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
     pagination_class = PlanetPagination
-    filter_backends = [SearchFilter]
+    filter_backends = [IndexedSearchFilter]
     search_fields = ["name"]
+    cache_models = [Terrain]
 
     @transaction.atomic
     def perform_create(self, serializer):
@@ -41,6 +46,7 @@ class TerrainViewSet(viewsets.ModelViewSet):
     def perform_update(self, serializer):
         """Update an existing terrain with atomic transaction."""
         try:
+            self.reset_planet_fingerprints(serializer.instance)
             serializer.save()
         except Exception as e:
             raise Exception(f"Error updating terrain: {str(e)}")
@@ -49,6 +55,11 @@ class TerrainViewSet(viewsets.ModelViewSet):
     def perform_destroy(self, instance):
         """Delete a terrain with atomic transaction."""
         try:
+            self.reset_planet_fingerprints(instance)
             instance.delete()
         except Exception as e:
             raise Exception(f"Error deleting terrain: {str(e)}")
+
+    def reset_planet_fingerprints(self, instance):
+        """Force the next SWAPI sync to rewrite planets using this terrain."""
+        Planet.objects.filter(terrains=instance).update(fingerprint="")